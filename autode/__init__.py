@@ -4,6 +4,7 @@ from autode.wrappers.keywords import HessianKeywords
 from autode.wrappers.keywords import SinglePointKeywords
 from autode.reactions.reaction import Reaction
 from autode.reactions.multistep import MultiStepReaction
+from autode.reactions.batch import ReactionBatch
 from autode.species.molecule import Reactant
 from autode.species.molecule import Product
 from autode.species.molecule import Molecule
@@ -21,6 +22,7 @@ __all__ = [
     'SinglePointKeywords',
     'Reaction',
     'MultiStepReaction',
+    'ReactionBatch',
     'Reactant',
     'Product',
     'Molecule',
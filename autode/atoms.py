@@ -1,4 +1,7 @@
+from copy import deepcopy
+from functools import wraps
 import numpy as np
+from autode.geom import get_rot_mat_euler
 from autode.log import logger
 
 
@@ -8,6 +11,56 @@ class Atom:
         x, y, z = self.coord
         return f'[{self.label}, {x:.4f}, {y:.4f}, {z:.4f}]'
 
+    def __getstate__(self):
+        """Atoms are copied and pickled without the list they belong to"""
+        state = self.__dict__.copy()
+        state.update(_coord=np.array(self.coord, copy=True),
+                     _atoms=None, _index=None)
+        return state
+
+    def __deepcopy__(self, memo):
+        """Copy of this atom, which doesn't belong to any list"""
+        atom = self._copy_without_coord(memo)
+        atom._coord = np.array(self.coord, copy=True)
+        return atom
+
+    def _copy_without_coord(self, memo):
+        """Copy of this atom with no coordinate, which must then be set"""
+        atom = self.__class__.__new__(self.__class__)
+        memo[id(self)] = atom
+
+        for name, value in self.__dict__.items():
+            if isinstance(value, str):
+                atom.__dict__[name] = value
+
+            elif name not in ('_atoms', '_index', '_coord'):
+                atom.__dict__[name] = deepcopy(value, memo)
+
+        atom._atoms, atom._index, atom._coord = None, None, None
+        return atom
+
+    @property
+    def coord(self):
+        """
+        Coordinate of this atom (Å). If the atom belongs to an Atoms list
+        this is a view into the coordinate array of the list
+
+        Returns:
+            (np.ndarray): shape = (3,)
+        """
+        if self._atoms is None:
+            return self._coord
+
+        return self._atoms._coords[self._index]
+
+    @coord.setter
+    def coord(self, value):
+        if self._atoms is None:
+            self._coord = np.array(value, dtype=float)
+
+        else:
+            self._atoms._coords[self._index] = value
+
     def translate(self, vec):
         """
         Translate this atom by a vector
@@ -30,31 +83,33 @@ class Atom:
                                  if no origin is specified then the atom
                                  is rotated without translation.
         """
+        rot_matrix = get_rot_mat_euler(axis=axis, theta=theta)
+
         # If specified shift so that the origin is at (0, 0, 0), apply the
         # rotation, and shift back
-        if origin is not None:
-            self.translate(vec=-origin)
+        if origin is None:
+            self.coord = np.matmul(rot_matrix, self.coord)
 
-        # Normalise the axis
-        axis = np.asarray(axis)
-        axis = axis / np.linalg.norm(axis)
+        else:
+            origin = np.array(origin, copy=True)
+            self.coord = np.matmul(rot_matrix, self.coord - origin) + origin
 
-        # Compute the 3D rotation matrix using
-        # https://en.wikipedia.org/wiki/Euler–Rodrigues_formula
-        a = np.cos(theta / 2.0)
-        b, c, d = -axis * np.sin(theta / 2.0)
-        aa, bb, cc, dd = a * a, b * b, c * c, d * d
-        bc, ad, ac, ab, bd, cd = b * c, a * d, a * c, a * b, b * d, c * d
-        rot_matrix = np.array([[aa + bb - cc - dd, 2 * (bc + ad), 2 * (bd - ac)],
-                               [2 * (bc - ad), aa + cc - bb - dd, 2 * (cd + ab)],
-                               [2 * (bd + ac), 2 * (cd - ab), aa + dd - bb - cc]])
+        return None
 
-        # Apply the rotation
-        self.coord = np.matmul(rot_matrix, self.coord)
+    def _set_owner(self, atoms, index):
+        """Store the coordinate of this atom in a row of the coordinate array
+        of an Atoms list, which must already contain the coordinate, and
+        invalidate the array of the list it previously belonged to"""
+        if self._atoms is not None and self._atoms is not atoms:
+            self._atoms._is_stale = True
 
-        if origin is not None:
-            self.translate(vec=origin)
+        self._atoms, self._index, self._coord = atoms, index, None
+        return None
 
+    def _remove_owner(self):
+        """Store the coordinate of this atom in its own array"""
+        self._coord = np.array(self.coord, copy=True)
+        self._atoms, self._index = None, None
         return None
 
     def __init__(self, atomic_symbol, x=0.0, y=0.0, z=0.0):
@@ -72,7 +127,198 @@ class Atom:
         assert atomic_symbol in elements
 
         self.label = atomic_symbol
-        self.coord = np.array([float(x), float(y), float(z)])
+
+        # Atoms list this atom belongs to and its index in it, if any
+        self._atoms = None
+        self._index = None
+        self._coord = np.array([float(x), float(y), float(z)])
+
+
+def _changes_atoms(method):
+    """Decorator for a method of Atoms that changes which atoms it contains,
+    so the coordinate array needs to be rebuilt"""
+
+    @wraps(method)
+    def wrapped_method(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._is_stale = True
+        return result
+
+    return wrapped_method
+
+
+class Atoms(list):
+
+    append = _changes_atoms(list.append)
+    extend = _changes_atoms(list.extend)
+    insert = _changes_atoms(list.insert)
+    pop = _changes_atoms(list.pop)
+    remove = _changes_atoms(list.remove)
+    clear = _changes_atoms(list.clear)
+    sort = _changes_atoms(list.sort)
+    reverse = _changes_atoms(list.reverse)
+    __setitem__ = _changes_atoms(list.__setitem__)
+    __delitem__ = _changes_atoms(list.__delitem__)
+    __iadd__ = _changes_atoms(list.__iadd__)
+    __imul__ = _changes_atoms(list.__imul__)
+
+    def __reduce__(self):
+        """Pickle as a new list of the atoms"""
+        return self.__class__, (list(self),)
+
+    def __deepcopy__(self, memo):
+        """Copy of the atoms with their own coordinate array. Atoms that
+        have already been copied e.g. are also in another list are reused"""
+        atoms = self.__class__.__new__(self.__class__)
+        memo[id(self)] = atoms
+
+        copied_atoms = []
+        for atom in self:
+            copied_atom = memo.get(id(atom), None)
+
+            if copied_atom is None:
+                copied_atom = atom._copy_without_coord(memo)
+                copied_atom._coord = atom.coord
+
+            copied_atoms.append(copied_atom)
+
+        Atoms.__init__(atoms, copied_atoms)
+        return atoms
+
+    @property
+    def coordinates(self):
+        """
+        Coordinates of all the atoms, with each atom's coordinate a view
+        into a row of this array
+
+        Returns:
+            (np.ndarray): shape = (n_atoms, 3)
+        """
+        if self._is_stale:
+            self._build()
+
+        return self._coords
+
+    @coordinates.setter
+    def coordinates(self, value):
+        if self._is_stale:
+            self._build()
+
+        self._coords[:] = value
+
+    def translate(self, vec):
+        """
+        Translate all the atoms by a vector
+
+        Arguments:
+            vec (np.ndarray): shape = (3,)
+        """
+        coords = self.coordinates
+        coords += np.asarray(vec)
+        return None
+
+    def rotate(self, axis, theta, origin=None):
+        """
+        Rotate all the atoms theta radians around an axis given an origin
+
+        Arguments:
+            axis (np.ndarray): Axis to rotate in. shape = (3,)
+            theta (float): Angle in radians (float)
+
+        Keyword Arguments:
+            origin (np.ndarray): Rotate about this origin. shape = (3,)
+                                 if no origin is specified then the atoms
+                                 are rotated without translation.
+        """
+        rot_matrix = get_rot_mat_euler(axis=axis, theta=theta)
+        coords = self.coordinates
+
+        if origin is None:
+            coords[:] = np.matmul(coords, rot_matrix.T)
+
+        else:
+            origin = np.array(origin, copy=True)
+            coords[:] = np.matmul(coords - origin, rot_matrix.T) + origin
+
+        return None
+
+    @classmethod
+    def from_array(cls, symbols, coordinates):
+        """
+        Atoms from their symbols and a coordinate array, which is used as the
+        coordinate array of the atoms rather than copied
+
+        Arguments:
+            symbols (list(str)):
+            coordinates (np.ndarray): shape = (n_atoms, 3)
+
+        Returns:
+            (autode.atoms.Atoms):
+        """
+        atoms = cls([Atom(symbol) for symbol in symbols])
+
+        if coordinates.shape != (len(atoms), 3):
+            raise ValueError(f'Cannot set the coordinates of {len(atoms)} '
+                             f'atoms with an array of shape '
+                             f'{coordinates.shape}')
+
+        atoms._coords = coordinates
+        return atoms
+
+    def use_array(self, coordinates):
+        """
+        Store the coordinates of the atoms in an existing array e.g. a row of
+        a larger array, which is then used as the coordinate array of the
+        atoms
+
+        Arguments:
+            coordinates (np.ndarray): shape = (n_atoms, 3)
+        """
+        if coordinates.shape != (len(self), 3):
+            raise ValueError(f'Cannot set the coordinates of {len(self)} '
+                             f'atoms with an array of shape '
+                             f'{coordinates.shape}')
+
+        coordinates[:] = self.coordinates
+        self._coords = coordinates
+        return None
+
+    def _build(self):
+        """
+        Build the coordinate array from the current coordinates of the atoms,
+        which then belong to this list. Atoms removed from the list keep
+        their coordinate
+        """
+        coords = np.array([atom.coord for atom in self], dtype=float)
+        coords = coords.reshape(len(self), 3)
+
+        atom_ids = set(id(atom) for atom in self)
+        for atom in self._built_atoms:
+            if atom._atoms is self and id(atom) not in atom_ids:
+                atom._remove_owner()
+
+        self._coords = coords
+        for i, atom in enumerate(self):
+            atom._set_owner(self, i)
+
+        self._built_atoms = list(self)
+        self._is_stale = False
+        return None
+
+    def __init__(self, atoms=()):
+        """
+        List of atoms with all the coordinates stored in a single array, so
+        operations on all the coordinates don't have to loop over the atoms
+
+        Keyword Arguments:
+            atoms (list(autode.atoms.Atom)):
+        """
+        super().__init__(atoms)
+
+        self._coords = np.zeros((0, 3))
+        self._built_atoms = []
+        self._is_stale = True
+        self._build()
 
 
 class DummyAtom(Atom):
@@ -1,14 +1,19 @@
 import itertools
 import os
+from collections import Counter
 from autode.atoms import get_maximal_valance
 from autode.geom import get_neighbour_list
 from autode.geom import get_points_on_sphere
+from autode.config import Config
 from autode.log import logger
 from autode.mol_graphs import get_bond_type_list
 from autode.mol_graphs import get_fbonds
 from autode.mol_graphs import is_isomorphic
 from autode.mol_graphs import connected_components
 
+# Minimum number of possible bond rearrangements checked in each process
+_min_batch_size = 100
+
 
 def get_bond_rearrangs(reactant, product, name):
     """For a reactant and product (complex) find the set of breaking and
@@ -222,23 +227,229 @@ def add_bond_rearrangment(bond_rearrangs, reactant, product, fbonds, bbonds):
                                                  fbonds=fbonds, bbonds=bbonds)
 
     if is_isomorphic(rearranged_graph, product.graph):
-        ordered_fbonds = []
-        ordered_bbonds = []
-        for fbond in fbonds:
-            if fbond[0] < fbond[1]:
-                ordered_fbonds.append((fbond[0], fbond[1]))
-            else:
-                ordered_fbonds.append((fbond[1], fbond[0]))
-        for bbond in bbonds:
-            if bbond[0] < bbond[1]:
-                ordered_bbonds.append((bbond[0], bbond[1]))
-            else:
-                ordered_bbonds.append((bbond[1], bbond[0]))
-
-        ordered_fbonds.sort()
-        ordered_bbonds.sort()
-        bond_rearrangs.append(BondRearrangement(forming_bonds=ordered_fbonds,
-                                                breaking_bonds=ordered_bbonds))
+        bond_rearrangs.append(ordered_bond_rearrangement(fbonds, bbonds))
+
+    return bond_rearrangs
+
+
+def ordered_bond_rearrangement(fbonds, bbonds):
+    """
+    Bond rearrangement with each bond as (i, j) with i < j, and the bonds
+    sorted
+
+    Arguments:
+        fbonds (list(tuple)): list of bonds to be made
+        bbonds (list(tuple)): list of bonds to be broken
+
+    Returns:
+        (autode.bond_rearrangements.BondRearrangement):
+    """
+    ordered_fbonds = sorted(tuple(sorted(fbond)) for fbond in fbonds)
+    ordered_bbonds = sorted(tuple(sorted(bbond)) for bbond in bbonds)
+
+    return BondRearrangement(forming_bonds=ordered_fbonds,
+                             breaking_bonds=ordered_bbonds)
+
+
+class RearrangementFilter:
+    """
+    Cheap checks of whether a bond rearrangement could transform the reactant
+    into the product, which rule out most of the possible rearrangements
+    without generating a graph or running an isomorphism. All the checks are
+    on invariants of the graph so never reject a rearrangement that forms
+    the product
+    """
+
+    def _exceeds_valance(self, fbonds, bbonds):
+        """Does forming a bond exceed the maximal valance of an atom that
+        does not also have a bond breaking?"""
+        saturated = [atom for fbond in fbonds for atom in fbond
+                     if atom in self.saturated_atoms]
+
+        if len(saturated) == 0:
+            return False
+
+        bbond_atoms = [atom for bbond in bbonds for atom in bbond]
+        return any(atom not in bbond_atoms for atom in saturated)
+
+    def _degree_delta(self, fbonds, bbonds):
+        """Change in the number of atoms with each (label, degree)"""
+        changes = Counter()
+        for bond in fbonds:
+            changes.update(bond)
+
+        for bond in bbonds:
+            changes.subtract(bond)
+
+        delta = Counter()
+        for atom, change in changes.items():
+            if change != 0:
+                delta[(self.labels[atom], self.degrees[atom])] -= 1
+                delta[(self.labels[atom], self.degrees[atom] + change)] += 1
+
+        return {key: value for key, value in delta.items() if value != 0}
+
+    def _bond_type_delta(self, fbonds, bbonds):
+        """Change in the number of bonds of each type e.g. C-H"""
+        delta = Counter(self._bond_type(bond) for bond in fbonds)
+        delta.subtract(self._bond_type(bond) for bond in bbonds)
+
+        return {key: value for key, value in delta.items() if value != 0}
+
+    def _bond_type(self, bond):
+        return tuple(sorted(self.labels[atom] for atom in bond))
+
+    def could_form_product(self, fbonds, bbonds):
+        """
+        Could a bond rearrangement form the product?
+
+        Arguments:
+            fbonds (list(tuple)): list of bonds to be made
+            bbonds (list(tuple)): list of bonds to be broken
+
+        Returns:
+            (bool):
+        """
+        if self._exceeds_valance(fbonds, bbonds):
+            return False
+
+        if self._degree_delta(fbonds, bbonds) != self.required_degree_delta:
+            return False
+
+        return (self._bond_type_delta(fbonds, bbonds)
+                == self.required_bond_type_delta)
+
+    def __init__(self, reactant, product):
+        """
+        Arguments:
+            reactant (autode.species.Species):
+            product (autode.species.Species):
+        """
+        graph = reactant.graph
+
+        self.labels = dict(graph.nodes(data='atom_label', default='C'))
+        self.degrees = dict(graph.degree)
+
+        # Atoms that already have their maximal valance
+        self.saturated_atoms = set(i for i, atom in enumerate(reactant.atoms)
+                                   if (self.degrees[i]
+                                       == get_maximal_valance(atom.label)))
+
+        def degree_counts(mol_graph):
+            return Counter((label, mol_graph.degree[node]) for node, label
+                           in mol_graph.nodes(data='atom_label', default='C'))
+
+        def bond_type_counts(mol_graph):
+            labels = dict(mol_graph.nodes(data='atom_label', default='C'))
+            return Counter(tuple(sorted((labels[i], labels[j])))
+                           for (i, j) in mol_graph.edges)
+
+        delta = degree_counts(product.graph)
+        delta.subtract(degree_counts(graph))
+        self.required_degree_delta = {k: v for k, v in delta.items() if v != 0}
+
+        delta = bond_type_counts(product.graph)
+        delta.subtract(bond_type_counts(graph))
+        self.required_bond_type_delta = {k: v for k, v in delta.items()
+                                         if v != 0}
+
+
+def _component_sizes(graph):
+    return sorted(len(nodes) for nodes in connected_components(graph))
+
+
+def get_rearrangements_forming_product(reac_graph, prod_graph, candidates):
+    """
+    Get the bond rearrangements that transform the reactant graph into one
+    isomorphic to the product graph
+
+    Arguments:
+        reac_graph (nx.Graph):
+        prod_graph (nx.Graph):
+        candidates (list(tuple(list(tuple)))): Forming and breaking bonds of
+                                               each possible rearrangement
+
+    Returns:
+        (list(tuple(list(tuple)))): Forming and breaking bonds
+    """
+    prod_component_sizes = _component_sizes(prod_graph)
+    rearrangements = []
+
+    for fbonds, bbonds in candidates:
+        rearranged_graph = generate_rearranged_graph(reac_graph,
+                                                     fbonds=fbonds,
+                                                     bbonds=bbonds)
+
+        if _component_sizes(rearranged_graph) != prod_component_sizes:
+            continue
+
+        if is_isomorphic(rearranged_graph, prod_graph):
+            rearrangements.append((fbonds, bbonds))
+
+    return rearrangements
+
+
+def add_bond_rearrangments(bond_rearrangs, reactant, product, candidates):
+    """
+    For a set of possible bond rearrangements add those that form the product
+    to the bond rearrangement list. Duplicates and rearrangements that fail
+    cheap checks are discarded, and the remaining ones checked for forming
+    the product in parallel if there are many
+
+    Arguments:
+        bond_rearrangs (list(autode.bond_rearrangements.BondRearrangement)):
+                        list of working bond rearrangments
+        reactant (molecule object): reactant complex
+        product (molecule object): product complex
+        candidates (iterable(tuple(list(tuple)))): Forming and breaking bonds
+                                                   of each rearrangement
+
+    Returns:
+        (list(autode.bond_rearrangements.BondRearrangement)):
+    """
+    rearrangement_filter = RearrangementFilter(reactant, product)
+    possibles, keys, n_candidates = [], set(), 0
+
+    for fbonds, bbonds in candidates:
+        n_candidates += 1
+
+        if not rearrangement_filter.could_form_product(fbonds, bbonds):
+            continue
+
+        key = ordered_bond_rearrangement(fbonds, bbonds).all
+        if tuple(key) not in keys:
+            keys.add(tuple(key))
+            possibles.append((fbonds, bbonds))
+
+    logger.info(f'{len(possibles)} of {n_candidates} possible bond '
+                f'rearrangements pass the initial checks')
+
+    n_batches = min(Config.n_cores, len(possibles) // _min_batch_size)
+
+    if n_batches > 1:
+        from autode.scheduler import get_scheduler
+        scheduler = get_scheduler()
+        futures = [scheduler.submit(get_rearrangements_forming_product,
+                                    reactant.graph, product.graph,
+                                    possibles[i::n_batches])
+                   for i in range(n_batches)]
+
+        # Rearrangements in the order they were generated
+        found = set()
+        for future in futures:
+            found.update((tuple(fbonds), tuple(bbonds))
+                         for fbonds, bbonds in future.result())
+
+        rearrangements = [(fbonds, bbonds) for fbonds, bbonds in possibles
+                          if (tuple(fbonds), tuple(bbonds)) in found]
+
+    else:
+        rearrangements = get_rearrangements_forming_product(reactant.graph,
+                                                            product.graph,
+                                                            possibles)
+
+    for fbonds, bbonds in rearrangements:
+        bond_rearrangs.append(ordered_bond_rearrangement(fbonds, bbonds))
 
     return bond_rearrangs
 
@@ -266,61 +477,71 @@ def generate_rearranged_graph(graph, fbonds, bbonds):
 
 
 def get_fbonds_bbonds_1b(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
+    candidates = _1b_candidates(all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds)
+    return add_bond_rearrangments(possible_brs, reac, prod, candidates)
+
+
+def get_fbonds_bbonds_2b(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
+    candidates = _2b_candidates(all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds)
+    return add_bond_rearrangments(possible_brs, reac, prod, candidates)
+
+
+def get_fbonds_bbonds_1b1f(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
+    candidates = _1b1f_candidates(all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds)
+    return add_bond_rearrangments(possible_brs, reac, prod, candidates)
+
+
+def get_fbonds_bbonds_2b1f(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
+    candidates = _2b1f_candidates(all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds)
+    return add_bond_rearrangments(possible_brs, reac, prod, candidates)
+
+
+def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
+    candidates = _2b2f_candidates(all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds)
+    return add_bond_rearrangments(possible_brs, reac, prod, candidates)
+
+
+def _1b_candidates(all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
     logger.info('Getting possible 1 breaking bond rearrangements')
 
     for bbond in all_possible_bbonds[0]:
         # Break one bond
-        possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                             fbonds=[], bbonds=[bbond])
+        yield [], [bbond]
 
-    return possible_brs
 
-
-def get_fbonds_bbonds_2b(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
+def _2b_candidates(all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
     logger.info('Getting possible 2 breaking bond rearrangements')
 
     if len(all_possible_bbonds) == 1:
         # Break two bonds of the same type
         for bbond1, bbond2 in itertools.combinations(all_possible_bbonds[0], 2):
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[],
-                                                 bbonds=[bbond1, bbond2])
+            yield [], [bbond1, bbond2]
 
     elif len(all_possible_bbonds) == 2:
         # Break two bonds of different types
         for bbond1, bbond2 in itertools.product(all_possible_bbonds[0],
                                                 all_possible_bbonds[1]):
 
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[],
-                                                 bbonds=[bbond1, bbond2])
-
-    return possible_brs
+            yield [], [bbond1, bbond2]
 
 
-def get_fbonds_bbonds_1b1f(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
+def _1b1f_candidates(all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
     logger.info('Getting possible 1 breaking and 1 forming bond '
                 'rearrangements')
 
     if len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 1:
         # Make and break a bond of different types
         for fbond, bbond in itertools.product(all_possible_fbonds[0], all_possible_bbonds[0]):
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond],
-                                                 bbonds=[bbond])
+            yield [fbond], [bbond]
 
     elif len(all_possible_bbonds) == 0 and len(all_possible_fbonds) == 0:
         # Make and break a bond of the same type
         for bbonds, fbonds in possible_bbond_and_fbonds:
             for bbond, fbond in itertools.product(bbonds, fbonds):
-                possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                     fbonds=[fbond],
-                                                     bbonds=[bbond])
-
-    return possible_brs
+                yield [fbond], [bbond]
 
 
-def get_fbonds_bbonds_2b1f(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
+def _2b1f_candidates(all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
     logger.info('Getting possible 2 breaking and 1 forming bond rearrangements')
 
     if len(all_possible_bbonds) == 2 and len(all_possible_fbonds) == 1:
@@ -330,9 +551,7 @@ def get_fbonds_bbonds_2b1f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       all_possible_bbonds[1])
 
         for fbond, bbond1, bbond2 in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond],
-                                                 bbonds=[bbond1, bbond2])
+            yield [fbond], [bbond1, bbond2]
 
     elif len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 1:
         # Make a bond of one type, break two bonds of another type
@@ -341,9 +560,7 @@ def get_fbonds_bbonds_2b1f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       two_same_possibles)
 
         for fbond, (bbond1, bbond2) in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond],
-                                                 bbonds=[bbond1, bbond2])
+            yield [fbond], [bbond1, bbond2]
 
     elif len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 0:
         for bbonds, fbonds in possible_bbond_and_fbonds:
@@ -353,9 +570,7 @@ def get_fbonds_bbonds_2b1f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                           bbonds)
 
             for fbond, bbond1, bbond2 in possibles:
-                possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                     fbonds=[fbond],
-                                                     bbonds=[bbond1, bbond2])
+                yield [fbond], [bbond1, bbond2]
 
         # Make and break two bonds, all of the same type
         two_same_possibles = itertools.combinations(all_possible_bbonds[0], 2)
@@ -363,14 +578,10 @@ def get_fbonds_bbonds_2b1f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       two_same_possibles)
 
         for fbond, (bbond1, bbond2) in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond],
-                                                 bbonds=[bbond1, bbond2])
-
-    return possible_brs
+            yield [fbond], [bbond1, bbond2]
 
 
-def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
+def _2b2f_candidates(all_possible_bbonds, all_possible_fbonds, possible_bbond_and_fbonds, bbond_atom_type_fbonds, fbond_atom_type_bbonds):
     logger.info('Getting possible 2 breaking and 2 forming bond rearrangements')
 
     if len(all_possible_bbonds) == 2 and len(all_possible_fbonds) == 2:
@@ -381,9 +592,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       all_possible_bbonds[1])
 
         for fbond1, fbond2, bbond1, bbond2 in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond1, fbond2],
-                                                 bbonds=[bbond1, bbond2])
+            yield [fbond1, fbond2], [bbond1, bbond2]
 
     elif len(all_possible_bbonds) == 2 and len(all_possible_fbonds) == 1:
         # Make two bonds of the same type, break two bonds of different types
@@ -393,9 +602,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       two_same_possibles)
 
         for bbond1, bbond2, (fbond1, fbond2) in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond1, fbond2],
-                                                 bbonds=[bbond1, bbond2])
+            yield [fbond1, fbond2], [bbond1, bbond2]
 
     elif len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 2:
         # Make two bonds of different types, break two bonds of the same type
@@ -405,9 +612,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       two_same_possibles)
 
         for fbond1, fbond2, (bbond1, bbond2) in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond1, fbond2],
-                                                 bbonds=[bbond1, bbond2])
+            yield [fbond1, fbond2], [bbond1, bbond2]
 
     elif len(all_possible_bbonds) == 1 and len(all_possible_fbonds) == 1:
         two_f_possibles = itertools.combinations(all_possible_fbonds[0], 2)
@@ -416,9 +621,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
 
         for (fbond1, fbond2), (bbond1, bbond2) in possibles:
             # Make two bonds of the same type, break two bonds of another type
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond1, fbond2],
-                                                 bbonds=[bbond1, bbond2])
+            yield [fbond1, fbond2], [bbond1, bbond2]
 
         for bbonds, fbonds in possible_bbond_and_fbonds:
             # Make one bonds of one type, break one bond of another type, make
@@ -429,9 +632,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                           bbonds)
 
             for fbond1, fbond2, bbond1, bbond2 in possibles:
-                possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                     fbonds=[fbond1, fbond2],
-                                                     bbonds=[bbond1, bbond2])
+                yield [fbond1, fbond2], [bbond1, bbond2]
 
         # Make a bond of one type, make and break two bonds of another type
         two_b_possibles = itertools.combinations(all_possible_bbonds[0], 2)
@@ -440,9 +641,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                       two_b_possibles)
 
         for fbond1, fbond2, (bbond1, bbond2) in possibles:
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond1, fbond2],
-                                                 bbonds=[bbond1, bbond2])
+            yield [fbond1, fbond2], [bbond1, bbond2]
 
         two_f_possibles = itertools.combinations(all_possible_fbonds[0], 2)
         possibles = itertools.product(all_possible_bbonds[0],
@@ -452,9 +651,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
         for bbond1, bbond2, (fbond1, fbond2) in possibles:
             # Break a bond of one type, make two and break one bond of another
             #  type
-            possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                 fbonds=[fbond1, fbond2],
-                                                 bbonds=[bbond1, bbond2])
+            yield [fbond1, fbond2], [bbond1, bbond2]
 
     elif len(all_possible_bbonds) == 0 and len(all_possible_fbonds) == 0:
         possibles_b_f = itertools.combinations(possible_bbond_and_fbonds, 2)
@@ -465,9 +662,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
             possibles = itertools.product(fbonds1, bbonds1, fbonds2, bbonds2)
 
             for fbond1, bbond1, fbond2, bbond2 in possibles:
-                possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                     fbonds=[fbond1, fbond2],
-                                                     bbonds=[bbond1, bbond2])
+                yield [fbond1, fbond2], [bbond1, bbond2]
 
         for bbonds, fbonds in possible_bbond_and_fbonds:
             # Make two and break two bonds, all of the same type
@@ -475,11 +670,7 @@ def get_fbonds_bbonds_2b2f(reac, prod, possible_brs, all_possible_bbonds, all_po
                                           itertools.combinations(bbonds, 2))
 
             for (fbond1, fbond2), (bbond1, bbond2) in possibles:
-                possible_brs = add_bond_rearrangment(possible_brs, reac, prod,
-                                                     fbonds=[fbond1, fbond2],
-                                                     bbonds=[bbond1, bbond2])
-
-    return possible_brs
+                yield [fbond1, fbond2], [bbond1, bbond2]
 
 
 def strip_equiv_bond_rearrs(mol, possible_bond_rearrs, depth=6):
@@ -521,6 +712,65 @@ def strip_equiv_bond_rearrs(mol, possible_bond_rearrs, depth=6):
     return unique_bond_rearrs
 
 
+def get_rearranged_active_graph(graph, bond_rearrangement):
+    """
+    Get a copy of a reactant graph with the forming bonds added and the
+    forming and breaking bonds labelled with their type in the active edge
+    attribute, so an isomorphism between two of these graphs is an
+    automorphism of the reactant that maps one rearrangement onto the other
+
+    Arguments:
+        graph (nx.Graph):
+        bond_rearrangement (autode.bond_rearrangement.BondRearrangement):
+
+    Returns:
+        (nx.Graph):
+    """
+    active_graph = graph.copy()
+
+    for bond in bond_rearrangement.fbonds:
+        active_graph.add_edge(*bond, pi=False, active='forming')
+
+    for bond in bond_rearrangement.bbonds:
+        active_graph.edges[bond]['active'] = 'breaking'
+
+    return active_graph
+
+
+def get_equivalent_bond_rearrangs(species, bond_rearrangs):
+    """
+    Group bond rearrangements that are related by a symmetry of the molecular
+    graph of a species e.g. abstracting any of the three H atoms from a methyl
+    group. The first bond rearrangement in each group is the first in the
+    input list, so a transition state need only be found for that one
+
+    Arguments:
+        species (autode.species.Species): Reactant (complex)
+        bond_rearrangs (list(autode.bond_rearrangement.BondRearrangement)):
+
+    Returns:
+        (list(list(autode.bond_rearrangement.BondRearrangement))):
+    """
+    groups, group_graphs = [], []
+
+    for bond_rearrangement in bond_rearrangs:
+        active_graph = get_rearranged_active_graph(species.graph,
+                                                   bond_rearrangement)
+
+        for group, group_graph in zip(groups, group_graphs):
+            if is_isomorphic(active_graph, group_graph):
+                group.append(bond_rearrangement)
+                break
+
+        else:
+            groups.append([bond_rearrangement])
+            group_graphs.append(active_graph)
+
+    logger.info(f'Found {len(groups)} symmetry unique bond rearrangement(s) '
+                f'from {len(bond_rearrangs)}')
+    return groups
+
+
 class BondRearrangement:
 
     def __str__(self):
@@ -1,5 +1,8 @@
 from copy import deepcopy
+from functools import wraps
 import os
+import io
+import itertools
 import hashlib
 import base64
 import autode.wrappers.keywords as kws
@@ -9,6 +12,8 @@ from autode.solvent.solvents import get_available_solvent_names
 from autode.solvent.solvents import get_solvent
 from autode.config import Config
 from autode.solvent.solvents import Solvent
+from autode.calculation_cache import get_cached_results, get_result
+from autode.calculation_cache import save_results
 from autode.log import logger
 
 output_exts = ('.out', '.hess', '.xyz', '.inp', '.com', '.log', '.nw',
@@ -20,6 +25,33 @@ def execute_calc(calc):
     return calc.execute_calculation()
 
 
+def parsed_from_output(func):
+    """
+    Memoise the result of a Calculation getter on the calculation, so the
+    output is only parsed once for each set of arguments. Results are
+    discarded when the output changes and copies are returned so they can
+    be modified freely
+    """
+
+    @wraps(func)
+    def wrapped_function(calc, *args, **kwargs):
+        if calc.output.has_changed():
+            logger.info(f'{calc.output.filename} has changed. Re-parsing')
+            calc.output.set_lines()
+
+        if calc._parsed_n_updates != calc.output.n_updates:
+            calc._parsed_results = {}
+            calc._parsed_n_updates = calc.output.n_updates
+
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in calc._parsed_results:
+            calc._parsed_results[key] = func(calc, *args, **kwargs)
+
+        return deepcopy(calc._parsed_results[key])
+
+    return wrapped_function
+
+
 def get_solvent_name(molecule, method):
     """
     Set the solvent keyword to use in the calculation given an QM method
@@ -92,6 +124,10 @@ class Calculation:
         Returns:
             (float): Energy in Hartrees, or None
         """
+        if self.cached_results is not None:
+            name = 'enthalpy' if h else ('free_energy' if g else 'energy')
+            return get_result(self.cached_results, name)
+
         logger.info(f'Getting energy from {self.output.filename}')
 
         if self.terminated_normally() or force:
@@ -173,8 +209,13 @@ class Calculation:
         """Add the methods used in this calculation to the used methods list"""
         from autode.log.methods import methods
 
+        if self.cached_results is not None:
+            version = self.cached_results['version']
+        else:
+            version = self.method.get_version(self)
+
         methods.add(f'Calculations were performed using {self.method.name} v. '
-                    f'{self.method.get_version(self)} '
+                    f'{version} '
                     f'({self.method.doi_str()}).')
 
         # Type of calculation ----
@@ -210,15 +251,19 @@ class Calculation:
         methods.add(f'{string}.\n')
         return None
 
+    @parsed_from_output
     def get_energy(self):
         return self._get_energy(e=True)
 
+    @parsed_from_output
     def get_enthalpy(self):
         return self._get_energy(h=True)
 
+    @parsed_from_output
     def get_free_energy(self):
         return self._get_energy(g=True)
 
+    @parsed_from_output
     def optimisation_converged(self):
         """Check whether a calculation has has converged to within the theshold
         on energies and graidents specified in the input
@@ -227,11 +272,15 @@ class Calculation:
             (bool)
         """
         logger.info('Checking to see if the geometry converged')
+        if self.cached_results is not None:
+            return get_result(self.cached_results, 'optimisation_converged')
+
         if not self.output.exists():
             return False
 
         return self.method.optimisation_converged(self)
 
+    @parsed_from_output
     def optimisation_nearly_converged(self):
         """Check whether a calculation has nearly converged and may just need
         more geometry optimisation steps to complete successfully
@@ -240,11 +289,16 @@ class Calculation:
             (bool)
         """
         logger.info('Checking to see if the geometry nearly converged')
+        if self.cached_results is not None:
+            return get_result(self.cached_results,
+                              'optimisation_nearly_converged')
+
         if not self.output.exists():
             return False
 
         return self.method.optimisation_nearly_converged(self)
 
+    @parsed_from_output
     def get_imaginary_freqs(self):
         """Get the imaginary frequencies from a calculation output note that
         they are returned as negative to conform with standard QM codes
@@ -253,8 +307,12 @@ class Calculation:
             (list(float)): List of negative frequencies in wavenumbers (cm-1)
         """
         logger.info(f'Getting imaginary frequencies from {self.name}')
+        if self.cached_results is not None:
+            return get_result(self.cached_results, 'imaginary_freqs')
+
         return self.method.get_imaginary_freqs(self)
 
+    @parsed_from_output
     def get_normal_mode_displacements(self, mode_number):
         """Get the displacements along a mode for each of the n_atoms in the
         structure will return a list of length n_atoms each with 3 components
@@ -268,13 +326,41 @@ class Calculation:
             (np.ndarray): Displacement vectors for each atom (Å)
                           modes.shape = (n_atoms, 3)
         """
-        modes = self.method.get_normal_mode_displacements(self, mode_number)
+        if self.cached_results is not None:
+            return get_result(self.cached_results, 'normal_modes', mode_number)
+
+        all_modes = self.get_normal_modes()
+
+        if all_modes is None:
+            modes = self.method.get_normal_mode_displacements(self,
+                                                              mode_number)
+        elif 0 <= mode_number < len(all_modes):
+            modes = all_modes[mode_number]
+
+        else:
+            modes = []
 
         if len(modes) != self.molecule.n_atoms:
             raise ex.NoNormalModesFound
 
         return modes
 
+    @parsed_from_output
+    def get_normal_modes(self):
+        """Get the displacements along all the normal modes, parsed in a
+        single pass over the output. Only available for methods that
+        implement get_normal_modes
+
+        Returns:
+            (np.ndarray | None): Displacement vectors for each mode and atom
+                                 (Å) modes.shape = (n_modes, n_atoms, 3)
+        """
+        if self.cached_results is not None:
+            return None
+
+        return self.method.get_normal_modes(self)
+
+    @parsed_from_output
     def get_final_atoms(self):
         """
         Get the atoms from the final step of a geometry optimisation
@@ -283,6 +369,8 @@ class Calculation:
             (list(autode.atoms.Atom)):
         """
         logger.info(f'Getting final atoms from {self.output.filename}')
+        if self.cached_results is not None:
+            return get_result(self.cached_results, 'final_atoms')
 
         if not self.output.exists():
             logger.error('No calculation output. Could not get atoms')
@@ -297,6 +385,7 @@ class Calculation:
 
         return atoms
 
+    @parsed_from_output
     def get_atomic_charges(self):
         """
         Get the partial atomic charges from a calculation. The method used to
@@ -306,6 +395,9 @@ class Calculation:
         Returns:
             (list(float)): Atomic charges in units of e
         """
+        if self.cached_results is not None:
+            return get_result(self.cached_results, 'atomic_charges')
+
         if not self.output.exists():
             logger.error('No calculation output. Could not get final charges')
             raise ex.CouldNotGetProperty(name='atomic charges')
@@ -318,6 +410,7 @@ class Calculation:
 
         return charges
 
+    @parsed_from_output
     def get_gradients(self):
         """
         Get the gradient (dE/dr) with respect to atomic displacement from a
@@ -328,6 +421,9 @@ class Calculation:
                           gradients.shape = (n_atoms, 3)
         """
         logger.info(f'Getting gradients from {self.output.filename}')
+        if self.cached_results is not None:
+            return get_result(self.cached_results, 'gradients')
+
         gradients = self.method.get_gradients(self)
 
         if len(gradients) != self.molecule.n_atoms:
@@ -335,10 +431,15 @@ class Calculation:
 
         return gradients
 
+    @parsed_from_output
     def terminated_normally(self):
         """Determine if the calculation terminated without error"""
         logger.info(f'Checking for {self.output.filename} normal termination')
 
+        # Only calculations that terminated normally are cached
+        if self.cached_results is not None:
+            return True
+
         if not self.output.exists():
             logger.warning('Calculation did not generate any output')
             return False
@@ -399,6 +500,7 @@ class Calculation:
             logger.info('Calculation already terminated normally. Skipping')
             return None
 
+        self.output.close()
         self.method.execute(self)
         self.output.set_lines()
 
@@ -408,17 +510,44 @@ class Calculation:
         """Run the calculation using the EST method """
         logger.info(f'Running calculation {self.name}')
 
+        # If the results of an identical calculation have been cached then
+        # there is no need to run the calculation or parse any output
+        self.cached_results = get_cached_results(self)
+        if self.cached_results is not None:
+            self._add_to_comp_methods()
+            return None
+
         # Set an input filename and generate the input
         self.generate_input()
 
         # Set the output filename, run the calculation and clean up the files
         self.output.filename = self.method.get_output_filename(self)
         self.execute_calculation()
+        save_results(self)
         self.clean_up()
         self._add_to_comp_methods()
 
         return None
 
+    def submit(self, scheduler=None):
+        """
+        Submit the calculation to be run asynchronously, with a number of
+        cores allocated by the scheduler
+
+        Keyword Arguments:
+            scheduler (autode.scheduler.Scheduler | None): If None then use
+                                                           the global scheduler
+        Returns:
+            (concurrent.futures.Future): Future whose result is this
+                                         calculation, once it has been run
+        """
+        from autode.scheduler import get_scheduler
+
+        if scheduler is None:
+            scheduler = get_scheduler()
+
+        return scheduler.submit_calculation(self)
+
     def __init__(self, name, molecule, method, keywords, n_cores=1,
                  bond_ids_to_add=None,
                  other_input_block=None,
@@ -462,7 +591,9 @@ class Calculation:
                      else f'_{name}_{method.name}')
 
         # ------------------- System specific parameters ----------------------
-        self.molecule = deepcopy(molecule)
+        # Species share their (unmodified) molecular graph with copies
+        self.molecule = (molecule.copy() if hasattr(molecule, 'copy')
+                         else deepcopy(molecule))
 
         self.molecule.constraints = Constraints(distance=distance_constraints,
                                                 cartesian=cartesian_constraints)
@@ -482,13 +613,21 @@ class Calculation:
 
         self.output = CalculationOutput()
 
+        # Results from the calculation cache, set in run() if they exist
+        self.cached_results = None
+
+        # Results parsed from the output, see parsed_from_output()
+        self._parsed_results = {}
+        self._parsed_n_updates = 0
+
 
 class CalculationOutput:
 
     def set_lines(self):
         """
-        Set the output files lines. This may be slow for large files but should
-        not become a bottleneck when running standard DFT/WF calculations
+        Set the output file to be parsed. The file is read as bytes, which
+        are searched for sections, and the lines are only generated if they
+        are requested
 
         Returns:
             (None)
@@ -498,22 +637,241 @@ class CalculationOutput:
         if not os.path.exists(self.filename):
             raise ex.NoCalculationOutput
 
-        self.file_lines = open(self.filename, 'r', encoding="utf-8").readlines()
+        with open(self.filename, 'rb') as output_file:
+            stat = os.fstat(output_file.fileno())
+            data = output_file.read()
+
+        self._reset(data=data, file_lines=None)
+        self._file_stat = (stat.st_mtime_ns, stat.st_size)
+        return None
+
+    def has_changed(self):
+        """
+        Has the output file been modified since its lines were set? Outputs
+        set directly from lines, or files that have since been removed, are
+        not considered to have changed
+
+        Returns:
+            (bool):
+        """
+        if self._file_stat is None or not os.path.exists(self.filename):
+            return False
+
+        stat = os.stat(self.filename)
+        return (stat.st_mtime_ns, stat.st_size) != self._file_stat
 
+    def close(self):
+        """
+        Close the output, discarding the data read from the file e.g. before
+        the calculation is run again and the file overwritten
+
+        Returns:
+            (None)
+        """
+        self._reset(data=None, file_lines=None)
         return None
 
+    @property
+    def file_lines(self):
+        """
+        Lines of the output, generated from the data already read on the
+        first request. Split as if the file was read as text, so e.g. form
+        feeds in XTB outputs don't start a new line
+
+        Returns:
+            (list(str)) or None:
+        """
+        if self._file_lines is None and self._data is not None:
+            text = self._data.decode('utf-8', errors='replace')
+            self._file_lines = io.StringIO(text, newline=None).readlines()
+
+        return self._file_lines
+
+    @file_lines.setter
+    def file_lines(self, value):
+        """Set the lines directly, so the data is generated from them"""
+        self._reset(data=None, file_lines=value)
+
+    @property
+    def data(self):
+        """
+        Raw bytes of the output, either read from the file or joined from
+        lines that have been set directly
+
+        Returns:
+            (bytes) or None:
+        """
+        if self._data is None and self._file_lines is not None:
+            self._data = ''.join(line if line.endswith('\n') else f'{line}\n'
+                                 for line in self._file_lines).encode()
+
+        return self._data
+
     def exists(self):
         """Does the calculation output exist?"""
 
-        if self.filename is None or self.file_lines is None:
+        if self.filename is None:
             return False
 
-        return True
+        return self._data is not None or self._file_lines is not None
+
+    def section_offsets(self, header, *other_headers):
+        """
+        Byte offsets of all occurrences of a section header in the output, in
+        the order they appear. Offsets are indexed the first time they are
+        requested, so any other headers that will be required can be given
+        in other_headers to be indexed at the same time
+
+        Arguments:
+            header (str):
+            *other_headers (str):
+
+        Returns:
+            (list(int)):
+        """
+        headers = [h for h in set((header,) + other_headers)
+                   if h not in self._section_offsets]
+
+        if self.data is None:
+            return []
+
+        # Searching for each header with find() is much faster than a single
+        # regex pass over the data, as find() does not run the regex engine
+        # at every position
+        for h in headers:
+            h_bytes, offsets = h.encode(), []
+            offset = self.data.find(h_bytes)
+
+            while offset != -1:
+                offsets.append(offset)
+                offset = self.data.find(h_bytes, offset + 1)
+
+            self._section_offsets[h] = offsets
+
+        return self._section_offsets.get(header, [])
+
+    def line_at(self, offset):
+        """
+        Line of the output containing a byte offset
+
+        Arguments:
+            offset (int):
+
+        Returns:
+            (str):
+        """
+        return next(self.lines_after(offset))
+
+    def lines_after(self, offset):
+        """
+        Generate lines of the output forwards, starting from the line that
+        contains a byte offset
+
+        Arguments:
+            offset (int):
+
+        Yields:
+            (str):
+        """
+        data = self.data
+        start = data.rfind(b'\n', 0, offset) + 1
+
+        while start < len(data):
+            end = data.find(b'\n', start)
+            end = len(data) if end == -1 else end + 1
+
+            yield data[start:end].decode('utf-8', errors='replace')
+            start = end
+
+    def lines_before(self, offset):
+        """
+        Generate lines of the output in reverse, starting from the line that
+        contains a byte offset
+
+        Arguments:
+            offset (int):
+
+        Yields:
+            (str):
+        """
+        data = self.data
+        end = data.find(b'\n', offset)
+        end = len(data) if end == -1 else end + 1
+
+        while end > 0:
+            start = data.rfind(b'\n', 0, end - 1) + 1
+
+            yield data[start:end].decode('utf-8', errors='replace')
+            end = start
+
+    def lines_from(self, offset, n_lines):
+        """
+        List of n lines of the output starting from the line that contains
+        a byte offset, which may be shorter if the end of the file is reached
+
+        Arguments:
+            offset (int):
+            n_lines (int):
+
+        Returns:
+            (list(str)):
+        """
+        return list(itertools.islice(self.lines_after(offset), n_lines))
+
+    def last_line_containing(self, string):
+        """
+        Final line of the output that contains a string
+
+        Arguments:
+            string (str):
+
+        Returns:
+            (str) or None:
+        """
+        offset = self.data.rfind(string.encode())
+        return None if offset == -1 else self.line_at(offset)
+
+    def tail(self, n_lines):
+        """
+        Last n lines of the output, in order
+
+        Arguments:
+            n_lines (int):
+
+        Returns:
+            (list(str)):
+        """
+        if len(self.data) == 0:
+            return []
+
+        lines = itertools.islice(self.lines_before(len(self.data) - 1),
+                                 n_lines)
+        return list(reversed(list(lines)))
+
+    def contains(self, string):
+        """Does the output contain a string?"""
+        return self.data.find(string.encode()) != -1
+
+    def _reset(self, data, file_lines):
+        """Set the output data and clear anything derived from the old one"""
+        self._data = data
+        self._file_lines = file_lines
+        self._section_offsets = {}
+        self._file_stat = None
+        self.n_updates += 1
 
     def __init__(self):
 
         self.filename = None
-        self.file_lines = None
+
+        self._data = None               # bytes
+        self._file_lines = None         # list(str)
+        self._section_offsets = {}      # header: list(int)
+        self._file_stat = None          # (modification time, size)
+
+        # Incremented every time the output changes, so results parsed from
+        # a previous output can be discarded
+        self.n_updates = 0
 
 
 class CalculationInput:
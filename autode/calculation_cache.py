@@ -0,0 +1,207 @@
+"""
+Content addressed cache of parsed calculation results. Results are keyed on
+the calculation input (rounded coordinates, charge, multiplicity, method,
+keywords, solvent and constraints) rather than the calculation name, so they
+can be shared across runs and reaction directories
+"""
+import os
+import json
+import hashlib
+import numpy as np
+import autode.exceptions as ex
+from autode.atoms import Atom
+from autode.config import Config
+from autode.log import logger
+
+
+def _rounded(value, decimals):
+    """String of a float rounded to a number of decimal places, with -0.0
+    converted to 0.0 so the string is unique"""
+    return f'{np.round(float(value), decimals) + 0.0:.{decimals}f}'
+
+
+def get_key(calc):
+    """
+    Generate a key for a calculation from everything that defines its result
+
+    Arguments:
+        calc (autode.calculation.Calculation):
+
+    Returns:
+        (str): SHA1 hex digest
+    """
+    decimals = Config.calculation_cache_decimals
+    mol = calc.molecule
+
+    string = f'{mol.charge}_{mol.mult}_{calc.method.name}_'
+
+    for atom in mol.atoms:
+        string += atom.label
+        string += ''.join(_rounded(x, decimals) for x in atom.coord)
+
+    # Type of the keywords defines the calculation type, which may not appear
+    # in the keywords themselves e.g. for XTB
+    keywords = calc.input.keywords
+    string += f'_{keywords.__class__.__name__}_{str(keywords)}'
+    string += f'_{calc.input.solvent}_{calc.method.implicit_solvation_type}'
+    string += f'_{calc.input.temp}_{calc.input.other_block}'
+
+    if calc.input.added_internals is not None:
+        string += str(sorted(tuple(pair) for pair in calc.input.added_internals))
+
+    if calc.input.point_charges is not None:
+        for pc in calc.input.point_charges:
+            string += _rounded(pc.charge, decimals)
+            string += ''.join(_rounded(x, decimals) for x in pc.coord)
+
+    constraints = mol.constraints
+    if constraints.distance is not None:
+        for pair, dist in sorted(constraints.distance.items()):
+            string += f'{pair}{_rounded(dist, decimals)}'
+
+    if constraints.cartesian is not None:
+        string += str(sorted(constraints.cartesian))
+
+    return hashlib.sha1(string.encode()).hexdigest()
+
+
+def _get_filename(key):
+    """Full path to a cache entry. Entries are split into sub-directories by
+    the first two characters of the key to keep directories small"""
+    return os.path.join(Config.calculation_cache_dir, key[:2], f'{key}.json')
+
+
+def get_cached_results(calc):
+    """
+    Get the results of a calculation from the cache, if it exists
+
+    Arguments:
+        calc (autode.calculation.Calculation):
+
+    Returns:
+        (dict | None): Results, or None if they are not in the cache
+    """
+    if Config.calculation_cache_dir is None:
+        return None
+
+    filename = _get_filename(get_key(calc))
+    if not os.path.exists(filename):
+        return None
+
+    try:
+        with open(filename, 'r') as cache_file:
+            results = json.load(cache_file)
+
+    except (OSError, ValueError):
+        logger.warning(f'Could not load cached results from {filename}')
+        return None
+
+    logger.info(f'Found cached results for {calc.name}')
+    return results
+
+
+def save_results(calc):
+    """
+    Parse all the properties available from a calculation that terminated
+    normally and save them in the cache
+
+    Arguments:
+        calc (autode.calculation.Calculation):
+    """
+    if Config.calculation_cache_dir is None:
+        return None
+
+    if not calc.terminated_normally():
+        logger.warning('Not caching the results of a calculation that did not '
+                       'terminate normally')
+        return None
+
+    def parsed(func, *args):
+        """Value of a property or None if it could not be parsed. Output files
+        can be truncated in many ways so catch any parsing error"""
+        try:
+            return func(*args)
+
+        except Exception:
+            return None
+
+    def as_list(value):
+        return None if value is None else np.asarray(value).tolist()
+
+    results = {'version': parsed(calc.method.get_version, calc),
+               'energy': parsed(calc.get_energy),
+               'enthalpy': parsed(calc.get_enthalpy),
+               'free_energy': parsed(calc.get_free_energy),
+               'optimisation_converged': parsed(calc.optimisation_converged),
+               'optimisation_nearly_converged':
+                   parsed(calc.optimisation_nearly_converged),
+               'gradients': as_list(parsed(calc.get_gradients)),
+               'atomic_charges': parsed(calc.get_atomic_charges),
+               'imaginary_freqs': parsed(calc.get_imaginary_freqs),
+               'normal_modes': {}}
+
+    atoms = parsed(calc.get_final_atoms)
+    if atoms is not None:
+        results['final_atoms'] = [[atom.label, *atom.coord.tolist()]
+                                  for atom in atoms]
+
+    # Only the displacements along the imaginary modes are used, which are
+    # the first vibrational modes
+    for i, _ in enumerate(results['imaginary_freqs'] or []):
+        modes = parsed(calc.get_normal_mode_displacements, 6 + i)
+        if modes is not None:
+            results['normal_modes'][str(6 + i)] = as_list(modes)
+
+    filename = _get_filename(get_key(calc))
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+    # Write to a temporary file then rename, so another process reading the
+    # cache never sees a partially written entry
+    tmp_filename = f'{filename}.{os.getpid()}.tmp'
+    with open(tmp_filename, 'w') as cache_file:
+        json.dump(results, cache_file)
+
+    os.replace(tmp_filename, filename)
+    logger.info(f'Saved results of {calc.name} to the calculation cache')
+    return None
+
+
+def get_result(results, name, *args):
+    """
+    Get a single result from a set of cached results
+
+    Arguments:
+        results (dict):
+        name (str): Name of the property e.g. 'energy'
+        *args: Arguments of the property, e.g. a normal mode number
+
+    Returns:
+        (Any):
+
+    Raises:
+        (autode.exceptions.AtomsNotFound | NoNormalModesFound |
+         CouldNotGetProperty): If the property was not cached
+    """
+    if name == 'final_atoms':
+        if 'final_atoms' not in results:
+            raise ex.AtomsNotFound
+
+        return [Atom(label, x=x, y=y, z=z)
+                for label, x, y, z in results['final_atoms']]
+
+    if name == 'normal_modes':
+        modes = results['normal_modes'].get(str(args[0]), None)
+        if modes is None:
+            raise ex.NoNormalModesFound
+
+        return np.array(modes)
+
+    value = results.get(name, None)
+    if value is None and name in ('gradients', 'atomic_charges',
+                                  'imaginary_freqs'):
+        raise ex.CouldNotGetProperty(name=name)
+
+    if name == 'gradients':
+        return np.array(value)
+
+    return value
@@ -48,6 +48,19 @@ class Config:
     ll_tmp_dir = None
     #
     # -------------------------------------------------------------------------
+    # Directory to cache the results of calculations in, keyed on the input
+    # (coordinates, charge, multiplicity, method, keywords, solvent and
+    # constraints) so identical calculations are never repeated, even across
+    # different runs and directories. If None then no results are cached
+    #
+    calculation_cache_dir = None
+    #
+    # Number of decimal places to round coordinates (Å) to when determining
+    # whether two calculations are identical
+    #
+    calculation_cache_decimals = 5
+    #
+    # -------------------------------------------------------------------------
     # By default templates are saved to /path/to/autode/transition_states/lib/
     # unless ts_template_folder_path is set
     #
@@ -78,6 +91,13 @@ class Config:
     #
     max_atom_displacement = 4.0
     # -------------------------------------------------------------------------
+    # Implementation of the repulsion + relaxation force field used to
+    # generate conformers. Either 'numpy', which evaluates the energy and
+    # gradient together and uses a neighbour list for the repulsion in large
+    # molecules, or 'cython'
+    #
+    rr_ff_backend = 'numpy'
+    # -------------------------------------------------------------------------
     # Number of evenly spaced points on a sphere that will be used to generate
     # NCI and Reactant and Product complex conformers. Total number of
     # conformers will be:
@@ -111,6 +131,21 @@ class Config:
     #
     hmethod_sp_conformers = False
     # -------------------------------------------------------------------------
+    # Run the conformer optimisations (and single points) in parallel, with
+    # the cores divided between them, rather than one after another each
+    # using all n_cores
+    #
+    parallel_conformers = True
+    # -------------------------------------------------------------------------
+    # Number of chains of points a 1D PES scan is split into, which are run
+    # concurrently with the cores divided between them. Chains start from the
+    # reactant, the product or a geometry interpolated between them with the
+    # scanned distance set, so with 1 every point is calculated in order from
+    # the reactant. With more than 1 the surface can be discontinuous where
+    # chains meet, which can give false maxima on the path
+    #
+    n_pes1d_chains = 1
+    # -------------------------------------------------------------------------
 
     class ORCA:
         # ---------------------------------------------------------------------
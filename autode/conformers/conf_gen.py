@@ -4,7 +4,8 @@ import numpy as np
 import os
 from scipy.optimize import minimize
 from time import time
-from autode.bond_lengths import get_ideal_bond_length_matrix
+from autode.conformers.rr_ff import get_rr_force_field
+from autode.conformers.rr_ff import get_ideal_bond_lengths
 from autode.config import Config
 from autode.input_output import xyz_file_to_atoms
 from autode.input_output import atoms_to_xyz_file
@@ -15,6 +16,13 @@ from autode.exceptions import CannotSplitAcrossBond
 from autode.exceptions import NoMolecularGraph
 
 
+# Structures minimised together in a batch are limited to this number, and
+# to a total number of atom pairs, so the batch arrays fit in memory and one
+# slow to converge structure doesn't hold up too many others
+_max_batch_size = 50
+_max_batch_n_pairs = 1000000
+
+
 def get_bond_matrix(n_atoms, bonds, fixed_bonds):
     """
     Populate a bond matrix with 1 if i, j are bonded, 2 if i, j are bonded and
@@ -61,6 +69,12 @@ def get_coords_minimised_v(coords, bonds, k, c, d0, tol, fixed_bonds, exponent=8
     Returns:
         (np.ndarray): Optimised coordinates, shape = (n_atoms, 3)
     """
+    if Config.rr_ff_backend == 'numpy':
+        ff = get_rr_force_field(n_atoms=len(coords), bonds=bonds,
+                                fixed_bonds=fixed_bonds, d0=d0, k=k, c=c,
+                                exponent=exponent)
+        return ff.minimise(coords, tol=tol)
+
     # TODO divide and conquer?
     from cconf_gen import v
     from cconf_gen import dvdr
@@ -82,6 +96,45 @@ def get_coords_minimised_v(coords, bonds, k, c, d0, tol, fixed_bonds, exponent=8
     return res.x.reshape(n_atoms, 3)
 
 
+def get_coords_minimised_v_batch(coords, bonds, k, c, d0, tol, fixed_bonds,
+                                 exponent=8):
+    """
+    Get the coordinates that minimise a bonds + repulsion FF for a batch of
+    structures with the same atoms and bonds, e.g. random starting points for
+    different conformers. Structures are minimised together in chunks
+
+    Arguments:
+        coords (np.ndarray): Initial coordinates,
+                             shape = (n_structures, n_atoms, 3)
+        bonds (list(tuple(int))): List of bonds
+        fixed_bonds (list(tuple(int))): List of constrained bonds will use 10k
+                    as the harmonic force constant
+        k (float):
+        c (float):
+        exponent (int): Exponent in the repulsive pairwise term
+
+    Returns:
+        (np.ndarray): Optimised coordinates, shape = (n_structures, n_atoms, 3)
+    """
+    coords = np.asarray(coords, dtype=float)
+    n_structures, n_atoms, _ = coords.shape
+
+    if Config.rr_ff_backend != 'numpy':
+        return np.array([get_coords_minimised_v(coords[i], bonds, k, c, d0,
+                                                tol, fixed_bonds, exponent)
+                         for i in range(n_structures)])
+
+    ff = get_rr_force_field(n_atoms=n_atoms, bonds=bonds,
+                            fixed_bonds=fixed_bonds, d0=d0, k=k, c=c,
+                            exponent=exponent)
+
+    n_pairs = max(n_atoms * (n_atoms - 1) // 2, 1)
+    chunk_size = max(1, min(_max_batch_size, _max_batch_n_pairs // n_pairs))
+
+    return np.concatenate([ff.minimise_batch(coords[i:i+chunk_size], tol=tol)
+                           for i in range(0, n_structures, chunk_size)])
+
+
 def get_v(coords, bonds, k, c, d0, fixed_bonds, exponent=8):
     """Get the energy using a bond + repulsion FF where
 
@@ -305,6 +358,71 @@ def get_coords_no_init_strucutre(atoms, species, d0, constrained_bonds):
     return coords
 
 
+def get_d0_and_constrained_bonds(species, dist_consts):
+    """
+    Get the ideal bond lengths for the RR force field of a species, with the
+    distance constraints (and those added across stereocentres) as fixed
+    bonds
+
+    Arguments:
+        species (autode.species.Species):
+        dist_consts (dict | None): Key = tuple of atom indexes,
+                                   Value = distance
+
+    Returns:
+        (tuple(np.ndarray, list(tuple(int)))): d0 and the constrained bonds
+    """
+    # Add the distance constraints as fixed bonds
+    d0 = get_ideal_bond_lengths(species)
+
+    # Add distance constraints across stereocentres e.g. for a Z double bond
+    # then modify d0 appropriately
+    dist_consts = add_dist_consts_for_stereocentres(species=species,
+                                                    dist_consts={} if dist_consts is None else dist_consts)
+
+    constrained_bonds = []
+    for bond, length in dist_consts.items():
+        i, j = bond
+        d0[i, j] = length
+        d0[j, i] = length
+        constrained_bonds.append(bond)
+
+    return d0, constrained_bonds
+
+
+def get_randomised_atoms(species, fixed_atom_indexes, rand,
+                         coords_are_reasonable):
+    """
+    Get a copy of the atoms of a species with stereocentres rotated and the
+    atoms that aren't fixed randomly displaced, as the starting point for
+    a RR minimisation
+
+    Arguments:
+        species (autode.species.Species):
+        fixed_atom_indexes (set(int)): Atoms not to randomise
+        rand (np.RandomState): random state
+        coords_are_reasonable (bool): If False then randomise all the atoms
+                                      in a 10 Å cubic box
+
+    Returns:
+        (list(autode.atoms.Atom)): Atoms
+    """
+    atoms = get_atoms_rotated_stereocentres(species=species,
+                                            atoms=deepcopy(species.atoms),
+                                            rand=rand)
+
+    # Randomise coordinates that aren't fixed by shifting a maximum of
+    # autode.Config.max_atom_displacement in x, y, z
+    if coords_are_reasonable:
+        factor = Config.max_atom_displacement / np.sqrt(3)
+        [atom.translate(vec=factor * rand.uniform(-1, 1, 3)) for i, atom in enumerate(atoms) if i not in fixed_atom_indexes]
+    else:
+        # Randomise in a 10 Å cubic box
+        [atom.translate(vec=rand.uniform(-5, 5, 3)) for atom in atoms]
+
+    return atoms
+
+
 def get_simanl_atoms(species, dist_consts=None, conf_n=0):
     """
     Use a bonded + repulsive force field to generate 3D structure for a
@@ -337,43 +455,17 @@ def get_simanl_atoms(species, dist_consts=None, conf_n=0):
     if species.graph is None:
         raise NoMolecularGraph
 
-    # Initialise a new random seed and make a copy of the species' atoms.
-    # RandomState is thread safe
-    rand = np.random.RandomState()
-    atoms = get_atoms_rotated_stereocentres(species=species,
-                                            atoms=deepcopy(species.atoms),
-                                            rand=rand)
-
-    # Add the distance constraints as fixed bonds
-    d0 = get_ideal_bond_length_matrix(atoms=species.atoms,
-                                      bonds=species.graph.edges())
-
-    # Add distance constraints across stereocentres e.g. for a Z double bond
-    # then modify d0 appropriately
-    dist_consts = add_dist_consts_for_stereocentres(species=species,
-                                                    dist_consts={} if dist_consts is None else dist_consts)
-
-    constrained_bonds = []
-    for bond, length in dist_consts.items():
-        i, j = bond
-        d0[i, j] = length
-        d0[j, i] = length
-        constrained_bonds.append(bond)
-
-    # Randomise coordinates that aren't fixed by shifting a maximum of
-    # autode.Config.max_atom_displacement in x, y, z
-    fixed_atom_indexes = get_non_random_atoms(species=species)
+    d0, constrained_bonds = get_d0_and_constrained_bonds(species, dist_consts)
 
     # Shift by a factor defined in the config file if the coordinates are
     # reasonable but otherwise init in a 10 A cube
     initial_coords_are_reasonable = are_coords_reasonable(species.get_coordinates())
 
-    if initial_coords_are_reasonable:
-        factor = Config.max_atom_displacement / np.sqrt(3)
-        [atom.translate(vec=factor * rand.uniform(-1, 1, 3)) for i, atom in enumerate(atoms) if i not in fixed_atom_indexes]
-    else:
-        # Randomise in a 10 Å cubic box
-        [atom.translate(vec=rand.uniform(-5, 5, 3)) for atom in atoms]
+    # Initialise a new random seed. RandomState is thread safe
+    atoms = get_randomised_atoms(species,
+                                 fixed_atom_indexes=get_non_random_atoms(species),
+                                 rand=np.random.RandomState(),
+                                 coords_are_reasonable=initial_coords_are_reasonable)
 
     logger.info('Minimising species...')
     st = time()
@@ -394,3 +486,101 @@ def get_simanl_atoms(species, dist_consts=None, conf_n=0):
     atoms_to_xyz_file(atoms=atoms, filename=xyz_filename)
 
     return atoms
+
+
+def get_simanl_atoms_batch(species, dist_consts=None, conf_ns=(0,)):
+    """
+    Generate a batch of conformers of a species using the RR force field
+    (see get_simanl_atoms). All the randomised structures are minimised
+    together, sharing the same force field, rather than one at a time. If
+    the initial coordinates are not reasonable then each structure is
+    built up sequentially, as in get_simanl_atoms
+
+    Arguments:
+        species (autode.species.Species):
+
+    Keyword Arguments:
+        dist_consts (dict): Key = tuple of atom indexes, Value = distance
+
+        conf_ns (list(int)): Numbers of the conformers
+
+    Returns:
+        (list(list(autode.atoms.Atom))): Atoms of each conformer
+    """
+    conf_atoms = {conf_n: get_atoms_from_generated_file(species, f'{species.name}_conf{conf_n}_siman.xyz')
+                  for conf_n in conf_ns}
+
+    new_conf_ns = [conf_n for conf_n in conf_ns if conf_atoms[conf_n] is None]
+    if len(new_conf_ns) == 0:
+        return [conf_atoms[conf_n] for conf_n in conf_ns]
+
+    if species.graph is None:
+        raise NoMolecularGraph
+
+    if not are_coords_reasonable(species.get_coordinates()):
+        return [get_simanl_atoms(species, dist_consts, conf_n) if conf_atoms[conf_n] is None
+                else conf_atoms[conf_n] for conf_n in conf_ns]
+
+    d0, constrained_bonds = get_d0_and_constrained_bonds(species, dist_consts)
+    fixed_atom_indexes = get_non_random_atoms(species=species)
+
+    rand = np.random.RandomState()
+    for conf_n in new_conf_ns:
+        conf_atoms[conf_n] = get_randomised_atoms(species, fixed_atom_indexes,
+                                                  rand=rand,
+                                                  coords_are_reasonable=True)
+
+    logger.info(f'Minimising {len(new_conf_ns)} conformers of species...')
+    st = time()
+    init_coords = np.array([[atom.coord for atom in conf_atoms[conf_n]]
+                            for conf_n in new_conf_ns])
+
+    coords = get_coords_minimised_v_batch(init_coords, bonds=species.graph.edges,
+                                          k=1.0, c=0.01, d0=d0, tol=1E-5,
+                                          fixed_bonds=constrained_bonds)
+
+    logger.info(f'                 ... ({time()-st:.3f} s)')
+
+    for conf_n, conf_coords in zip(new_conf_ns, coords):
+        for i, atom in enumerate(conf_atoms[conf_n]):
+            atom.coord = conf_coords[i]
+
+        # Print an xyz file so rerunning will read the file
+        atoms_to_xyz_file(atoms=conf_atoms[conf_n],
+                          filename=f'{species.name}_conf{conf_n}_siman.xyz')
+
+    return [conf_atoms[conf_n] for conf_n in conf_ns]
+
+
+def get_simanl_atoms_list(species, dist_consts=None, n_confs=1):
+    """
+    Generate conformers of a species using the RR force field, with the
+    conformers divided into one batch per core, each minimised together in
+    a separate process
+
+    Arguments:
+        species (autode.species.Species):
+
+    Keyword Arguments:
+        dist_consts (dict): Key = tuple of atom indexes, Value = distance
+
+        n_confs (int): Number of conformers to generate
+
+    Returns:
+        (list(list(autode.atoms.Atom))): Atoms of each conformer
+    """
+    from autode.scheduler import get_scheduler
+
+    n_batches = max(1, min(Config.n_cores, n_confs))
+    batches = [list(range(n_confs))[i::n_batches] for i in range(n_batches)]
+
+    scheduler = get_scheduler()
+    futures = [scheduler.submit(get_simanl_atoms_batch, species, dist_consts,
+                                conf_ns)
+               for conf_ns in batches]
+
+    conf_atoms = {}
+    for conf_ns, future in zip(batches, futures):
+        conf_atoms.update(zip(conf_ns, future.result()))
+
+    return [conf_atoms[i] for i in range(n_confs)]
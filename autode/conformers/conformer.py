@@ -28,6 +28,58 @@ def get_conformer(species, name):
 
 class Conformer(Species):
 
+    def get_calculation(self, method, single_point=False, n_cores=None):
+        """
+        Get the calculation used to optimise this conformer, or calculate its
+        single point energy, with low-level keywords
+
+        Arguments:
+            method (autode.wrappers.base.ElectronicStructureMethod):
+
+        Keyword Arguments:
+            single_point (bool): Single point rather than an optimisation
+            n_cores (int | None): Number of cores, if None use Config.n_cores
+
+        Returns:
+            (autode.calculation.Calculation):
+        """
+        n_cores = Config.n_cores if n_cores is None else n_cores
+
+        if single_point:
+            return Calculation(name=f'{self.name}_sp', molecule=self,
+                               method=method, keywords=method.keywords.low_sp,
+                               n_cores=n_cores)
+
+        return Calculation(name=f'{self.name}_opt', molecule=self,
+                           method=method, keywords=method.keywords.low_opt,
+                           n_cores=n_cores,
+                           distance_constraints=self.dist_consts)
+
+    def set_from_calculation(self, calc, single_point=False):
+        """
+        Set the energy, and the atoms if this was an optimisation, from a
+        calculation that has been run
+
+        Arguments:
+            calc (autode.calculation.Calculation):
+
+        Keyword Arguments:
+            single_point (bool):
+        """
+        self.energy = calc.get_energy()
+
+        if single_point:
+            return None
+
+        try:
+            self.set_atoms(atoms=calc.get_final_atoms())
+
+        except AtomsNotFound:
+            logger.error(f'Atoms not found for {self.name} but not critical')
+            self.set_atoms(atoms=None)
+
+        return None
+
     def single_point(self, method, keywords=None):
         """
         Calculate a single point and default to a low level single point method
@@ -58,19 +110,9 @@ class Conformer(Species):
         if calc is not None or reset_graph:
             raise NotImplementedError
 
-        opt = Calculation(name=f'{self.name}_opt', molecule=self, method=method,
-                          keywords=method.keywords.low_opt,
-                          n_cores=Config.n_cores,
-                          distance_constraints=self.dist_consts)
+        opt = self.get_calculation(method)
         opt.run()
-        self.energy = opt.get_energy()
-
-        try:
-            self.set_atoms(atoms=opt.get_final_atoms())
-
-        except AtomsNotFound:
-            logger.error(f'Atoms not found for {self.name} but not critical')
-            self.set_atoms(atoms=None)
+        self.set_from_calculation(opt)
 
         return None
 
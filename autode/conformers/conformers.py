@@ -111,3 +111,184 @@ def conf_is_unique_rmsd(conf, conf_list, rmsd_tol=None):
             return False
 
     return True
+
+
+class ConformerDeduplicator:
+
+    def _lower_bounds_sq(self, coords):
+        """
+        Lower bounds on the squared residual of the optimal superposition of
+        some centred coordinates onto each of the unique structures. From
+        the singular values (σ), equivalent to the principal moments of
+        inertia:  min_R |X - YR|^2 >= |σ(X) - σ(Y)|^2
+
+        Arguments:
+            coords (np.ndarray): Centred coordinates, shape = (n, 3)
+
+        Returns:
+            (np.ndarray): shape = (n_unique,)
+        """
+        sing_vals = np.linalg.svd(coords, compute_uv=False)
+        return np.sum((self._sing_vals[:self.n_unique] - sing_vals)**2, axis=1)
+
+    def _residuals_sq(self, coords, idxs):
+        """
+        Squared residuals of the optimal (Kabsch) superposition of some
+        centred coordinates onto a set of the unique structures, calculated
+        for all of them at once from the singular values of the covariance
+        matrices, with the sign of the smallest flipped if the optimal
+        transformation would be a reflection
+
+        Arguments:
+            coords (np.ndarray): Centred coordinates, shape = (n, 3)
+            idxs (np.ndarray): Indexes of the unique structures
+
+        Returns:
+            (np.ndarray): shape = (len(idxs),)
+        """
+        h = np.einsum('mni,nj->mij', self._coords[idxs], coords)
+        sing_vals = np.linalg.svd(h, compute_uv=False)
+        sing_vals[:, 2] *= np.sign(np.linalg.det(h))
+
+        return (self._norms_sq[idxs] + np.sum(coords * coords)
+                - 2.0 * np.sum(sing_vals, axis=1))
+
+    def is_unique(self, conf):
+        """
+        Is a conformer unique, i.e. has a heavy atom RMSD to all the unique
+        conformers above the threshold? Structures are only compared with a
+        full superposition if the lower bound on the RMSD is below the
+        threshold, closest first
+
+        Arguments:
+            conf (autode.conformers.Conformer):
+
+        Returns:
+            (bool):
+        """
+        coords = self._heavy_atom_coords(conf)
+
+        if self.n_unique == 0 or len(coords) == 0:
+            return True
+
+        # Residual (sum of squares) below which the RMSD is below threshold
+        max_residual_sq = self.rmsd_tol**2 * coords.size
+
+        lower_bounds_sq = self._lower_bounds_sq(coords)
+        idxs = np.where(lower_bounds_sq < max_residual_sq)[0]
+        idxs = idxs[np.argsort(lower_bounds_sq[idxs])]
+
+        for i in range(0, len(idxs), self.batch_size):
+            residuals_sq = self._residuals_sq(coords, idxs[i:i+self.batch_size])
+
+            if np.any(residuals_sq < max_residual_sq):
+                return False
+
+        return True
+
+    def add(self, conf):
+        """
+        Add a conformer if it is unique
+
+        Arguments:
+            conf (autode.conformers.Conformer):
+
+        Returns:
+            (bool): If the conformer was unique, and so was added
+        """
+        if not self.is_unique(conf):
+            return False
+
+        coords = self._heavy_atom_coords(conf)
+
+        if self._coords is None:
+            self._coords = np.zeros((8, *coords.shape))
+            self._norms_sq = np.zeros(8)
+            self._sing_vals = np.zeros((8, 3))
+
+        if self.n_unique == len(self._coords):
+            self._coords = np.concatenate((self._coords, np.zeros_like(self._coords)))
+            self._norms_sq = np.concatenate((self._norms_sq, np.zeros_like(self._norms_sq)))
+            self._sing_vals = np.concatenate((self._sing_vals, np.zeros_like(self._sing_vals)))
+
+        self._coords[self.n_unique] = coords
+        self._norms_sq[self.n_unique] = np.sum(coords * coords)
+        if len(coords) > 0:
+            self._sing_vals[self.n_unique] = np.linalg.svd(coords, compute_uv=False)
+
+        self.n_unique += 1
+        return True
+
+    def _heavy_atom_coords(self, conf):
+        """Centred coordinates of the heavy (non-hydrogen) atoms"""
+        if self._heavy_atom_idxs is None:
+            self._heavy_atom_idxs = np.array([i for i, atom in enumerate(conf.atoms)
+                                              if atom.label != 'H'], dtype=int)
+
+        coords = conf.get_coordinates()[self._heavy_atom_idxs]
+        return coords - np.average(coords, axis=0) if len(coords) > 0 else coords
+
+    def __init__(self, rmsd_tol=None, batch_size=32):
+        """
+        Deduplicate conformers of the same species on an RMSD threshold
+        based on heavy atoms. Centred coordinates of the unique conformers are
+        kept so each new conformer is compared with all of them at once
+
+        Keyword Arguments:
+            rmsd_tol (float): Tolerance for an equivalent structure based on
+                              the rmsd in Å. If None then use the default
+                              value for autode.Config.rmsd_threshold
+
+            batch_size (int): Maximum number of structures to superimpose at
+                              once, before checking if any are equivalent
+        """
+        self.rmsd_tol = Config.rmsd_threshold if rmsd_tol is None else rmsd_tol
+        self.batch_size = batch_size
+        self.n_unique = 0
+
+        self._heavy_atom_idxs = None
+        self._coords = None
+        self._norms_sq = None
+        self._sing_vals = None
+
+        logger.info(f'Removing conformers with RMSD < {self.rmsd_tol} Å to '
+                    f'any other')
+
+
+def run_conformer_calcs(conformers, method, single_point=False):
+    """
+    Optimise, or calculate single point energies for, a set of conformers.
+    If Config.parallel_conformers is True the calculations are run
+    concurrently, with the total number of cores divided between them, and
+    the results set on the conformers in the order they were given
+
+    Arguments:
+        conformers (list(autode.conformers.Conformer)):
+        method (autode.wrappers.base.ElectronicStructureMethod):
+
+    Keyword Arguments:
+        single_point (bool): Single point energies rather than optimisations
+    """
+    if (not Config.parallel_conformers or len(conformers) < 2
+            or Config.n_cores == 1):
+
+        for conformer in conformers:
+            if single_point:
+                conformer.single_point(method)
+            else:
+                conformer.optimise(method)
+
+        return None
+
+    n_cores = max(Config.n_cores // len(conformers), 1)
+    logger.info(f'Running calculations on {len(conformers)} conformers in '
+                f'parallel with up to {n_cores} core(s) each')
+
+    calcs = [conformer.get_calculation(method, single_point, n_cores=n_cores)
+             for conformer in conformers]
+    futures = [calc.submit() for calc in calcs]
+
+    for conformer, future in zip(conformers, futures):
+        conformer.set_from_calculation(future.result(), single_point)
+
+    return None
@@ -0,0 +1,399 @@
+"""
+Vectorised repulsion + relaxation (RR) force field used to generate
+conformers
+
+V(x) = Σ_bonds k(d - d0)^2 + Σ_ij c/d^n
+
+the energy and gradient are evaluated together in a single pass over the
+atom pairs, and for steep (large n) repulsive terms only pairs within a cutoff
+are considered, using a neighbour list that is rebuilt only once atoms have
+moved far enough
+"""
+from functools import lru_cache
+import numpy as np
+from scipy.optimize import minimize
+from scipy.spatial import cKDTree
+from autode.bond_lengths import get_ideal_bond_length_matrix
+from autode.atoms import Atom
+
+
+# Repulsion is truncated at this distance (Å) if the exponent is at least
+# _min_cutoff_exponent, where c/d^n is negligible, and the neighbour list
+# includes pairs up to the cutoff plus the skin distance
+_cutoff = 4.0
+_skin = 1.0
+_min_cutoff_exponent = 6
+
+# Below this number of atoms all pairs are cheaper than a neighbour list
+_min_n_atoms_neighbour_list = 50
+
+
+@lru_cache(maxsize=32)
+def _get_topology(n_atoms, bonds, fixed_bonds):
+    """
+    Get the atom indexes of the bonded pairs and whether each is fixed.
+    Bonds to atoms that don't (yet) exist in a partial structure are skipped
+
+    Arguments:
+        n_atoms (int):
+        bonds (tuple(tuple(int))):
+        fixed_bonds (tuple(tuple(int))):
+
+    Returns:
+        (tuple(np.ndarray)): i, j and is_fixed arrays
+    """
+    pairs = {}
+    for i, j in bonds:
+        if i < n_atoms and j < n_atoms:
+            pairs[(min(i, j), max(i, j))] = False
+
+    for i, j in fixed_bonds:
+        if i < n_atoms and j < n_atoms:
+            pairs[(min(i, j), max(i, j))] = True
+
+    idxs = np.array(list(pairs.keys()), dtype=int).reshape(-1, 2)
+    is_fixed = np.array(list(pairs.values()), dtype=bool)
+
+    return idxs[:, 0], idxs[:, 1], is_fixed
+
+
+@lru_cache(maxsize=32)
+def _get_all_pairs(n_atoms):
+    """Indexes of all unique atom pairs i < j"""
+    return np.triu_indices(n_atoms, k=1)
+
+
+@lru_cache(maxsize=32)
+def _get_ideal_bond_lengths(labels, bonds):
+    """Ideal bond length matrix for a set of atom labels and bonds"""
+    atoms = [Atom(label) for label in labels]
+    return get_ideal_bond_length_matrix(atoms=atoms, bonds=bonds)
+
+
+def get_ideal_bond_lengths(species):
+    """
+    Get the matrix of ideal bond lengths (d0) for the bonds in the molecular
+    graph of a species, which is cached so generating many conformers of
+    the same species only generates it once
+
+    Arguments:
+        species (autode.species.Species):
+
+    Returns:
+        (np.ndarray): shape = (n_atoms, n_atoms)
+    """
+    d0 = _get_ideal_bond_lengths(tuple(atom.label for atom in species.atoms),
+                                 tuple(species.graph.edges))
+    return d0.copy()
+
+
+def _int_power(x, n):
+    """x^n for a positive integer n by repeated squaring, which is much
+    faster than np.power for arrays"""
+    result = None
+
+    while n > 0:
+        if n % 2 == 1:
+            result = x if result is None else result * x
+
+        n //= 2
+        if n > 0:
+            x = x * x
+
+    return result
+
+
+class RRForceField:
+
+    def _pairs(self, coords):
+        """
+        Get the atom pairs to evaluate the repulsion over, updating the
+        neighbour list if any atom has moved more than half the skin distance
+        since it was built
+
+        Arguments:
+            coords (np.ndarray): shape = (n_atoms, 3)
+
+        Returns:
+            (tuple(np.ndarray)): i and j indexes
+        """
+        if self.cutoff is None:
+            return _get_all_pairs(self.n_atoms)
+
+        if self._ref_coords is not None:
+            max_disp_sq = np.max(np.sum((coords - self._ref_coords)**2, axis=1))
+
+            if max_disp_sq < (0.5 * _skin)**2:
+                return self._neighbour_pairs
+
+        tree = cKDTree(coords)
+        pairs = tree.query_pairs(r=self.cutoff + _skin, output_type='ndarray')
+
+        self._ref_coords = coords.copy()
+        self._neighbour_pairs = (pairs[:, 0], pairs[:, 1])
+        return self._neighbour_pairs
+
+    def energy_and_gradient(self, flat_coords):
+        """
+        Calculate the energy and the gradient with respect to the coordinates
+        in a single pass
+
+        Arguments:
+            flat_coords (np.ndarray): shape = (3 x n_atoms,)
+
+        Returns:
+            (tuple(float, np.ndarray)): V and dV/dx with shape (3 x n_atoms,)
+        """
+        coords = flat_coords.reshape(self.n_atoms, 3)
+        pair_forces = []
+
+        # --------------------------- Repulsion -------------------------------
+        i, j = self._pairs(coords)
+        vec = coords[i] - coords[j]
+        d_sq = np.sum(vec * vec, axis=1)
+
+        if self.cutoff is not None:
+            in_range = d_sq < self.cutoff**2
+            i, j, vec, d_sq = i[in_range], j[in_range], vec[in_range], d_sq[in_range]
+
+        inv_d_sq = 1.0 / d_sq
+        if self.exponent % 2 == 0:
+            inv_d_n = _int_power(inv_d_sq, self.exponent // 2)
+        else:
+            inv_d_n = _int_power(np.sqrt(inv_d_sq), self.exponent)
+
+        energy = self.c * (np.sum(inv_d_n) - len(inv_d_n) * self._shift)
+
+        # d/dx_i c/d^n = -n c (x_i - x_j) / d^(n+2)
+        pair_forces.append((i, j, -self.exponent * self.c * inv_d_n * inv_d_sq, vec))
+
+        # ---------------------------- Bonds ----------------------------------
+        if len(self._bond_i) > 0:
+            vec = coords[self._bond_i] - coords[self._bond_j]
+            d = np.sqrt(np.sum(vec * vec, axis=1))
+            delta = d - self._bond_d0
+
+            energy += np.sum(self._bond_k * delta * delta)
+
+            # d/dx_i k(d - d0)^2 = 2k(d - d0)(x_i - x_j) / d
+            pair_forces.append((self._bond_i, self._bond_j,
+                                2.0 * self._bond_k * delta / d, vec))
+
+        grad = np.zeros((self.n_atoms, 3))
+        for i, j, prefactor, vec in pair_forces:
+            for dim in range(3):
+                component = prefactor * vec[:, dim]
+                grad[:, dim] += (np.bincount(i, weights=component,
+                                             minlength=self.n_atoms)
+                                 - np.bincount(j, weights=component,
+                                               minlength=self.n_atoms))
+
+        return energy, grad.reshape(-1)
+
+    def energy(self, coords):
+        """Energy of a set of coordinates with shape (n_atoms, 3)"""
+        return self.energy_and_gradient(np.asarray(coords, dtype=float).reshape(-1))[0]
+
+    def energies_and_gradients(self, coords):
+        """
+        Calculate the energies and gradients of a batch of structures with
+        the same atoms and bonds, evaluated together over all atom pairs
+
+        Arguments:
+            coords (np.ndarray): shape = (n_structures, n_atoms, 3)
+
+        Returns:
+            (tuple(np.ndarray)): V with shape (n_structures,) and dV/dx with
+                                 shape (n_structures, n_atoms, 3)
+        """
+        n_structures = len(coords)
+        energies = np.zeros(n_structures)
+        grad = np.zeros((n_structures, self.n_atoms, 3))
+
+        # Offset the atom indexes of each structure so the gradient of all of
+        # them can be accumulated at once
+        offsets = self.n_atoms * np.arange(n_structures)[:, np.newaxis]
+        flat_grad = grad.reshape(-1, 3)
+
+        def add_pair_gradient(i, j, prefactor, vec):
+            """Add the gradient from pairwise terms to both atoms"""
+            i, j = (i + offsets).ravel(), (j + offsets).ravel()
+
+            for dim in range(3):
+                component = (prefactor * vec[:, :, dim]).ravel()
+                flat_grad[:, dim] += (np.bincount(i, weights=component,
+                                                  minlength=len(flat_grad))
+                                      - np.bincount(j, weights=component,
+                                                    minlength=len(flat_grad)))
+
+        # --------------------------- Repulsion -------------------------------
+        i, j = _get_all_pairs(self.n_atoms)
+        vec = coords[:, i] - coords[:, j]
+        inv_d_sq = 1.0 / np.sum(vec * vec, axis=2)
+
+        if self.exponent % 2 == 0:
+            inv_d_n = _int_power(inv_d_sq, self.exponent // 2)
+        else:
+            inv_d_n = _int_power(np.sqrt(inv_d_sq), self.exponent)
+
+        if self.cutoff is not None:
+            in_range = inv_d_sq > 1.0 / self.cutoff**2
+            inv_d_n = np.where(in_range, inv_d_n, 0.0)
+            energies -= self.c * self._shift * np.sum(in_range, axis=1)
+
+        energies += self.c * np.sum(inv_d_n, axis=1)
+        add_pair_gradient(i, j, -self.exponent * self.c * inv_d_n * inv_d_sq,
+                          vec)
+
+        # ---------------------------- Bonds ----------------------------------
+        if len(self._bond_i) > 0:
+            vec = coords[:, self._bond_i] - coords[:, self._bond_j]
+            d = np.sqrt(np.sum(vec * vec, axis=2))
+            delta = d - self._bond_d0
+
+            energies += np.sum(self._bond_k * delta * delta, axis=1)
+            add_pair_gradient(self._bond_i, self._bond_j,
+                              2.0 * self._bond_k * delta / d, vec)
+
+        return energies, grad
+
+    def minimise(self, coords, tol):
+        """
+        Minimise the energy with respect to the coordinates using a conjugate
+        gradient method
+
+        Arguments:
+            coords (np.ndarray): Initial coordinates, shape = (n_atoms, 3)
+            tol (float): Tolerance on the minimisation
+
+        Returns:
+            (np.ndarray): Optimised coordinates, shape = (n_atoms, 3)
+        """
+        self._ref_coords = None
+
+        res = minimize(self.energy_and_gradient,
+                       x0=np.array(coords, dtype=float).reshape(-1),
+                       jac=True,
+                       method='CG',
+                       tol=tol)
+
+        return res.x.reshape(self.n_atoms, 3)
+
+    def minimise_batch(self, coords, tol, max_restarts=10):
+        """
+        Minimise the energies of a batch of structures together. As the
+        structures are independent the total energy is minimised, until the
+        largest gradient component of every structure is below the tolerance.
+        Structures that have not converged when the minimiser stops e.g. on a
+        line search that can't lower the total energy any further, are
+        minimised again without the others
+
+        Arguments:
+            coords (np.ndarray): Initial coordinates,
+                                 shape = (n_structures, n_atoms, 3)
+            tol (float): Tolerance on the largest gradient component
+
+        Keyword Arguments:
+            max_restarts (int): Maximum number of times to restart the
+                                unconverged structures
+
+        Returns:
+            (np.ndarray): Optimised coordinates,
+                          shape = (n_structures, n_atoms, 3)
+        """
+        coords = np.array(coords, dtype=float)
+        unconverged = np.arange(len(coords))
+
+        for _ in range(max_restarts + 1):
+            shape = (len(unconverged), self.n_atoms, 3)
+
+            def energy_and_gradient(flat_coords):
+                energies, grad = self.energies_and_gradients(flat_coords.reshape(shape))
+                return np.sum(energies), grad.reshape(-1)
+
+            # Only stop on the gradient, as the change in the total energy
+            # can be small while a single structure is far from converged
+            res = minimize(energy_and_gradient,
+                           x0=coords[unconverged].reshape(-1),
+                           jac=True,
+                           method='L-BFGS-B',
+                           options={'gtol': tol, 'ftol': 0.0,
+                                    'maxiter': 10000})
+
+            coords[unconverged] = res.x.reshape(shape)
+
+            max_grads = np.max(np.abs(self.energies_and_gradients(
+                coords[unconverged])[1]), axis=(1, 2))
+            unconverged = unconverged[max_grads > tol]
+
+            if len(unconverged) == 0:
+                break
+
+        return coords
+
+    def __init__(self, n_atoms, bonds, fixed_bonds, d0, k, c, exponent=8,
+                 cutoff=None):
+        """
+        Repulsion + relaxation force field for a set of atoms
+
+        Arguments:
+            n_atoms (int):
+            bonds (list(tuple(int))): List of bonds
+            fixed_bonds (list(tuple(int))): List of constrained bonds will use
+                                            10 as the harmonic force constant
+            d0 (np.ndarray): Ideal bond lengths, shape = (n_atoms, n_atoms)
+            k (float): Harmonic force constant
+            c (float): Repulsion coefficient
+
+        Keyword Arguments:
+            exponent (int): Exponent in the repulsive pairwise term
+            cutoff (float | None): Distance beyond which the repulsion is
+                                   neglected. If None all pairs are included
+        """
+        self.n_atoms = int(n_atoms)
+        self.k = float(k)
+        self.c = float(c)
+        self.exponent = int(exponent)
+        self.cutoff = cutoff
+
+        # Shift the repulsion so the energy is continuous at the cutoff
+        self._shift = 0.0 if cutoff is None else 1.0 / cutoff**self.exponent
+
+        bond_i, bond_j, is_fixed = _get_topology(self.n_atoms,
+                                                 tuple(map(tuple, bonds)),
+                                                 tuple(map(tuple, fixed_bonds)))
+        self._bond_i, self._bond_j = bond_i, bond_j
+        self._bond_d0 = np.asarray(d0)[bond_i, bond_j]
+        self._bond_k = np.where(is_fixed, 10.0, self.k)
+
+        # Neighbour list and the coordinates it was built from
+        self._ref_coords = None
+        self._neighbour_pairs = None
+
+
+def get_rr_force_field(n_atoms, bonds, fixed_bonds, d0, k, c, exponent=8):
+    """
+    Get a repulsion + relaxation force field, using a cutoff on the
+    repulsion only if it is steep enough to be negligible beyond the cutoff
+    and there are enough atoms for a neighbour list to be worthwhile
+
+    Arguments:
+        n_atoms (int):
+        bonds (list(tuple(int))):
+        fixed_bonds (list(tuple(int))):
+        d0 (np.ndarray): shape = (n_atoms, n_atoms)
+        k (float):
+        c (float):
+
+    Keyword Arguments:
+        exponent (int):
+
+    Returns:
+        (autode.conformers.rr_ff.RRForceField):
+    """
+    use_cutoff = (exponent >= _min_cutoff_exponent
+                  and n_atoms >= _min_n_atoms_neighbour_list)
+
+    return RRForceField(n_atoms, bonds, fixed_bonds, d0, k, c,
+                        exponent=exponent,
+                        cutoff=_cutoff if use_cutoff else None)
@@ -102,3 +102,7 @@ class CouldNotPlotSmoothProfile(Exception):
 
 class TemplateLoadingFailed(Exception):
     pass
+
+
+class SerialisationFailed(Exception):
+    pass
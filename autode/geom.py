@@ -77,6 +77,32 @@ def get_atoms_linear_interp(atoms, bonds, final_distances):
     return atoms
 
 
+def get_rot_mat_euler(axis, theta):
+    """
+    Compute the 3D rotation matrix using the Euler Rodrigues formula
+    https://en.wikipedia.org/wiki/Euler–Rodrigues_formula
+    for an anticlockwise rotation of theta radians about a given axis
+
+    Arguments:
+        axis (np.ndarray): Axis to rotate in. shape = (3,)
+        theta (float): Angle in radians (float)
+
+    Returns:
+        (np.ndarray): Rotation matrix. shape = (3, 3)
+    """
+    axis = np.asarray(axis)
+    axis = axis / np.linalg.norm(axis)
+
+    a = np.cos(theta / 2.0)
+    b, c, d = -axis * np.sin(theta / 2.0)
+    aa, bb, cc, dd = a * a, b * b, c * c, d * d
+    bc, ad, ac, ab, bd, cd = b * c, a * d, a * c, a * b, b * d, c * d
+
+    return np.array([[aa + bb - cc - dd, 2 * (bc + ad), 2 * (bd - ac)],
+                     [2 * (bc - ad), aa + cc - bb - dd, 2 * (cd + ab)],
+                     [2 * (bd + ac), 2 * (cd - ab), aa + dd - bb - cc]])
+
+
 def get_rot_mat_kabsch(p_matrix, q_matrix):
     """
     Get the optimal rotation matrix with the Kabsch algorithm. Notation is from
@@ -104,7 +130,7 @@ def get_centered_matrix(mat):
     """For a list of coordinates n.e. a n_atoms x 3 matrix as a np array
     translate to the center of the coordinates"""
     centroid = np.average(mat, axis=0)
-    return np.array([coord - centroid for coord in mat])
+    return np.asarray(mat) - centroid
 
 
 def get_neighbour_list(species, atom_i):
@@ -204,7 +230,7 @@ def calc_rmsd(coords1, coords2):
     # Get the optimum rotation matrix
     rot_mat = get_rot_mat_kabsch(p_mat_trans, q_mat_trans)
 
-    fitted_coords = np.array([np.matmul(rot_mat, coord - p) + q for coord in coords2])
+    fitted_coords = np.matmul(coords2 - p, rot_mat.T) + q
     return np.sqrt(np.average(np.square(fitted_coords - coords1)))
 
 
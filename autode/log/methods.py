@@ -12,6 +12,9 @@ class ComputationalMethods:
 
         return None
 
+    def __iter__(self):
+        return iter(self._list)
+
     def __repr__(self):
         return self.__str__()
 
@@ -1,17 +1,22 @@
 from copy import deepcopy
+from weakref import WeakKeyDictionary
+import hashlib
 import itertools
-import signal
+import time
 from networkx.algorithms import isomorphism
 import networkx as nx
 import numpy as np
 import autode.exceptions as ex
-from scipy.spatial import distance_matrix
+from scipy.spatial import cKDTree
 from autode.atoms import get_maximal_valance
 from autode.atoms import is_pi_atom
 from autode.bond_lengths import get_avg_bond_length
 from autode.log import logger
 from autode.atoms import get_atomic_weight
 
+# Weisfeiler-Lehman colours of graphs, with the graph state they are valid for
+_graph_colours = WeakKeyDictionary()
+
 
 def make_graph(species, rel_tolerance=0.25, bond_list=None,
                allow_invalid_valancies=False):
@@ -55,37 +60,74 @@ def make_graph(species, rel_tolerance=0.25, bond_list=None,
         return None
 
     else:
-        # Loop over the unique pairs of atoms and add 'bonds'
-        coordinates = species.get_coordinates()
-        dist_mat = distance_matrix(coordinates, coordinates)
+        # Add 'bonds' between close atoms, in the same order as iterating
+        # through the closest atoms to each atom sorted by type
+        graph.add_edges_from(get_bonded_pairs(species, rel_tolerance),
+                             pi=False, active=False)
 
-        for i in get_atom_ids_sorted_type(species):
+    species.graph = graph
+    set_graph_attributes(species)
 
-            # Iterate through the closest atoms to atom i
-            for j in np.argsort(dist_mat[i]):
+    if not allow_invalid_valancies:
+        remove_bonds_invalid_valancies(species)
 
-                if i == j:
-                    # Don't bond atoms to themselves
-                    continue
+    return None
 
-                # Get r_avg for this X-Y bond e.g. C-C -> 1.5
-                avg_bond_length = get_avg_bond_length(species.atoms[i].label,
-                                                      species.atoms[j].label)
 
-                # If the distance between atoms i and j are less or equal to
-                # 1.25x average length add a 'bond'
-                if (dist_mat[i, j] <= avg_bond_length * (1.0 + rel_tolerance)
-                        and (i, j) not in graph.edges):
+def get_bonded_pairs(species, rel_tolerance=0.25):
+    """
+    Get the pairs of atoms that are close enough to be considered bonded i.e.
+    the distance between atoms i and j is less or equal to (1 + rel_tolerance)
+    times the average X-Y bond length. Only atoms within the largest of these
+    cutoffs are found, using a KD-tree, so this scales ~O(N) with the number
+    of atoms
 
-                    graph.add_edge(i, j, pi=False, active=False)
+    Pairs are ordered by atom i, sorted by type, then by increasing distance
+    to atom j, and each bond is present as both (i, j) and (j, i)
 
-    species.graph = graph
-    set_graph_attributes(species)
+    Arguments:
+        species (autode.species.Species):
 
-    if not allow_invalid_valancies:
-        remove_bonds_invalid_valancies(species)
+    Keyword Arguments:
+        rel_tolerance (float):
 
-    return None
+    Returns:
+        (list(tuple(int))):
+    """
+    coordinates = species.get_coordinates()
+    labels = [atom.label for atom in species.atoms]
+
+    # Lookup table of average bond lengths between all the unique labels
+    unique_labels = sorted(set(labels))
+    types = np.array([unique_labels.index(label) for label in labels])
+    avg_bond_lengths = np.array([[get_avg_bond_length(label_i, label_j)
+                                  for label_j in unique_labels]
+                                 for label_i in unique_labels])
+
+    # Atoms i and j are checked in both orders, so use the larger length
+    max_lengths = (1.0 + rel_tolerance) * np.maximum(avg_bond_lengths,
+                                                     avg_bond_lengths.T)
+
+    tree = cKDTree(coordinates)
+    pairs = tree.query_pairs(r=np.max(max_lengths), output_type='ndarray')
+
+    if len(pairs) == 0:
+        return []
+
+    i, j = pairs[:, 0], pairs[:, 1]
+    dists = np.linalg.norm(coordinates[i] - coordinates[j], axis=1)
+    is_bonded = dists <= max_lengths[types[i], types[j]]
+
+    i, j, dists = i[is_bonded], j[is_bonded], dists[is_bonded]
+    i, j = np.concatenate((i, j)), np.concatenate((j, i))
+    dists = np.concatenate((dists, dists))
+
+    # Position of each atom in the list of atoms sorted by type
+    ranks = np.empty(species.n_atoms, dtype=int)
+    ranks[get_atom_ids_sorted_type(species)] = np.arange(species.n_atoms)
+
+    order = np.lexsort((dists, ranks[i]))
+    return list(zip(i[order].tolist(), j[order].tolist()))
 
 
 def get_atom_ids_sorted_type(species):
@@ -163,6 +205,7 @@ def set_graph_attributes(species):
     logger.info('Setting the stereocentres in a species')
     # List of atom indexes that are rings in the species
     rings = find_cycles(species.graph)
+    invariants = get_substituent_invariants(species.graph)
 
     for (i, j) in species.graph.edges:
 
@@ -173,12 +216,12 @@ def set_graph_attributes(species):
             # The ring should define the stereochemistry of this pi bond
             continue
 
-        if is_chiral_pi_bond(species, bond=(i, j)):
+        if is_chiral_pi_bond(species, bond=(i, j), invariants=invariants):
             species.graph.nodes[i]['stereo'] = True
             species.graph.nodes[j]['stereo'] = True
 
     for i in range(species.n_atoms):
-        if is_chiral_atom(species, atom_index=i):
+        if is_chiral_atom(species, atom_index=i, invariants=invariants):
             species.graph.nodes[i]['stereo'] = True
 
     return None
@@ -248,7 +291,43 @@ def species_are_isomorphic(species1, species2):
     return False
 
 
-def graph_matcher(graph1, graph2):
+class DeadlineGraphMatcher(isomorphism.GraphMatcher):
+    """
+    Graph matcher that raises TimeoutError once a deadline has passed. The
+    deadline is checked at every step of the VF2 search, so unlike a signal
+    based timeout this works from any thread or process
+    """
+
+    def syntactic_feasibility(self, G1_node, G2_node):
+        """Check the deadline before each candidate pair is tested"""
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise TimeoutError
+
+        return super().syntactic_feasibility(G1_node, G2_node)
+
+    def __init__(self, graph1, graph2, node_match=None, edge_match=None,
+                 timeout=None):
+        """
+        Arguments:
+            graph1 (nx.Graph):
+            graph2 (nx.Graph):
+
+        Keyword Arguments:
+            node_match (callable | None):
+            edge_match (callable | None):
+            timeout (float | None): Time in seconds after which matching
+                                    raises TimeoutError. None for no limit
+        """
+        super().__init__(graph1, graph2,
+                         node_match=node_match, edge_match=edge_match)
+
+        self.deadline = None
+
+        if timeout is not None:
+            self.deadline = time.monotonic() + timeout
+
+
+def graph_matcher(graph1, graph2, timeout=None):
     """
     Generate a networkX graph matcher between two graphs, matching on atom
     types and active bonds
@@ -257,8 +336,12 @@ def graph_matcher(graph1, graph2):
         graph1 (nx.Graph):
         graph2 (nx.Graph):
 
+    Keyword Arguments:
+        timeout (float | None): Time in seconds after which matching raises
+                                TimeoutError
+
     Returns:
-        (nx.GraphMatcher)
+        (autode.mol_graphs.DeadlineGraphMatcher)
     """
     # Match based on atom type with a default of carbon if unassigned
     node_match = isomorphism.categorical_node_match('atom_label', 'C')
@@ -266,13 +349,14 @@ def graph_matcher(graph1, graph2):
     # Match on active edges too, with the default being false
     edge_match = isomorphism.categorical_edge_match('active', False)
 
-    gm = isomorphism.GraphMatcher(graph1, graph2,
-                                  node_match=node_match,
-                                  edge_match=edge_match)
+    gm = DeadlineGraphMatcher(graph1, graph2,
+                              node_match=node_match,
+                              edge_match=edge_match,
+                              timeout=timeout)
     return gm
 
 
-def is_subgraph_isomorphic(larger_graph, smaller_graph):
+def is_subgraph_isomorphic(larger_graph, smaller_graph, timeout=5):
     """
     Is the smaller graph subgraph isomorphic to the larger graph?
 
@@ -280,19 +364,25 @@ def is_subgraph_isomorphic(larger_graph, smaller_graph):
         larger_graph (nx.Graph):
         smaller_graph (nx.Graph):
 
+    Keyword Arguments:
+        timeout (float): Timeout in seconds
+
     Returns:
         (bool)
     """
     logger.info('Running subgraph isomorphism')
 
-    gm = graph_matcher(larger_graph, smaller_graph)
-    if gm.subgraph_is_isomorphic():
-        return True
+    gm = graph_matcher(larger_graph, smaller_graph, timeout=timeout)
 
-    return False
+    try:
+        return gm.subgraph_is_isomorphic()
 
+    except TimeoutError:
+        logger.error('NX subgraph matching timed out')
+        return False
 
-def get_mapping_ts_template(larger_graph, smaller_graph):
+
+def get_mapping_ts_template(larger_graph, smaller_graph, timeout=None):
     """
     Find the mapping for a graph onto a TS template (smaller). Can raise
     StopIteration with no match!
@@ -301,12 +391,16 @@ def get_mapping_ts_template(larger_graph, smaller_graph):
         larger_graph (nx.Graph):
         smaller_graph (nx.Graph):
 
+    Keyword Arguments:
+        timeout (float | None): Time in seconds after which TimeoutError is
+                                raised. None for no limit
+
     Returns:
         (dict): Mapping
     """
     logger.info('Getting mapping of molecule onto the TS template')
 
-    gm = graph_matcher(larger_graph, smaller_graph)
+    gm = graph_matcher(larger_graph, smaller_graph, timeout=timeout)
 
     return next(gm.match())
 
@@ -405,9 +499,93 @@ def get_graphs_ignoring_active_edges(graph1, graph2):
     return g1, g2
 
 
+class WLGraphMatcher(DeadlineGraphMatcher):
+    """
+    Graph matcher that only pairs nodes with the same Weisfeiler-Lehman
+    colour. Any isomorphism must preserve these colours, so this prunes the
+    VF2 search without changing its result
+    """
+
+    def semantic_feasibility(self, G1_node, G2_node):
+        """Nodes are only feasible if they have the same colour"""
+        if self.colours1[G1_node] != self.colours2[G2_node]:
+            return False
+
+        return super().semantic_feasibility(G1_node, G2_node)
+
+    def __init__(self, graph1, graph2, node_match=None, edge_match=None,
+                 timeout=None):
+        super().__init__(graph1, graph2, node_match=node_match,
+                         edge_match=edge_match, timeout=timeout)
+
+        self.colours1 = get_graph_colours(graph1)
+        self.colours2 = get_graph_colours(graph2)
+
+
+def _graph_state(graph):
+    """Atom labels, edges and active flags, which a hash is invalid without"""
+    return (tuple(graph.nodes(data='atom_label', default='C')),
+            tuple(graph.edges(data='active', default=False)))
+
+
+def get_graph_colours(graph, n_iterations=3):
+    """
+    Get the Weisfeiler-Lehman colour of each node in a graph, starting from
+    the atom labels and refining by the colours of the neighbours and whether
+    the bonds to them are active. Colours are cached on the graph until it
+    is modified
+
+    Arguments:
+        graph (nx.Graph):
+
+    Keyword Arguments:
+        n_iterations (int): Number of refinement iterations
+
+    Returns:
+        (dict): Node -> colour (str)
+    """
+    state = _graph_state(graph)
+    cached = _graph_colours.get(graph, None)
+
+    if cached is not None and cached[0] == state:
+        return cached[1]
+
+    def digest(string):
+        return hashlib.blake2b(string.encode(), digest_size=16).hexdigest()
+
+    colours = {node: digest(f'{label}') for node, label in state[0]}
+
+    for _ in range(n_iterations):
+        colours = {node: digest(colours[node] + ''.join(sorted(
+                   f'{graph.edges[node, nbr].get("active", False)}'
+                   f'{colours[nbr]}' for nbr in graph.neighbors(node))))
+                   for node in graph.nodes}
+
+    _graph_colours[graph] = (state, colours)
+    return colours
+
+
+def get_graph_hash(graph):
+    """
+    Canonical hash of a graph, which is the same for isomorphic graphs with
+    the same atom labels and active bonds. Different hashes mean the graphs
+    are not isomorphic, while the same hash means they very likely are
+
+    Arguments:
+        graph (nx.Graph):
+
+    Returns:
+        (str):
+    """
+    colours = get_graph_colours(graph)
+    return hashlib.blake2b(''.join(sorted(colours.values())).encode(),
+                           digest_size=16).hexdigest()
+
+
 def is_isomorphic(graph1, graph2, ignore_active_bonds=False, timeout=5):
     """Check whether two NX graphs are isomorphic. Contains a timeout because
-    the gm.is_isomorphic() method occasionally gets stuck
+    the gm.is_isomorphic() method occasionally gets stuck. The timeout is a
+    deadline checked during matching, so this can be called from any thread
 
     Arguments:
         graph1 (nx.Graph): graph 1
@@ -427,32 +605,29 @@ def is_isomorphic(graph1, graph2, ignore_active_bonds=False, timeout=5):
     if not isomorphism.faster_could_be_isomorphic(graph1, graph2):
         return False
 
+    # Graphs with different canonical hashes cannot be isomorphic, while the
+    # same hash needs to be confirmed by matching
+    if get_graph_hash(graph1) != get_graph_hash(graph2):
+        return False
+
     # Always match on atom types
     node_match = isomorphism.categorical_node_match('atom_label', 'C')
 
     if ignore_active_bonds:
-        gm = isomorphism.GraphMatcher(graph1, graph2,
-                                      node_match=node_match)
+        gm = WLGraphMatcher(graph1, graph2, node_match=node_match,
+                            timeout=timeout)
 
     else:
         # Also match on edges
         edge_match = isomorphism.categorical_edge_match('active', False)
-        gm = isomorphism.GraphMatcher(graph1, graph2,
-                                      node_match=node_match,
-                                      edge_match=edge_match)
+        gm = WLGraphMatcher(graph1, graph2,
+                            node_match=node_match,
+                            edge_match=edge_match,
+                            timeout=timeout)
 
-    # NX can hang here for not very large graphs, so kill after a timeout
-
-    def handler(signum, frame):
-        raise TimeoutError
-
-    signal.signal(signal.SIGALRM, handler)
-    signal.alarm(int(timeout))
+    # NX can hang here for not very large graphs, so stop after a timeout
     try:
-        result = gm.is_isomorphic()
-        # Cancel the timer
-        signal.alarm(0)
-        return result
+        return gm.is_isomorphic()
 
     except TimeoutError:
         logger.error('NX graph matching hanging')
@@ -493,7 +668,7 @@ def reac_graph_to_prod_graph(reac_graph, bond_rearrang):
         (nx.Graph): Graph of the product with each atom indexed as in the
                     reactants
     """
-    prod_graph = deepcopy(reac_graph)
+    prod_graph = reac_graph.copy()
 
     for fbond in bond_rearrang.fbonds:
         prod_graph.add_edge(*fbond)
@@ -584,22 +759,23 @@ def get_fbonds(graph, key):
     Returns:
         list: list of bonds that can be made of this type
     """
-    possible_fbonds = []
-    bonds = list(graph.edges)
-    for i in graph.nodes:
-        for j in graph.nodes:
-            if i > j:
-                continue
+    labels = dict(graph.nodes(data='atom_label'))
+    nodes = list(graph.nodes)
 
-            if not (i, j) in bonds and not (j, i) in bonds:
-                bond = (i, j)
-                label_i = graph.nodes[bond[0]]['atom_label']
-                label_j = graph.nodes[bond[1]]['atom_label']
+    # Atoms that atoms with each label can form this type of bond to
+    partners = {}
+    for label in set(labels.values()):
+        partner_labels = [other for other in set(labels.values())
+                          if key in (label + other, other + label)]
+        partners[label] = [j for j in nodes if labels[j] in partner_labels]
 
-                key1, key2 = label_i + label_j, label_j + label_i
+    possible_fbonds = []
+    for i in nodes:
+        for j in partners[labels[i]]:
 
-                if key1 == key or key2 == key:
-                    possible_fbonds.append(bond)
+            # Atoms can't bond to themselves or form bonds they already have
+            if i < j and not graph.has_edge(i, j):
+                possible_fbonds.append((i, j))
 
     return possible_fbonds
 
@@ -689,9 +865,137 @@ def get_truncated_active_mol_graph(graph, active_bonds=None):
     return t_graph
 
 
-def is_chiral_pi_bond(species, bond):
+def get_substituent_invariants(graph):
+    """
+    Get an invariant of the group bonded to an atom through each bond, for
+    every bond in a graph in both directions. The group bonded to atom i
+    through the bond to atom j is the connected component containing j once
+    the i-j bond is removed, and its invariant is the number of atoms of
+    each type in it. Isomorphic groups have the same invariant, so groups
+    with different invariants cannot be the same
+
+    Compositions are accumulated up a depth first search tree, as bridges
+    are always tree edges, so this is O(N) for a graph with N atoms rather
+    than copying and splitting the graph for every bond
+
+    Arguments:
+        graph (nx.Graph):
+
+    Returns:
+        (dict): (i, j) -> (tuple(int))
+    """
+    labels = dict(graph.nodes(data='atom_label', default='C'))
+    label_idxs = {label: k
+                  for k, label in enumerate(sorted(set(labels.values())))}
+
+    def composition(node):
+        counts = np.zeros(len(label_idxs), dtype=int)
+        counts[label_idxs[labels[node]]] = 1
+        return counts
+
+    invariants = {}
+
+    for nodes in nx.connected_components(graph):
+        subgraph = graph.subgraph(nodes)
+        root = next(iter(nodes))
+
+        # Composition of the subtree below each node in a DFS tree
+        parents = nx.dfs_predecessors(subgraph, source=root)
+        subtree = {node: composition(node) for node in nodes}
+        for node in nx.dfs_postorder_nodes(subgraph, source=root):
+            if node in parents:
+                subtree[parents[node]] += subtree[node]
+
+        total = tuple(subtree[root].tolist())
+        bridges = set(nx.bridges(subgraph))
+
+        for (i, j) in subgraph.edges:
+            for (a, b) in ((i, j), (j, i)):
+
+                if (i, j) not in bridges and (j, i) not in bridges:
+                    # Removing a bond in a ring does not split the graph
+                    invariants[(a, b)] = total
+
+                elif parents.get(b, None) == a:
+                    invariants[(a, b)] = tuple(subtree[b].tolist())
+
+                else:
+                    invariants[(a, b)] = tuple((np.array(total)
+                                                - subtree[a]).tolist())
+
+    return invariants
+
+
+def get_substituent_graph(graph, atom, neighbour):
+    """
+    Get the group bonded to an atom through the bond to a neighbour, as the
+    connected component containing the neighbour once the bond is removed
+
+    Arguments:
+        graph (nx.Graph):
+        atom (int):
+        neighbour (int):
+
+    Returns:
+        (nx.Graph):
+    """
+    nodes, stack = {neighbour}, [neighbour]
+
+    while len(stack) > 0:
+        node = stack.pop()
+
+        for other in graph.neighbors(node):
+            if (node, other) in ((neighbour, atom), (atom, neighbour)):
+                continue
+
+            if other not in nodes:
+                nodes.add(other)
+                stack.append(other)
+
+    subgraph = graph.subgraph(nodes).copy()
+
+    if subgraph.has_edge(atom, neighbour):
+        subgraph.remove_edge(atom, neighbour)
+
+    return subgraph
+
+
+def _have_equivalent_groups(graph, atom, neighbours, invariants):
+    """Are any of the groups bonded to an atom through the bonds to the
+    neighbours the same? Only groups with the same invariants are checked
+    for an isomorphism"""
+    groups = {}
+
+    def group(neighbour):
+        if neighbour not in groups:
+            groups[neighbour] = get_substituent_graph(graph, atom, neighbour)
+
+        return groups[neighbour]
+
+    for n_i, n_j in itertools.combinations(neighbours, 2):
+        if invariants[(atom, n_i)] != invariants[(atom, n_j)]:
+            continue
+
+        if is_isomorphic(group(n_i), group(n_j), ignore_active_bonds=True):
+            return True
+
+    return False
+
+
+def is_chiral_pi_bond(species, bond, invariants=None):
     """Determine if a pi bond is chiral, by seeing if either atom has the same
-     group bonded to it twice"""
+     group bonded to it twice
+
+    Arguments:
+        species (autode.species.Species):
+        bond (tuple(int)):
+
+    Keyword Arguments:
+        invariants (dict | None): Substituent invariants of the graph, see
+                                  get_substituent_invariants()
+    """
+    if invariants is None:
+        invariants = get_substituent_invariants(species.graph)
 
     for i, atom in enumerate(bond):
         neighbours = list(species.graph.neighbors(atom))
@@ -700,36 +1004,32 @@ def is_chiral_pi_bond(species, bond):
         if len(neighbours) != 2:
             return False
 
-        graphs = []
-        for neighbour in neighbours:
-            graph = species.graph.copy()
-            graph.remove_edge(atom, neighbour)
-            split_subgraphs = get_separate_subgraphs(graph)
-            graphs.append([subgraph for subgraph in split_subgraphs if neighbour in list(subgraph.nodes())][0])
-
-        if is_isomorphic(graphs[0], graphs[1], ignore_active_bonds=True):
+        if _have_equivalent_groups(species.graph, atom, neighbours,
+                                   invariants):
             return False
 
     return True
 
 
-def is_chiral_atom(species, atom_index):
+def is_chiral_atom(species, atom_index, invariants=None):
     """Determine if an atom is chiral, by seeing if any of the bonded groups
-    are the same"""
+    are the same
+
+    Arguments:
+        species (autode.species.Species):
+        atom_index (int):
+
+    Keyword Arguments:
+        invariants (dict | None): Substituent invariants of the graph, see
+                                  get_substituent_invariants()
+    """
     neighbours = list(species.graph.neighbors(atom_index))
 
     if len(neighbours) != 4:
         return False
 
-    graphs = []
-    for neighbour in neighbours:
-        graph = species.graph.copy()
-        graph.remove_edge(atom_index, neighbour)
-        split_subgraphs = get_separate_subgraphs(graph)
-        graphs.append([subgraph for subgraph in split_subgraphs if neighbour in list(subgraph.nodes())][0])
-
-    for graph1, graph2 in itertools.combinations(graphs, 2):
-        if is_isomorphic(graph1, graph2, ignore_active_bonds=True):
-            return False
+    if invariants is None:
+        invariants = get_substituent_invariants(species.graph)
 
-    return True
+    return not _have_equivalent_groups(species.graph, atom_index, neighbours,
+                                       invariants)
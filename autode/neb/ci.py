@@ -0,0 +1,257 @@
+"""
+Climbing image nudged elastic band optimised with FIRE. Notation from:
+Henkelman, Uberuaga and H. J ́onsson, J. Chem. Phys. 113, 9901 (2000) and
+Bitzek et al., Phys. Rev. Lett. 97, 170201 (2006)
+"""
+import numpy as np
+from autode.log import logger
+from autode.neb.original import NEB, ImageExecutor
+from autode.neb.original import energy_gradient, get_forces
+from autode.utils import work_in
+
+
+class FIRE:
+
+    def step(self, forces):
+        """
+        Get the displacement of the coordinates given the forces on them
+
+        Arguments:
+            forces (np.ndarray): Flat array of forces, in Ha Å-1
+
+        Returns:
+            (np.ndarray): Displacement in Å
+        """
+        if self.velocity is None:
+            self.velocity = np.zeros_like(forces)
+
+        power = np.dot(forces, self.velocity)
+
+        if power < 0:
+            # Going uphill, so stop and restart with a smaller time step
+            self.velocity[:] = 0.0
+            self.dt *= self.f_dec
+            self.alpha = self.alpha_start
+            self.n_positive = 0
+
+        else:
+            # Not uphill, which includes starting from rest with zero power
+            f_norm = np.linalg.norm(forces)
+            if f_norm > 0:
+                self.velocity = ((1.0 - self.alpha) * self.velocity
+                                 + self.alpha * np.linalg.norm(self.velocity)
+                                 * forces / f_norm)
+
+            if self.n_positive > self.n_min:
+                self.dt = min(self.dt * self.f_inc, self.dt_max)
+                self.alpha *= self.f_alpha
+
+            self.n_positive += 1
+
+        self.velocity += self.dt * forces
+        displacement = self.dt * self.velocity
+
+        # Restrict the largest step, in the direction of the displacement
+        max_displacement = np.max(np.abs(displacement))
+        if max_displacement > self.max_step:
+            displacement *= self.max_step / max_displacement
+
+        return displacement
+
+    def __init__(self, dt=0.5, dt_max=3.0, max_step=0.2, n_min=5,
+                 f_inc=1.1, f_dec=0.5, alpha_start=0.1, f_alpha=0.99):
+        """
+        Fast inertial relaxation engine (FIRE), with unit masses
+
+        Keyword Arguments:
+            dt (float): Initial time step
+            dt_max (float): Maximum time step
+            max_step (float): Maximum displacement of a coordinate (Å)
+            n_min (int): Number of steps downhill before increasing dt
+            f_inc (float): Factor to increase dt by
+            f_dec (float): Factor to decrease dt by going uphill
+            alpha_start (float): Initial velocity mixing parameter
+            f_alpha (float): Factor to decrease alpha by
+        """
+        self.dt = dt
+        self.dt_max = dt_max
+        self.max_step = max_step
+        self.n_min = n_min
+        self.f_inc = f_inc
+        self.f_dec = f_dec
+        self.alpha_start = alpha_start
+        self.f_alpha = f_alpha
+
+        self.alpha = alpha_start
+        self.n_positive = 0
+        self.velocity = None
+
+
+class CINEB(NEB):
+
+    def spring_constants(self):
+        """
+        Spring constants between each image and the one before it, which are
+        larger for higher energy images so they are closer together around
+        the saddle point
+
+        Returns:
+            (np.ndarray): k_i for i = 1, .., n-1 in Ha Å^-2, shape = (n-1,)
+        """
+        energies = self.images.energies()
+
+        e_ref = max(energies[0], energies[-1])
+        e_max = np.max(energies)
+
+        ks = np.full(len(self.images) - 1, self.k_min)
+
+        if e_max - e_ref < 1E-8:
+            return ks
+
+        for i in range(1, len(self.images)):
+            energy = max(energies[i], energies[i-1])
+
+            if energy > e_ref:
+                ks[i-1] = (self.k_max - (self.k_max - self.k_min)
+                           * (e_max - energy) / (e_max - e_ref))
+
+        return ks
+
+    def climbing_image_idx(self):
+        """Index of the highest energy intermediate image"""
+        energies = [image.energy for image in self.images[1:-1]]
+        return int(np.argmax(energies)) + 1
+
+    def get_forces(self, climbing_idx=None):
+        """
+        NEB forces on all the images. The climbing image has no spring force
+        and the component of the gradient along the path inverted, so it
+        climbs to the saddle point
+
+        Keyword Arguments:
+            climbing_idx (int | None):
+
+        Returns:
+            (np.ndarray): shape = (n_images, 3 x n_atoms)
+        """
+        return get_forces(self.images.coordinates,
+                          energies=self.images.energies(),
+                          grads=self.images.grads(),
+                          k=self.spring_constants(),
+                          climbing_idx=climbing_idx)
+
+    def optimise(self, executor, max_n_iterations=30, force_tol=0.005,
+                 n_init_iterations=5):
+        """
+        Optimise the intermediate images with FIRE. Images with forces on
+        all atoms below the tolerance are not moved, so don't need their
+        gradients to be recalculated, unless the forces on them increase as
+        the rest of the band moves
+
+        Arguments:
+            executor (autode.neb.original.ImageExecutor):
+
+        Keyword Arguments:
+            max_n_iterations (int): Maximum number of gradient evaluations
+            force_tol (float): Maximum force on an atom in a converged image
+                               in Ha Å-1
+            n_init_iterations (int): Number of iterations before the highest
+                                     energy image starts to climb
+        """
+        fire = FIRE()
+        n_images = len(self.images)
+        idxs = list(range(1, n_images - 1))
+        moved = idxs
+
+        for iteration in range(max_n_iterations):
+            executor.evaluate(self.images, idxs=moved)
+
+            climbing_idx = None
+            if iteration >= n_init_iterations:
+                climbing_idx = self.climbing_image_idx()
+
+            # Forces on the intermediate images
+            forces = self.get_forces(climbing_idx=climbing_idx)[1:-1]
+            max_forces = np.max(np.linalg.norm(forces.reshape(n_images - 2,
+                                                              -1, 3),
+                                               axis=2),
+                                axis=1)
+
+            logger.info(f'NEB iteration {iteration}. Maximum force = '
+                        f'{np.max(max_forces):.4f} Ha Å-1')
+
+            # The climbing image needs to be converged as a climbing image
+            if climbing_idx is not None and np.all(max_forces < force_tol):
+                logger.info('NEB converged')
+                break
+
+            is_moved = max_forces >= force_tol
+            if climbing_idx is not None:
+                is_moved[climbing_idx - 1] = True
+
+            moved = [i for i, is_moved_i in zip(idxs, is_moved) if is_moved_i]
+
+            # Converged images have no force on them and stop
+            forces[~is_moved] = 0.0
+            if fire.velocity is not None:
+                fire.velocity.reshape(n_images - 2, -1)[~is_moved] = 0.0
+
+            displacement = fire.step(forces.flatten())
+            self.images.coordinates[1:-1] += displacement.reshape(forces.shape)
+
+        else:
+            logger.warning(f'NEB did not converge in {max_n_iterations} '
+                           f'iterations')
+            executor.evaluate(self.images, idxs=moved)
+
+        return None
+
+    @work_in('NEB')
+    def calculate(self, method, n_cores, max_n_iterations=30,
+                  force_tol=0.005):
+        """
+        Optimise the climbing image NEB using forces calculated from
+        electronic structure
+
+        Arguments:
+            method (autode.wrappers.ElectronicStructureMethod)
+            n_cores (int)
+
+        Keyword Arguments:
+            max_n_iterations (int): Maximum number of gradient evaluations
+            force_tol (float): Maximum force on an atom in a converged image
+                               in Ha Å-1
+        """
+        self.print_geometries(name='neb_init')
+
+        # Calculate energy on the first and final points
+        for idx in [0, -1]:
+            energy_gradient(self.images[idx], method=method, n_cores=n_cores)
+            # Zero the forces so the end points don't move
+            self.images[idx].grad = np.zeros(shape=self.images[idx].grad.shape)
+
+        with ImageExecutor(self.images, method, n_cores) as executor:
+            self.optimise(executor, max_n_iterations=max_n_iterations,
+                          force_tol=force_tol)
+
+        self.print_geometries(name='neb_optimised')
+        self.plot_surface(name='neb_optimised')
+        return None
+
+    def __init__(self, *args, k_min=0.005, k_max=0.01, **kwargs):
+        """
+        Climbing image nudged elastic band with variable spring constants
+
+        Keyword Arguments:
+            k_min (float): Spring constant between low energy images
+                           (Ha Å^-2)
+            k_max (float): Spring constant between the highest energy images
+                           (Ha Å^-2)
+
+        See Also:
+            (autode.neb.original.NEB)
+        """
+        super().__init__(*args, **kwargs)
+
+        self.k_min = k_min
+        self.k_max = k_max
@@ -3,10 +3,13 @@ from autode.config import Config
 from autode.log import logger
 from autode.calculation import Calculation
 from autode.neb.original import NEB
+from autode.neb.ci import CINEB
 from autode.methods import get_lmethod
+from autode.scheduler import get_scheduler
 from autode.transition_states.ts_guess import get_ts_guess
 from autode.utils import work_in
 from autode.mol_graphs import find_cycles
+import networkx as nx
 import numpy as np
 
 
@@ -40,21 +43,21 @@ def get_ts_guess_neb(reactant, product, method, fbonds=None, bbonds=None,
     if generate_final_species and fbonds is not None and bbonds is not None:
 
         try:
-            species_list = get_interpolated(reactant, fbonds, bbonds,
-                                            max_n=calc_n_images(fbonds, bbonds),
-                                            method=method)
+            species_list = get_adaptive_path(reactant, fbonds, bbonds,
+                                             max_n=calc_n_images(fbonds, bbonds),
+                                             method=method)
         except ex.AtomsNotFound:
             logger.error('Failed to locate linear path')
             return None
 
-        neb = NEB(species_list=species_list)
+        neb = CINEB(species_list=species_list)
 
     # Otherwise using the reactant and product geometries
     else:
         assert n is not None
-        neb = NEB(initial_species=reactant.copy(),
-                  final_species=product.copy(),
-                  num=n)
+        neb = CINEB(initial_species=reactant.copy(),
+                    final_species=product.copy(),
+                    num=n)
         neb.interpolate_geometries()
 
     # Calculate and generate the TS guess
@@ -165,6 +168,240 @@ def get_interpolated(initial_species, fbonds, bbonds, max_n, method=None,
     return species_set
 
 
+def _get_constrained_species(species, distance_constraints, name, method,
+                             n_cores):
+    """
+    Optimise a copy of a species with a set of distance constraints. Run in a
+    separate process, so returns the optimised species
+
+    Arguments:
+        species (autode.species.Species):
+        distance_constraints (dict): Keyed with atom indexes and the constraint
+                             value as the value
+        name (str):
+        method (autode.wrappers.base.ElectronicStructureMethod):
+        n_cores (int):
+
+    Returns:
+        (autode.species.Species | None): None if the optimisation failed
+    """
+    species = species.copy()
+    species.name = name
+
+    opt = Calculation(name=f'{name}_constrained_opt',
+                      molecule=species,
+                      method=method,
+                      keywords=method.keywords.opt,
+                      n_cores=n_cores,
+                      distance_constraints=distance_constraints)
+    try:
+        species.optimise(method=method, calc=opt)
+
+    except ex.AtomsNotFound:
+        logger.error(f'Constrained optimisation of {name} failed')
+        return None
+
+    return species if species.energy is not None else None
+
+
+def get_seed_species(species, bonds, s):
+    """
+    Copy of a species with the active bond distances linearly interpolated a
+    fraction s of the way to their final distances, to start a constrained
+    optimisation from. For each bond the fragment containing the second atom,
+    once the active bonds are removed from the molecular graph, is translated
+    along the bond so its substituents move with it. If both atoms are in
+    the same fragment then only the second atom is moved
+
+    Arguments:
+        species (autode.species.Species):
+        bonds (list(autode.pes.pes.ScannedBond)):
+        s (float): Fraction of the way along the path, in [0, 1]
+
+    Returns:
+        (autode.species.Species):
+    """
+    seed = species.copy()
+
+    graph = species.graph.copy()
+    graph.remove_edges_from([bond.atom_indexes for bond in bonds])
+
+    coords = seed.get_coordinates()
+
+    for bond in bonds:
+        i, j = bond.atom_indexes
+        distance = bond.curr_dist + s * (bond.final_dist - bond.curr_dist)
+
+        vec = coords[j] - coords[i]
+        fragment = nx.node_connected_component(graph, j)
+        idxs = [j] if i in fragment else list(fragment)
+
+        coords[idxs] += (distance / np.linalg.norm(vec) - 1.0) * vec
+
+    seed.set_coordinates(coords)
+    return seed
+
+
+def get_intervals_to_refine(species_list, max_de=0.005, max_dx=0.3):
+    """
+    Get the intervals between adjacent species in a path that need another
+    species inserted, as either the energy or the geometry changes too much
+    between them. Ordered with the largest change first
+
+    Arguments:
+        species_list (list(autode.species.Species)):
+
+    Keyword Arguments:
+        max_de (float): Maximum energy difference between adjacent species
+                        (Ha)
+        max_dx (float): Maximum distance any atom moves between adjacent
+                        species (Å)
+
+    Returns:
+        (list(int)): Indexes i of the intervals between species i and i+1
+    """
+    changes = {}
+
+    for i in range(len(species_list) - 1):
+        species, next_species = species_list[i], species_list[i + 1]
+
+        de = abs(next_species.energy - species.energy)
+        dx = np.max(np.linalg.norm(next_species.get_coordinates()
+                                   - species.get_coordinates(), axis=1))
+
+        # Change relative to the maximum, either energy or geometry
+        change = max(de / max_de, dx / max_dx)
+        if change > 1.0:
+            changes[i] = change
+
+    return sorted(changes, key=lambda i: -changes[i])
+
+
+@work_in('NEB_init_path')
+def get_adaptive_path(initial_species, fbonds, bbonds, max_n, method=None,
+                      n_init=5, max_de=0.005, max_dx=0.3):
+    """
+    Generate a path from the initial species to the final bond distances with
+    constrained optimisations. A coarse set of points, evenly spaced in the
+    active bond distances, are optimised concurrently. Then points are
+    inserted halfway between adjacent points where the energy or geometry
+    change is large, which concentrates the points around the barrier,
+    until the maximum number is reached or the path is smooth. Coarse points
+    that fail are calculated again starting from the previous point, and
+    inserted points that fail are skipped
+
+    Arguments:
+        initial_species (autode.species.Species):
+        fbonds (list(autode.pes.pes.FormingBond)):
+        bbonds (list(autode.pes.pes.BreakingBond)):
+        max_n (int): Maximum number of species in the path
+
+    Keyword Arguments:
+        method (autode.wrappers.base.ElectronicStructureMethod): If None then
+               use the low level method
+        n_init (int): Number of species in the initial coarse path
+        max_de (float): Maximum energy difference between adjacent species
+                        (Ha)
+        max_dx (float): Maximum distance any atom moves between adjacent
+                        species (Å)
+
+    Returns:
+        (list(autode.species.Species)):
+
+    Raises:
+        (autode.exceptions.AtomsNotFound): If a point on the coarse path could
+                                           not be optimised
+    """
+    assert fbonds is not None and bbonds is not None
+    max_n = max(max_n, 2)
+    n_init = max(min(n_init, max_n), 2)
+
+    logger.info(f'Generating an adaptive path reactant -> product with '
+                f'{n_init} initial and a maximum of {max_n} species')
+
+    if method is None:
+        method = get_lmethod()
+
+    bonds = active_bonds_no_rings(initial_species, fbonds, bbonds)
+
+    def distance_constraints(s):
+        """Constraints at a fraction s along the path to the final distances"""
+        return {b.atom_indexes: b.curr_dist + s * (b.final_dist - b.curr_dist)
+                for b in bonds}
+
+    def optimise(species_list, ss):
+        """Optimise constrained species concurrently with the scheduler. A
+        species is None if its optimisation failed"""
+        scheduler = get_scheduler()
+        n_cores = max(1, Config.n_cores // len(ss))
+
+        futures = [scheduler.submit(_get_constrained_species, species,
+                                    distance_constraints(s),
+                                    f'{initial_species.name}_path{s:.4f}',
+                                    method, n_cores,
+                                    n_cores=n_cores)
+                   for species, s in zip(species_list, ss)]
+
+        return [future.result() for future in futures]
+
+    # Coarse path, with each point starting from the initial species with the
+    # active bonds interpolated to their distances at that point
+    path_ss = list(np.linspace(0.0, 1.0, n_init))
+    path = optimise([get_seed_species(initial_species, bonds, s)
+                     for s in path_ss], path_ss)
+
+    for i, s in enumerate(path_ss):
+        if path[i] is not None:
+            continue
+
+        if i == 0:
+            # To continue there must be final atoms and a final energy
+            raise ex.AtomsNotFound
+
+        # Fall back to starting from the previous point, as in a linear scan
+        logger.warning(f'Constrained optimisation at {s:.3f} along the path '
+                       f'failed. Starting from the previous point')
+        path[i] = _get_constrained_species(path[i - 1],
+                                           distance_constraints(s),
+                                           f'{initial_species.name}_path{s:.4f}'
+                                           f'_seq',
+                                           method, Config.n_cores)
+        if path[i] is None:
+            raise ex.AtomsNotFound
+
+    unrefinable = set()
+
+    while len(path) < max_n:
+        idxs = [i for i in get_intervals_to_refine(path, max_de=max_de,
+                                                   max_dx=max_dx)
+                if (path_ss[i], path_ss[i + 1]) not in unrefinable]
+        idxs = sorted(idxs[:max_n - len(path)])
+
+        if len(idxs) == 0:
+            break
+
+        logger.info(f'Inserting {len(idxs)} species into the path')
+
+        # New points start from the species before them in the path
+        ss = [(path_ss[i] + path_ss[i + 1]) / 2.0 for i in idxs]
+        new_species = optimise([path[i] for i in idxs], ss)
+
+        # Insert from the end so the indexes of earlier points don't change
+        for i, s, species in reversed(list(zip(idxs, ss, new_species))):
+
+            if species is None:
+                logger.warning(f'Could not insert a point at {s:.3f} along '
+                               f'the path')
+                unrefinable.add((path_ss[i], path_ss[i + 1]))
+                continue
+
+            path_ss.insert(i + 1, s)
+            path.insert(i + 1, species)
+
+    logger.info(f'Generated initial NEB path with {len(path)} species')
+    return path
+
+
 def active_bonds_no_rings(initial_species, fbonds, bbonds):
     """
     From forming and breaking bonds determine which should be used as the
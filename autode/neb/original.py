@@ -5,12 +5,13 @@ Henkelman and H. J ́onsson, J. Chem. Phys. 113, 9978 (2000)
 from autode.log import logger
 from autode.input_output import atoms_to_xyz_file
 from autode.calculation import Calculation
+from autode.config import Config
 from autode.constants import Constants
 from autode.utils import work_in
+from autode.scheduler import _get_config_state, _set_config_state
+from autode.scheduler import get_mp_context
 from autode.plotting import plot_1dpes
 from scipy.optimize import minimize
-from multiprocessing import Pool
-from copy import deepcopy
 import numpy as np
 
 
@@ -34,27 +35,187 @@ def energy_gradient(image, method, n_cores):
     return image
 
 
-def total_energy(flat_coords, images, method, n_cores):
-    """Compute the total energy across all images"""
-    images.set_coords(flat_coords)
+def _image_worker(connection, images, func, method, n_cores, config_state):
+    """
+    Evaluate the energies and gradients of a set of images each time their
+    coordinates are received through a connection, sending back only the
+    energies and gradients. Stops when None is received
 
-    # Number of cores per process is the floored total divided by n images
-    n_cores_pp = max(int(n_cores//len(images)), 1)
+    Arguments:
+        connection (multiprocessing.connection.Connection):
+        images (dict(int: autode.neb.original.Image)): Images keyed by
+                                                        their index
+        func (callable): Function to evaluate the energy and gradient of an
+                         image e.g. energy_gradient()
+        method (autode.wrappers.base.ElectronicStructureMethod):
+        n_cores (int):
+        config_state (dict):
+    """
+    _set_config_state(config_state)
+    Config.n_cores = n_cores
 
-    logger.info(f'Calculating energy and forces for all images with '
-                f'{n_cores} total cores and {n_cores_pp} per process')
+    while True:
+        all_coords = connection.recv()
 
-    # Run an energy + gradient evaluation in parallel across all images
-    with Pool(processes=n_cores) as pool:
-        results = [pool.apply_async(func=energy_gradient,
-                                    args=(images[i], method, n_cores_pp))
-                   for i in range(1, len(images) - 1)]
+        if all_coords is None:
+            break
+
+        try:
+            for i, coords in all_coords.items():
+                images[i].species.set_coordinates(coords)
+                func(images[i], method, n_cores)
+                images[i].iteration += 1
+
+            connection.send({i: (images[i].energy, images[i].grad)
+                             for i in all_coords})
+
+        except Exception as exception:
+            connection.send(exception)
+
+    connection.close()
+    return None
+
+
+class ImageExecutor:
+    """
+    Long-lived worker processes that evaluate the energies and gradients of
+    the intermediate images in a NEB. Each worker holds the species of its
+    images for the whole optimisation, so on each iteration only the
+    coordinates are sent and the energies and gradients returned
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def evaluate(self, images, idxs=None):
+        """
+        Calculate the energies and gradients of the intermediate images at
+        their current coordinates
+
+        Arguments:
+            images (autode.neb.original.Images):
+
+        Keyword Arguments:
+            idxs (list(int) | None): Indexes of the images to evaluate. If
+                                     None then evaluate all the intermediate
+                                     images
+
+        Raises:
+            (Exception): Any exception raised evaluating an image, or
+                         RuntimeError if a worker has stopped
+        """
+        exceptions, sent_connections = [], []
+
+        for connection, slot in zip(self._connections, self._slots):
+            try:
+                connection.send({i: images[i].species.get_coordinates()
+                                 for i in slot if idxs is None or i in idxs})
+                sent_connections.append(connection)
+
+            except OSError:
+                exceptions.append(RuntimeError('An image worker has stopped'))
+
+        for connection in sent_connections:
+            try:
+                results = connection.recv()
+
+            except (EOFError, OSError):
+                exceptions.append(RuntimeError('An image worker stopped '
+                                               'unexpectedly'))
+                continue
+
+            if isinstance(results, Exception):
+                exceptions.append(results)
+                continue
+
+            for i, (energy, grad) in results.items():
+                images[i].energy = energy
+                images[i].grad = grad
+                images[i].iteration += 1
+
+        if len(exceptions) > 0:
+            raise exceptions[0]
+
+        return None
+
+    def shutdown(self):
+        """Stop all the worker processes, including any that have died"""
+        for connection in self._connections:
+            try:
+                connection.send(None)
+
+            except OSError:
+                logger.warning('Could not stop an image worker. It has '
+                               'already stopped')
+
+            connection.close()
+
+        for process in self._processes:
+            process.join(timeout=10)
+
+            if process.is_alive():
+                logger.warning('Image worker did not stop. Terminating it')
+                process.terminate()
+                process.join()
+
+        self._connections, self._processes = [], []
+        return None
+
+    def __init__(self, images, method, n_cores, func=energy_gradient):
+        """
+        Start a worker process for each set of images that are evaluated
+        together, using no more than n_cores in total
+
+        Arguments:
+            images (autode.neb.original.Images):
+            method (autode.wrappers.base.ElectronicStructureMethod):
+            n_cores (int): Total number of cores
+
+        Keyword Arguments:
+            func (callable): Function to evaluate the energy and gradient of
+                             an image
+        """
+        idxs = list(range(1, len(images) - 1))
+        n_workers = max(1, min(len(idxs), n_cores))
 
-        images[1:-1] = [result.get(timeout=None) for result in results]
+        # Number of cores per process is the floored total divided by the
+        # number of processes
+        n_cores_pp = max(int(n_cores // n_workers), 1)
+        logger.info(f'Calculating energy and forces for all images with '
+                    f'{n_workers} processes and {n_cores_pp} core(s) each')
 
-    # Advance all the iteration numbers on the images to name correctly
-    for i in range(1, len(images) - 1):
-        images[i].iteration += 1
+        self._slots = [idxs[i::n_workers] for i in range(n_workers)]
+        self._connections, self._processes = [], []
+
+        config_state = _get_config_state()
+
+        # Start the workers in the same way as the scheduler, so the threads
+        # of this process are not copied
+        context = get_mp_context()
+
+        for slot in self._slots:
+            connection, worker_connection = context.Pipe()
+            process = context.Process(
+                target=_image_worker,
+                args=(worker_connection, {i: images[i] for i in slot}, func,
+                      method, n_cores_pp, config_state),
+                daemon=True)
+            process.start()
+            worker_connection.close()
+
+            self._connections.append(connection)
+            self._processes.append(process)
+
+
+def total_energy(flat_coords, images, executor):
+    """Compute the total energy across all images"""
+    images.set_coords(flat_coords)
+
+    # Run an energy + gradient evaluation in parallel across all images
+    executor.evaluate(images)
 
     all_energies = [image.energy for image in images]
     rel_energies = [energy - min(all_energies) for energy in all_energies]
@@ -63,85 +224,103 @@ def total_energy(flat_coords, images, method, n_cores):
     return sum(rel_energies)
 
 
-def get_force(im_l, im, im_r, k=0.005):
+def get_tangents(coords, energies):
     """
-    Compute F_i. Notation from:
-    Henkelman and H. J ́onsson, J. Chem. Phys. 113, 9978 (2000)
-
-    also a copy in autode/common
+    Compute the normalised tangents to the path at all the intermediate
+    images, τ_i. Notation from: Henkelman and H. J ́onsson, J. Chem. Phys.
+    113, 9978 (2000)
 
     Arguments:
-        im_l (autode.neb.Image): Left image (i-1)
-        im (autode.neb.Image): (i)
-        im_r (autode.neb.Image): Right image (i+1)
-        k (float): Force constant of the spring in Ha / Å^2
-    """
-    # ΔV_i^max
-    dv_max = max(np.abs(im_r.energy - im.energy),
-                 np.abs(im_l.energy - im.energy))
+        coords (np.ndarray): Coordinates of all the images.
+                             shape = (n_images, 3 x n_atoms)
+        energies (np.ndarray): shape = (n_images,)
 
-    # ΔV_i^min
-    dv_min = min(np.abs(im_r.energy - im.energy),
-                 np.abs(im_l.energy - im.energy))
+    Returns:
+        (np.ndarray): shape = (n_images - 2, 3 x n_atoms)
+    """
+    # V_i-1,   V_i,   V_i+1
+    e_l, e, e_r = energies[:-2], energies[1:-1], energies[2:]
 
-    # x_i-1,   x_i,   x_i+1
-    x_l, x, x_r = [image.species.get_coordinates().flatten()
-                   for image in (im_l, im, im_r)]
     # τ_i+
-    tau_plus = x_r - x
+    tau_plus = coords[2:] - coords[1:-1]
     # τ_i-
-    tau_minus = x - x_l
+    tau_minus = coords[1:-1] - coords[:-2]
 
-    if im_l.energy < im.energy < im_r.energy:
-        tau = tau_plus
+    # ΔV_i^max and ΔV_i^min
+    dv_max = np.maximum(np.abs(e_r - e), np.abs(e_l - e))[:, None]
+    dv_min = np.minimum(np.abs(e_r - e), np.abs(e_l - e))[:, None]
 
-    elif im_r.energy < im.energy < im_l.energy:
-        tau = tau_minus
+    # At a maximum or minimum weight the higher energy neighbour more. Equal
+    # energies either side weights both the same
+    tau = np.where((e_l < e_r)[:, None],
+                   tau_plus * dv_max + tau_minus * dv_min,
+                   tau_plus * dv_min + tau_minus * dv_max)
 
-    elif im_l.energy < im_r.energy:
-        tau = tau_plus * dv_max + tau_minus * dv_min
+    tau = np.where(((e_l < e) & (e < e_r))[:, None], tau_plus, tau)
+    tau = np.where(((e_r < e) & (e < e_l))[:, None], tau_minus, tau)
 
-    elif im_r.energy < im_l.energy:
-        tau = tau_plus * dv_min + tau_minus * dv_max
+    # Normalised τ vectors
+    return tau / np.linalg.norm(tau, axis=1, keepdims=True)
 
-    else:
-        raise RuntimeError
 
-    # Normalised τ vector
-    hat_tau = tau / np.linalg.norm(tau)
+def get_forces(coords, energies, grads, k=0.005, climbing_idx=None):
+    """
+    Compute F_i for all the images. Notation from:
+    Henkelman and H. J ́onsson, J. Chem. Phys. 113, 9978 (2000)
+
+    Arguments:
+        coords (np.ndarray): shape = (n_images, 3 x n_atoms)
+        energies (np.ndarray): shape = (n_images,)
+        grads (np.ndarray): shape = (n_images, 3 x n_atoms)
+
+    Keyword Arguments:
+        k (float | np.ndarray): Force constant of the springs in Ha / Å^2,
+                                either the same for all springs or for each
+                                spring between image i and i+1 with
+                                shape = (n_images - 1,)
+        climbing_idx (int | None): Index of an image with no spring force and
+                                   the component of the gradient along the
+                                   path inverted
+
+    Returns:
+        (np.ndarray): Forces, zero for the end points.
+                      shape = (n_images, 3 x n_atoms)
+    """
+    hat_tau = get_tangents(coords, energies)
+    ks = np.broadcast_to(k, (len(coords) - 1,))
+
+    # |x_i+1 - x_i|
+    distances = np.linalg.norm(np.diff(coords, axis=0), axis=1)
 
     # F_i^s||
-    f_parallel = (np.linalg.norm(x_r - x) * k -
-                  np.linalg.norm(x - x_l) * k) * hat_tau
+    f_parallel = (ks[1:] * distances[1:]
+                  - ks[:-1] * distances[:-1])[:, None] * hat_tau
 
-    # ∇V(x)_i|_|_ = ∇V(x)_i - (∇V(x)_i•τ) τ
-    grad_perp = im.grad - np.dot(im.grad, hat_tau) * hat_tau
+    # (∇V(x)_i•τ) τ
+    grad_parallel = np.einsum('ij,ij->i', grads[1:-1], hat_tau)[:, None] * hat_tau
 
     # F_i = F_i^s|| -  ∇V(x)_i|_|_
-    return f_parallel - grad_perp
+    forces = np.zeros_like(coords)
+    forces[1:-1] = f_parallel - (grads[1:-1] - grad_parallel)
 
+    if climbing_idx is not None:
+        forces[climbing_idx] = (2.0 * grad_parallel[climbing_idx - 1]
+                                - grads[climbing_idx])
 
-def derivative(flat_coords, images, method, n_cores):
-    """Compute the derivative of the total energy with respect to all
-    components"""
-
-    # Forces for the first image are fixed at zero
-    forces = np.array(images[0].grad)
+    return forces
 
-    # No need to calculate gradient as should already be there from energy eval
-    for i in range(1, len(images) - 1):
-        force = get_force(im_l=images[i - 1],
-                          im=images[i],
-                          im_r=images[i + 1])
 
-        forces = np.append(forces, force)
+def derivative(flat_coords, images, executor):
+    """Compute the derivative of the total energy with respect to all
+    components"""
 
-    # Final zero set of forces
-    forces = np.append(forces, images[-1].grad)
+    # No need to calculate gradient as should already be there from energy
+    # eval. Forces for the first and final images are fixed at zero
+    forces = get_forces(images.coordinates, images.energies(), images.grads())
 
     # dV/dx is negative of the force
     logger.info(f'|F| = {np.linalg.norm(forces):.4f} Ha Å-1')
-    return -forces
+    return -forces.flatten()
 
 
 class Image:
@@ -174,14 +353,43 @@ class Images:
     def __getitem__(self, item):
         return self._list[item]
 
+    def _is_bound(self):
+        """Are the coordinates of all the species views into the band
+        coordinates?"""
+        return (self._coords is not None
+                and all(image.species.atoms.coordinates.base is self._coords
+                        for image in self._list))
+
+    def _bind(self):
+        """Build the band coordinates from the species in the images and
+        store the coordinates of each species in a row of them"""
+        n_atoms = self._list[0].species.n_atoms
+        self._coords = np.array([image.species.get_coordinates().flatten()
+                                 for image in self._list])
+
+        for i, image in enumerate(self._list):
+            image.species.atoms.use_array(self._coords[i].reshape(n_atoms, 3))
+
+        return None
+
+    @property
+    def coordinates(self):
+        """
+        Coordinates of all the images, with the coordinates of the species in
+        each image a view into a row of this array. Setting the coordinates
+        of a species sets them here, and vice versa
+
+        Returns:
+            (np.ndarray): shape = (n_images, 3 x n_atoms)
+        """
+        if not self._is_bound():
+            self._bind()
+
+        return self._coords
+
     def coords(self):
         """Get a flat array of all components of every atom"""
-        coords = np.array([])
-        for image in self._list:
-
-            coords = np.append(coords,
-                               image.species.get_coordinates().flatten())
-        return coords
+        return self.coordinates.flatten()
 
     def set_coords(self, coords):
         """
@@ -190,19 +398,26 @@ class Images:
         Arguments:
             coords (np.ndarray): shape (num x n x 3,)
         """
+        band_coords = self.coordinates
+        band_coords[:] = coords.reshape(band_coords.shape)
 
-        n_atoms = self._list[0].species.n_atoms
-        coords = coords.reshape((len(self), n_atoms, 3))
+        return None
 
-        for i, image in enumerate(self._list):
-            image.species.set_coordinates(coords[i])
+    def energies(self):
+        """Energies of all the images. shape = (n_images,)"""
+        return np.array([image.energy for image in self._list], dtype=float)
 
-        return None
+    def grads(self):
+        """Gradients of all the images. shape = (n_images, 3 x n_atoms)"""
+        return np.array([image.grad for image in self._list], dtype=float)
 
     def __init__(self, num):
 
         self._list = [Image(name=str(i)) for i in range(num)]
 
+        # Coordinates of all the images, built from the species
+        self._coords = None
+
 
 class NEB:
 
@@ -247,16 +462,14 @@ class NEB:
         for i in range(1, n - 1):
 
             # Use a copy of the starting point for atoms, charge etc.
-            self.images[i].species = deepcopy(self.images[0].species)
-
-            # For all the atoms in the species translate an amount so the
-            # spacing is even between the initial and final points
-            for j, atom in enumerate(self.images[i].species.atoms):
+            self.images[i].species = self.images[0].species.copy()
 
-                # Shift vector is final minus current
-                shift = self.images[-1].species.atoms[j].coord - atom.coord
-                # then an equal spacing is the i-th point in the grid
-                atom.translate(vec=shift * (i / n))
+            # Translate all the atoms an amount so the spacing is even between
+            # the initial and final points. Shift vector is final minus
+            # current then an equal spacing is the i-th point in the grid
+            coords = self.images[i].species.get_coordinates()
+            shift = self.images[-1].species.get_coordinates() - coords
+            self.images[i].species.set_coordinates(coords + shift * (i / n))
 
         self.print_geometries()
         return None
@@ -286,13 +499,14 @@ class NEB:
         etol = 0.0015 * len(self.images)
         logger.info(f'Minimising to ∆E < {etol:.4f} Ha on all NEB coordinates')
 
-        result = minimize(total_energy,
-                          x0=init_coords,
-                          method='L-BFGS-B',
-                          jac=derivative,
-                          args=(self.images, method, n_cores),
-                          tol=etol,
-                          options={'maxfun': 30})
+        with ImageExecutor(self.images, method, n_cores) as executor:
+            result = minimize(total_energy,
+                              x0=init_coords,
+                              method='L-BFGS-B',
+                              jac=derivative,
+                              args=(self.images, executor),
+                              tol=etol,
+                              options={'maxfun': 30})
 
         logger.info(f'NEB path energy = {result.fun:.5f} Ha, {result.message}')
 
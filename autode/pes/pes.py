@@ -1,6 +1,5 @@
 from abc import ABC
 from abc import abstractmethod
-from copy import deepcopy
 import itertools
 import numpy as np
 from autode.bond_lengths import get_avg_bond_length
@@ -25,7 +24,7 @@ def get_closest_species(point, pes):
 
     if all(index == 0 for index in point):
         logger.info('PES is at the first point')
-        return deepcopy(pes.species[point])
+        return pes.species[point].copy()
 
     # The indcies of the nearest and second nearest points to e.g. n,m in a 2
     # dimensional PES
@@ -48,7 +47,7 @@ def get_closest_species(point, pes):
                 if pes.species[new_point] is not None:
                     logger.info(f'Closest point in the PES has indices '
                                 f'{new_point}')
-                    return deepcopy(pes.species[new_point])
+                    return pes.species[new_point].copy()
 
             except IndexError:
                 logger.warning('Closest point on the PES was outside the PES')
@@ -90,7 +89,7 @@ def get_point_species(point, species, distance_constraints, name, method,
     logger.info(f'Calculating point {point} on PES surface')
 
     species.name = f'{name}_scan_{"-".join([str(p) for p in point])}'
-    original_species = deepcopy(species)
+    original_species = species.copy()
 
     # Set up and run the calculation
     const_opt = Calculation(name=species.name, molecule=species, method=method,
@@ -108,7 +107,8 @@ def get_point_species(point, species, distance_constraints, name, method,
     # wrong with the EST method we need to be not on the first point to compute
     # an energy difference..
     if not all(p == 0 for p in point):
-        if species.energy is None or np.abs(original_species.energy - species.energy) > energy_threshold:
+        if species.energy is None or (original_species.energy is not None
+                                      and np.abs(original_species.energy - species.energy) > energy_threshold):
             logger.error(f'PES point had a relative energy '
                          f'> {energy_threshold} Ha. Using the closest')
             return original_species
@@ -1,8 +1,9 @@
-from copy import deepcopy
+import networkx as nx
 import numpy as np
 from autode.exceptions import FitFailed
 from autode.transition_states.ts_guess import get_ts_guess
 from autode.config import Config
+from autode.geom import get_centered_matrix, get_rot_mat_kabsch
 from autode.log import logger
 from autode.mol_graphs import is_isomorphic
 from autode.mol_graphs import make_graph
@@ -10,10 +11,83 @@ from autode.plotting import plot_1dpes
 from autode.pes.pes import get_closest_species
 from autode.pes.pes import get_point_species
 from autode.pes.pes import PES
+from autode.scheduler import get_scheduler
 from autode.units import KcalMol
 from autode.utils import work_in
 
 
+def get_chains(n_points, n_chains, from_final=False):
+    """
+    Split the points on a 1D surface into contiguous chains, each of which is
+    calculated in order. A chain runs on to the first point of the next
+    chain, so the two overlap. If from_final is True then the last chain is
+    calculated backwards from the final point::
+
+        n_points = 9, n_chains = 3, from_final = True
+
+        [0, 1, 2, 3], [3, 4, 5, 6], [8, 7, 6, 5]
+
+    Arguments:
+        n_points (int):
+        n_chains (int):
+
+    Keyword Arguments:
+        from_final (bool):
+
+    Returns:
+        (list(list(int))): Indexes of the points in each chain, in the order
+                           they are calculated
+    """
+    # Every chain needs at least two points
+    n_chains = max(1, min(n_chains, n_points // 2))
+    segments = [list(segment) for segment
+                in np.array_split(np.arange(n_points), n_chains)]
+
+    chains = []
+    for k, segment in enumerate(segments):
+
+        if k == n_chains - 1:
+            if from_final and n_chains > 1:
+                chains.append(segment[::-1] + [segment[0] - 1])
+            else:
+                chains.append(segment)
+
+        else:
+            chains.append(segment + [segments[k + 1][0]])
+
+    return [[int(i) for i in chain] for chain in chains]
+
+
+def _calculate_chain(seed_species, points, name, method, keywords, n_cores):
+    """
+    Calculate a chain of points on a 1D surface in order, each starting from
+    the species at the previous point. Run in a separate process, so returns
+    the species
+
+    Arguments:
+        seed_species (autode.species.Species): Species to start the first
+                                               point from
+        points (list(tuple(int, dict))): Index of each point and its distance
+                                         constraints
+        name (str):
+        method (autode.wrappers.base.ElectronicStructureMethod):
+        keywords (autode.wrappers.keywords.Keywords):
+        n_cores (int):
+
+    Returns:
+        (list(autode.species.Species)):
+    """
+    species_list = []
+    species = seed_species
+
+    for i, distance_constraints in points:
+        species = get_point_species((i,), species.copy(), distance_constraints,
+                                    name, method, keywords, n_cores)
+        species_list.append(species)
+
+    return species_list
+
+
 class PES1d(PES):
 
     def get_species_saddle_point(self):
@@ -52,24 +126,188 @@ class PES1d(PES):
 
         return False
 
+    def _final_species(self):
+        """The product, if it has the same atoms as the reactant so can be
+        used as the starting point of a chain, rotated and translated onto
+        the reactant"""
+        reactant = self.species[0]
+
+        if (self.product is None or self.product.atoms is None
+                or [atom.label for atom in self.product.atoms]
+                != [atom.label for atom in reactant.atoms]):
+            return None
+
+        product = self.product.copy()
+        coords = product.get_coordinates()
+        reac_coords = reactant.get_coordinates()
+
+        rot_mat = get_rot_mat_kabsch(get_centered_matrix(coords),
+                                     get_centered_matrix(reac_coords))
+
+        product.set_coordinates(np.matmul(coords - np.average(coords, axis=0),
+                                          rot_mat.T)
+                                + np.average(reac_coords, axis=0))
+        return product
+
+    def _set_scanned_distance(self, species, i):
+        """
+        Set the scanned distance in a species to its value at point i by
+        translating atom j, along with the fragment it is bonded to if the
+        scanned bond isn't in a ring
+
+        Arguments:
+            species (autode.species.Species):
+            i (int): Index of the point
+        """
+        idx_i, idx_j = self.rs_idxs[0]
+        moved = [idx_j]
+
+        if species.graph is not None:
+            graph = species.graph.copy()
+            if graph.has_edge(idx_i, idx_j):
+                graph.remove_edge(idx_i, idx_j)
+
+            fragment = nx.node_connected_component(graph, idx_j)
+            if idx_i not in fragment:
+                moved = list(fragment)
+
+        coords = species.get_coordinates()
+        vec = coords[idx_j] - coords[idx_i]
+        curr_dist = np.linalg.norm(vec)
+
+        coords[moved] += (self.rs[i][0] - curr_dist) * vec / curr_dist
+        species.set_coordinates(coords)
+        return None
+
+    def _seed_species(self, i, final_species=None):
+        """
+        Species to start a chain at point i from. Either the reactant, the
+        product or, part way along the surface, the geometry interpolated
+        between the reactant and the aligned product. Without a product the
+        reactant is used, in both cases with the scanned distance set
+
+        Arguments:
+            i (int): Index of the point
+
+        Keyword Arguments:
+            final_species (autode.species.Species | None): Product aligned
+                                                           onto the reactant
+
+        Returns:
+            (autode.species.Species):
+        """
+        if i == 0:
+            return self.species[0].copy()
+
+        if final_species is not None and i == self.n_points - 1:
+            species = final_species.copy()
+
+        else:
+            species = self.species[0].copy()
+
+            if final_species is not None:
+                # Fraction of the way from the reactant to the product, from
+                # the scanned distance if it changes between them
+                r_reac = species.get_distance(*self.rs_idxs[0])
+                r_prod = final_species.get_distance(*self.rs_idxs[0])
+
+                if np.abs(r_prod - r_reac) > 1E-3:
+                    frac = (self.rs[i][0] - r_reac) / (r_prod - r_reac)
+                else:
+                    frac = i / (self.n_points - 1)
+
+                frac = min(max(frac, 0.0), 1.0)
+                species.set_coordinates(
+                    (1.0 - frac) * species.get_coordinates()
+                    + frac * final_species.get_coordinates())
+
+            self._set_scanned_distance(species, i)
+
+        # Not a point on the surface, so has no energy to compare to
+        species.energy = None
+        return species
+
     @work_in('pes1d')
-    def calculate(self, name, method, keywords):
-        """Calculate all the points on the surface in serial using the maximum
-         number of cores available"""
+    def calculate(self, name, method, keywords, n_chains=None):
+        """
+        Calculate all the points on the surface. With a single chain in
+        serial using the maximum number of cores available, otherwise as
+        chains of points calculated concurrently, with the lowest energy
+        species used for points calculated in more than one chain.
+
+        Chains other than the first start from an interpolated geometry
+        rather than the previous point, so with n_chains > 1 the surface can
+        be discontinuous where chains meet e.g. with a different conformer
+        either side, which may add or hide peaks
+
+        Arguments:
+            name (str):
+            method (autode.wrappers.ElectronicStructureMethod):
+            keywords (autode.wrappers.keywords.Keywords):
+
+        Keyword Arguments:
+            n_chains (int | None): Number of chains. If None then use
+                                   Config.n_pes1d_chains
+        """
+        if n_chains is None:
+            n_chains = Config.n_pes1d_chains
+
+        final_species = self._final_species()
+        chains = get_chains(self.n_points, n_chains,
+                            from_final=final_species is not None)
+
+        if len(chains) == 1:
+            for i in range(self.n_points):
+                closest_species = get_closest_species((i,), self)
+
+                # Set up the dictionary of distance constraints keyed with
+                # bond indexes and values the current r1, r2.. value
+                distance_constraints = {self.rs_idxs[0]: self.rs[i][0]}
+
+                self.species[i] = get_point_species((i,), closest_species,
+                                                    distance_constraints,
+                                                    name,
+                                                    method,
+                                                    keywords,
+                                                    Config.n_cores)
+            return None
+
+        # Chains are independent so can all be run at once, within the total
+        # core budget of the scheduler
+        n_cores = max(1, Config.n_cores // len(chains))
+        logger.info(f'Calculating the 1D PES in {len(chains)} chains with '
+                    f'{n_cores} core(s) each')
+
+        scheduler = get_scheduler()
+        futures = []
+
+        for k, chain in enumerate(chains):
+            points = [(i, {self.rs_idxs[0]: self.rs[i][0]}) for i in chain]
+
+            # Calculations in different chains need different names
+            chain_name = name if k == 0 else f'{name}_chain{k}'
+
+            futures.append(scheduler.submit(_calculate_chain,
+                                            self._seed_species(chain[0],
+                                                               final_species),
+                                            points, chain_name, method,
+                                            keywords, n_cores,
+                                            n_cores=n_cores))
+
+        calculated = {}
+        for chain, future in zip(chains, futures):
+            for i, species in zip(chain, future.result()):
+
+                if species.energy is None and i in calculated:
+                    continue
+
+                if (i not in calculated or calculated[i].energy is None
+                        or species.energy < calculated[i].energy):
+                    calculated[i] = species
+
+        for i, species in calculated.items():
+            self.species[i] = species
 
-        for i in range(self.n_points):
-            closest_species = get_closest_species((i,), self)
-
-            # Set up the dictionary of distance constraints keyed with bond
-            # indexes and values the current r1, r2.. value
-            distance_constraints = {self.rs_idxs[0]: self.rs[i][0]}
-
-            self.species[i] = get_point_species((i,), closest_species,
-                                                distance_constraints,
-                                                name,
-                                                method,
-                                                keywords,
-                                                Config.n_cores)
         return None
 
     def __init__(self, reactant, product, rs, r_idxs):
@@ -87,11 +325,14 @@ class PES1d(PES):
 
         # Vector to store the species
         self.species = np.empty(shape=(self.n_points,), dtype=object)
-        self.species[0] = deepcopy(reactant)
+        self.species[0] = reactant.copy()
 
         # Tuple of the atom indices scanned in coordinate r
         self.rs_idxs = [r_idxs]
 
+        # Product, which can be the starting point of a chain of points
+        self.product = product
+
         # Molecular graph of the product. Used to check that the products have
         # been made & find the MEP
         self.product_graph = product.graph
@@ -1,7 +1,5 @@
-from copy import deepcopy
 from numpy.polynomial import polynomial
 import numpy as np
-from autode.utils import NoDaemonPool
 from autode.transition_states.ts_guess import get_ts_guess
 from autode.calculation import Calculation
 from autode.config import Config
@@ -13,6 +11,7 @@ from autode.pes.min_energy_pathway import get_sum_energy_mep
 from autode.mol_graphs import is_isomorphic
 from autode.mol_graphs import make_graph
 from autode.pes.pes import get_point_species
+from autode.scheduler import get_scheduler
 from autode.pes.pes import get_closest_species
 from autode.pes.pes import PES
 from autode.plotting import plot_2dpes
@@ -42,7 +41,7 @@ class PES2d(PES):
 
             # Perform a constrained optimisation using the analytic saddle
             # point r1, r2 values
-            species = deepcopy(self.species[close_point])
+            species = self.species[close_point].copy()
             const_opt = Calculation(name=f'{name}_const_opt', molecule=species,
                                     method=method,
                                     n_cores=Config.n_cores, keywords=keywords,
@@ -136,14 +135,15 @@ class PES2d(PES):
             # Set up the dictionary of distance constraints keyed with bond indexes and values the current r1, r2.. value
             distance_constraints = [{self.rs_idxs[i]: self.rs[p][i] for i in range(2)} for p in points]
 
-            # Use custom NoDaemonPool here, as there are several
-            # multiprocessing events happening within the function
-            with NoDaemonPool(processes=Config.n_cores) as pool:
-                results = [pool.apply_async(func=get_point_species, args=(p, s, d, name, method, keywords, cores_per_process))
-                           for p, s, d in zip(points, closest_species, distance_constraints)]
+            # Points along a diagonal are independent so can all be run at
+            # once, within the total core budget of the scheduler
+            scheduler = get_scheduler()
+            futures = [scheduler.submit(get_point_species, p, s, d, name, method, keywords, cores_per_process,
+                                        n_cores=cores_per_process)
+                       for p, s, d in zip(points, closest_species, distance_constraints)]
 
-                for i, point in enumerate(points):
-                    self.species[point] = results[i].get(timeout=None)
+            for i, point in enumerate(points):
+                self.species[point] = futures[i].result()
 
         logger.info('2D PES scan done')
         return None
@@ -161,7 +161,7 @@ class PES2d(PES):
 
         # Copy of the reactant complex, whose atoms/energy will be set in the
         # scan
-        self.species[0, 0] = deepcopy(reactant)
+        self.species[0, 0] = reactant.copy()
 
         return None
 
@@ -1,6 +1,8 @@
 from autode.reactions.reaction import Reaction
 from autode.reactions.multistep import MultiStepReaction
+from autode.reactions.batch import ReactionBatch
 
 
 __all__ = ['Reaction',
-           'MultiStepReaction']
+           'MultiStepReaction',
+           'ReactionBatch']
@@ -0,0 +1,252 @@
+from rdkit import Chem
+from autode.config import Config
+from autode.log import logger
+from autode.methods import get_hmethod
+from autode.mol_graphs import get_graph_hash
+from autode.plotting import plot_reaction_profile
+from autode.reactions.reaction import Reaction
+from autode.units import KcalMol
+from autode.utils import work_in
+
+
+def get_species_key(species):
+    """
+    Key of a species that is the same for species that are the same
+    molecule in the same state. Uses the canonical SMILES string if the
+    species was generated from a SMILES, otherwise the hash of the molecular
+    graph
+
+    Arguments:
+        species (autode.species.Species):
+
+    Returns:
+        (str):
+    """
+    identity = None
+    smiles = getattr(species, 'smiles', None)
+
+    if smiles is not None:
+        rdkit_mol = Chem.MolFromSmiles(smiles)
+
+        if rdkit_mol is not None:
+            identity = Chem.MolToSmiles(rdkit_mol)
+
+    if identity is None and species.graph is not None:
+        identity = get_graph_hash(species.graph)
+
+    if identity is None:
+        # Without a graph use the unique string, which includes the name
+        identity = str(species)
+
+    solvent = None if species.solvent is None else species.solvent.name
+    return f'{identity}_{species.charge}_{species.mult}_{solvent}'
+
+
+@work_in('thermal')
+def _calculate_thermochemical_cont(species, temp):
+    """Calculate both G and H contributions for a species"""
+    species.calc_g_cont(temp=temp)
+    species.calc_h_cont(temp=temp)
+    return None
+
+
+@work_in('single_points')
+def _calculate_single_point(species):
+    """Calculate a single point energy with the high level method"""
+    species.single_point(get_hmethod())
+    return None
+
+
+def _locate_transition_state(reaction, thermochemistry):
+    """
+    Locate the lowest energy transition state of a reaction and calculate its
+    energy, with the reactants and products already calculated. Run in a
+    separate process, so returns the reaction
+
+    Arguments:
+        reaction (autode.reactions.Reaction):
+        thermochemistry (bool): Calculate G and H contributions
+
+    Returns:
+        (autode.reactions.Reaction):
+    """
+
+    @work_in(reaction.name)
+    def calculate(reaction):
+        reaction.find_complexes()
+        reaction.locate_transition_state()
+        reaction.find_lowest_energy_ts_conformer()
+
+        if reaction.ts is not None and reaction.ts.energy is not None:
+            if thermochemistry:
+                _calculate_thermochemical_cont(reaction.ts, temp=reaction.temp)
+
+            _calculate_single_point(reaction.ts)
+
+        reaction.print_output()
+        return None
+
+    calculate(reaction)
+    return reaction
+
+
+class ReactionBatch:
+
+    def _set_unique_names(self):
+        """Reactions are calculated in directories with their name, so they
+        need to be unique"""
+        names = [reaction.name for reaction in self.reactions]
+
+        for i, reaction in enumerate(self.reactions):
+            if names.count(reaction.name) > 1:
+                reaction.name = f'{reaction.name}{i}'
+
+        return None
+
+    def _set_unique_species(self):
+        """Set the unique species across all reactions, keyed by
+        get_species_key() and the temperature of the reaction"""
+        for reaction in self.reactions:
+            for mol in reaction.reacs + reaction.prods:
+                key = (get_species_key(mol), reaction.temp)
+
+                if key not in self.unique_species:
+                    self.unique_species[key] = mol
+
+        logger.info(f'Have {len(self.unique_species)} unique species in '
+                    f'{len(self.reactions)} reactions')
+        return None
+
+    @work_in('reactants_and_products')
+    def calculate_species(self, thermochemistry=False):
+        """
+        Find the lowest energy conformer of each unique reactant and product,
+        optimise it and calculate its energy once, then set the result for
+        all the reactions containing it
+
+        Keyword Arguments:
+            thermochemistry (bool): Calculate G and H contributions
+        """
+        h_method = get_hmethod()
+        conf_hmethod = h_method if Config.hmethod_conformers else None
+
+        # Keys of the species before they are calculated, which can change
+        # the molecular graph
+        keys = [[(get_species_key(mol), reaction.temp)
+                 for mol in reaction.reacs + reaction.prods]
+                for reaction in self.reactions]
+
+        for (_, temp), mol in self.unique_species.items():
+            mol.find_lowest_energy_conformer(hmethod=conf_hmethod)
+            mol.optimise(h_method)
+
+            if thermochemistry:
+                _calculate_thermochemical_cont(mol, temp=temp)
+
+            _calculate_single_point(mol)
+
+        for reaction, reaction_keys in zip(self.reactions, keys):
+            n_reacs = len(reaction.reacs)
+
+            reaction.reacs = [self._calculated(mol, key) for mol, key
+                              in zip(reaction.reacs, reaction_keys[:n_reacs])]
+            reaction.prods = [self._calculated(mol, key) for mol, key
+                              in zip(reaction.prods, reaction_keys[n_reacs:])]
+
+        return None
+
+    def _calculated(self, mol, key):
+        """Copy of a species in a reaction, with the calculated state of the
+        unique species that it is the same as"""
+        calculated = self.unique_species[key].copy()
+
+        mol = mol.copy()
+        mol.set_atoms(atoms=calculated.atoms)
+        mol.energy = calculated.energy
+        mol.h_cont = calculated.h_cont
+        mol.g_cont = calculated.g_cont
+        mol.graph = calculated.graph
+        mol.conformers = calculated.conformers
+
+        return mol
+
+    def locate_transition_states(self, thermochemistry=False):
+        """
+        Locate the transition states of all the reactions. These are
+        independent, so are run concurrently with the cores shared between
+        them
+
+        Keyword Arguments:
+            thermochemistry (bool): Calculate G and H contributions
+        """
+        n_reactions = len(self.reactions)
+
+        if n_reactions == 1 or Config.n_cores == 1:
+            for reaction in self.reactions:
+                _locate_transition_state(reaction, thermochemistry)
+
+            return None
+
+        from autode.scheduler import get_scheduler
+        scheduler = get_scheduler()
+        n_cores = max(1, Config.n_cores // n_reactions)
+        logger.info(f'Locating {n_reactions} TSs with {n_cores} core(s) each')
+
+        futures = [scheduler.submit(_locate_transition_state, reaction,
+                                    thermochemistry, n_cores=n_cores)
+                   for reaction in self.reactions]
+
+        for reaction, future in zip(self.reactions, futures):
+            reaction.__dict__.update(future.result().__dict__)
+
+        return None
+
+    def calculate_reaction_profiles(self, units=KcalMol, free_energy=False,
+                                    enthalpy=False):
+        """
+        Calculate and plot the reaction profiles of all the reactions
+
+        Keyword Arguments:
+            units (autode.units.Unit):
+            free_energy (bool): Calculate the free energy profile (G)
+            enthalpy (bool): Calculate the enthalpic profile (H)
+        """
+        logger.info(f'Calculating {len(self.reactions)} reaction profiles')
+        thermochemistry = free_energy or enthalpy
+
+        @work_in(self.name)
+        def calculate(batch):
+            batch.calculate_species(thermochemistry=thermochemistry)
+            batch.locate_transition_states(thermochemistry=thermochemistry)
+            return None
+
+        calculate(self)
+
+        for reaction in self.reactions:
+            plot_reaction_profile([reaction], units=units, name=reaction.name,
+                                  free_energy=free_energy, enthalpy=enthalpy)
+        return None
+
+    def __init__(self, *args, name='batch'):
+        """
+        Batch of reactions that may share reactants and products, which are
+        only calculated once. The transition states are then located
+        concurrently
+
+        Arguments:
+            *args (autode.reactions.Reaction):
+
+        Keyword Arguments:
+            name (str):
+        """
+        self.name = str(name)
+        self.reactions = list(args)
+
+        assert all(type(reaction) is Reaction for reaction in self.reactions)
+
+        # Unique species across all the reactions keyed by get_species_key()
+        # and the temperature
+        self.unique_species = {}
+
+        self._set_unique_names()
+        self._set_unique_species()
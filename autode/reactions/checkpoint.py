@@ -0,0 +1,205 @@
+"""
+Checkpoints of the stages in calculating a reaction profile. After each stage
+the state of the reaction (reactants, products, complexes and transition
+states) is pickled, so a calculation that is stopped can be restarted from
+the first stage that was not completed without re-running or re-parsing any
+of the calculations in the previous stages
+"""
+import os
+import json
+import pickle
+from autode.config import Config
+from autode.exceptions import MethodUnavailable
+from autode.log import logger
+from autode.log.methods import methods
+from autode.methods import get_hmethod, get_lmethod
+
+
+# Configuration that doesn't change the result of a calculation, so can be
+# changed before restarting
+_restartable_config = ('n_cores', 'max_core', 'keep_input_files',
+                       'll_tmp_dir', 'high_quality_plots',
+                       'calculation_cache_dir')
+
+
+def _state_value(value):
+    """Value of a configuration option that can be serialised and compared,
+    independent of the identity of any objects in it"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, dict):
+        return {str(k): _state_value(v) for k, v in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        return [_state_value(item) for item in value]
+
+    if type(value).__str__ is object.__str__ and hasattr(value, '__dict__'):
+        return {type(value).__name__: _state_value(vars(value))}
+
+    return str(value)
+
+
+def get_calculation_state(reaction):
+    """
+    State that determines the results of the calculations in a reaction
+    profile: the methods, their keywords, the temperature and the rest of
+    the configuration
+
+    Arguments:
+        reaction (autode.reactions.Reaction):
+
+    Returns:
+        (str):
+    """
+    state = {'temp': reaction.temp}
+
+    for name, get_method in (('hmethod', get_hmethod),
+                             ('lmethod', get_lmethod)):
+        try:
+            state[name] = get_method().name
+
+        except MethodUnavailable:
+            state[name] = None
+
+    for name, value in vars(Config).items():
+        if name.startswith('_') or name in _restartable_config:
+            continue
+
+        if isinstance(value, type):
+            value = {attr: attr_value for attr, attr_value
+                     in vars(value).items() if not attr.startswith('_')}
+
+        state[name] = _state_value(value)
+
+    return json.dumps(state, sort_keys=True)
+
+
+class ReactionCheckpoint:
+
+    version = 2
+
+    def _matching_stages(self, stage_names):
+        """Number of stages that match the stages completed in order"""
+        n_matching = 0
+
+        for name, completed_name in zip(stage_names, self.stages):
+            if name != completed_name:
+                break
+
+            n_matching += 1
+
+        return n_matching
+
+    def load(self):
+        """Load the checkpoint from the file, if it exists and is for this
+        reaction"""
+        if not os.path.exists(self.filename):
+            return None
+
+        try:
+            with open(self.filename, 'rb') as checkpoint_file:
+                data = pickle.load(checkpoint_file)
+
+            if (data['version'] != self.version
+                    or data['reaction_id'] != self.reaction_id):
+                logger.warning('Checkpoint was not for this reaction. '
+                               'Ignoring it')
+                return None
+
+            if data['calculation_state'] != self.calculation_state:
+                logger.warning('Checkpoint was calculated with different '
+                               'methods, keywords, temperature or '
+                               'configuration. Ignoring it')
+                return None
+
+            self.stages = data['stages']
+            self.state = data['state']
+            self.methods = data['methods']
+
+        except (OSError, EOFError, KeyError, TypeError, AttributeError,
+                ImportError, pickle.UnpicklingError):
+            logger.warning(f'Could not load the checkpoint {self.filename}')
+
+        return None
+
+    def save(self, stage_name, reaction):
+        """
+        Record that a stage has been completed and save the current state of
+        the reaction
+
+        Arguments:
+            stage_name (str):
+            reaction (autode.reactions.Reaction):
+        """
+        self.stages.append(stage_name)
+        self.state = dict(reaction.__dict__)
+        self.methods = list(methods)
+
+        data = {'version': self.version,
+                'reaction_id': self.reaction_id,
+                'calculation_state': self.calculation_state,
+                'stages': self.stages,
+                'state': self.state,
+                'methods': self.methods}
+
+        # Write to a temporary file then replace, so stopping during the
+        # write does not leave a broken checkpoint
+        with open(f'{self.filename}.tmp', 'wb') as checkpoint_file:
+            pickle.dump(data, checkpoint_file)
+
+        os.replace(f'{self.filename}.tmp', self.filename)
+
+        logger.info(f'Saved checkpoint after {stage_name}')
+        return None
+
+    def remaining_stages(self, reaction, stages):
+        """
+        Get the stages that still need to be run and restore the reaction to
+        the state after the last completed stage. Stages must have been
+        completed in the same order to be skipped
+
+        Arguments:
+            reaction (autode.reactions.Reaction):
+            stages (list(tuple(str, function))): Name and function of each
+                   stage
+
+        Returns:
+            (list(tuple(str, function))):
+        """
+        n_completed = self._matching_stages([name for name, _ in stages])
+        self.stages = self.stages[:n_completed]
+
+        if n_completed == 0:
+            return stages
+
+        logger.info(f'Restarting from the checkpoint. Completed: '
+                    f'{self.stages}')
+        reaction.__dict__.update(self.state)
+
+        for sentence in self.methods:
+            methods.add(sentence)
+
+        return stages[n_completed:]
+
+    def __init__(self, reaction, filename='checkpoint.pkl'):
+        """
+        Checkpoint of a reaction profile calculation, loaded from a file if
+        it exists and was saved for the same reaction calculated with the
+        same methods, keywords, temperature and configuration
+
+        Arguments:
+            reaction (autode.reactions.Reaction):
+
+        Keyword Arguments:
+            filename (str):
+        """
+        self.filename = os.path.abspath(filename)
+        self.reaction_id = str(reaction)
+        self.calculation_state = get_calculation_state(reaction)
+
+        self.stages = []        # Names of the completed stages in order
+        self.state = None       # Reaction attributes after the last stage
+        self.methods = []       # Computational methods used up to then
+
+        self.load()
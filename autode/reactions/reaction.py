@@ -1,6 +1,5 @@
 import base64
 import hashlib
-from copy import deepcopy
 from datetime import date
 from autode.config import Config
 from autode.solvent.solvents import get_solvent
@@ -16,6 +15,7 @@ from autode.plotting import plot_reaction_profile
 from autode.units import KcalMol
 from autode.utils import work_in
 from autode.reactions import reaction_types
+from autode.reactions.checkpoint import ReactionCheckpoint
 
 
 def calc_delta(attr, left, right):
@@ -422,16 +422,16 @@ class Reaction:
         # If the reactant complex contains more than one molecule then
         # make a reaction that is separated reactants -> reactant complex
         if len(self.reacs) > 1:
-            reactant_complex = deepcopy(self.reactant)
+            reactant_complex = self.reactant.copy()
             reactant_complex.__class__ = Product
             reactions_wc.append(Reaction(*self.reacs, reactant_complex,
                                          name='reactant_complex'))
 
         # The elementary reaction is then
         # reactant complex -> product complex
-        reactant_complex = deepcopy(self.reactant)
+        reactant_complex = self.reactant.copy()
         reactant_complex.__class__ = Reactant
-        product_complex = deepcopy(self.product)
+        product_complex = self.product.copy()
         product_complex.__class__ = Product
 
         reaction = Reaction(reactant_complex, product_complex)
@@ -442,7 +442,7 @@ class Reaction:
         # As with the product complex add the dissociation of the product
         # complex into it's separated components
         if len(self.prods) > 1:
-            product_complex = deepcopy(self.product)
+            product_complex = self.product.copy()
             product_complex.__class__ = Reactant
             reactions_wc.append(Reaction(*self.prods, product_complex,
                                          name='product_complex'))
@@ -469,18 +469,32 @@ class Reaction:
 
         @work_in(self.name)
         def calculate(reaction):
-            reaction.find_lowest_energy_conformers()
-            reaction.optimise_reacs_prods()
-            reaction.find_complexes()
-            reaction.locate_transition_state()
-            reaction.find_lowest_energy_ts_conformer()
+            stages = [('conformers', reaction.find_lowest_energy_conformers),
+                      ('optimise', reaction.optimise_reacs_prods),
+                      ('complexes', reaction.find_complexes),
+                      ('transition_state', reaction.locate_transition_state),
+                      ('ts_conformers',
+                       reaction.find_lowest_energy_ts_conformer)]
+
             if with_complexes:
-                reaction.calculate_complexes()
+                stages.append(('complex_conformers',
+                               reaction.calculate_complexes))
+
             # Calculate both G and H if either are requested
             if free_energy or enthalpy:
-                reaction.calculate_thermochemical_cont()
-            reaction.calculate_single_points()
-            reaction.print_output()
+                stages.append(('thermochemistry',
+                               reaction.calculate_thermochemical_cont))
+
+            stages += [('single_points', reaction.calculate_single_points),
+                       ('output', reaction.print_output)]
+
+            # Skip any stages completed before a restart
+            checkpoint = ReactionCheckpoint(reaction)
+
+            for name, stage in checkpoint.remaining_stages(reaction, stages):
+                stage()
+                checkpoint.save(name, reaction)
+
             return None
 
         calculate(self)
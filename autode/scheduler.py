@@ -0,0 +1,407 @@
+"""
+Asynchronous scheduler for calculations and other expensive functions. A
+single scheduler owns the core budget (Config.n_cores) so that conformer
+optimisations, PES points and NEB images can run concurrently without
+oversubscribing the node. Jobs are run in a pool of worker processes, each in
+the directory it was submitted from, and futures are returned immediately.
+
+Worker processes are started from a fork server, as the scheduler has a
+dispatching thread and forking a multi-threaded process is not safe.
+"""
+import os
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from autode.config import Config
+from autode.log import logger
+
+
+# Low-level calculations on molecules smaller than this will use a single core
+# as they scale poorly, otherwise two cores are used
+_max_n_atoms_single_core = 50
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+_mp_context = None
+
+
+def get_mp_context():
+    """
+    Multiprocessing context used to start all worker processes. A fork
+    server, with autode already imported, if it is available otherwise
+    spawn. Neither copies the threads of the process that starts them
+
+    Returns:
+        (multiprocessing.context.BaseContext):
+    """
+    global _mp_context
+
+    if _mp_context is None:
+        if 'forkserver' in multiprocessing.get_all_start_methods():
+            _mp_context = multiprocessing.get_context('forkserver')
+            _mp_context.set_forkserver_preload(['autode'])
+
+        else:
+            _mp_context = multiprocessing.get_context('spawn')
+
+    return _mp_context
+
+
+def get_scheduler():
+    """
+    Get the scheduler for this process. A new one is created if this is a
+    new process, and the number of cores it has is updated if the total
+    number of cores has changed
+
+    Returns:
+        (autode.scheduler.Scheduler):
+    """
+    global _scheduler
+
+    with _scheduler_lock:
+        if (_scheduler is None
+                or _scheduler.pid != os.getpid()
+                or _scheduler.is_shutdown):
+            _scheduler = Scheduler(n_cores=Config.n_cores)
+
+        elif _scheduler.n_cores != Config.n_cores:
+            _scheduler.resize(n_cores=Config.n_cores)
+
+        return _scheduler
+
+
+def _get_config_state():
+    """
+    Get the current state of the configuration, including the nested
+    classes for each method, so it can be set in a worker process
+
+    Returns:
+        (dict):
+    """
+    state = {}
+
+    for name, value in vars(Config).items():
+        if name.startswith('_'):
+            continue
+
+        if isinstance(value, type):
+            state[name] = {attr: attr_value for attr, attr_value
+                           in vars(value).items() if not attr.startswith('_')}
+        else:
+            state[name] = value
+
+    return state
+
+
+def _set_config_state(state):
+    """Set the configuration from a state generated by _get_config_state"""
+
+    for name, value in state.items():
+        if isinstance(value, dict) and isinstance(getattr(Config, name), type):
+            for attr, attr_value in value.items():
+                setattr(getattr(Config, name), attr, attr_value)
+        else:
+            setattr(Config, name, value)
+
+    return None
+
+
+def _run_job(func, args, kwargs, n_cores, directory, config_state):
+    """
+    Run a function in a worker process. Within the function the total number
+    of cores is the number allocated to this job, so any nested parallelism
+    stays within the budget
+
+    Arguments:
+        func (callable):
+        args (tuple):
+        kwargs (dict):
+        n_cores (int):
+        directory (str): Directory to run the function in
+        config_state (dict):
+    """
+    global _scheduler
+
+    _set_config_state(config_state)
+    Config.n_cores = n_cores
+    os.chdir(directory)
+
+    try:
+        return func(*args, **kwargs)
+
+    finally:
+        # A scheduler started by this job, for nested parallelism, has worker
+        # processes that must finish before this worker can exit
+        with _scheduler_lock:
+            if _scheduler is not None and _scheduler.pid == os.getpid():
+                _scheduler.shutdown(wait=True)
+                _scheduler = None
+
+
+def _run_calculation(calc):
+    """Run a calculation and return it, as the calculation run in the worker
+    process is a copy"""
+    calc.run()
+    return calc
+
+
+class Job:
+
+    def __init__(self, func, args, kwargs, n_cores):
+        """
+        Function to be run with a number of cores
+
+        Arguments:
+            func (callable): Top level function that can be pickled
+            args (tuple):
+            kwargs (dict):
+            n_cores (int):
+        """
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.n_cores = n_cores
+
+        self.directory = os.getcwd()
+        self.config_state = _get_config_state()
+        self.future = Future()
+
+
+class Scheduler:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown(wait=True)
+
+    def n_cores_for(self, calc):
+        """
+        Number of cores to run a calculation with. Low-level (e.g. XTB or
+        MOPAC) calculations are packed onto one or two cores, while others
+        get as many as they request, up to the total available
+
+        Arguments:
+            calc (autode.calculation.Calculation):
+
+        Returns:
+            (int):
+        """
+        from autode.methods import low_level_method_names
+
+        n_cores = calc.n_cores
+
+        if calc.method.name in low_level_method_names:
+            max_cores = 1 if calc.molecule.n_atoms < _max_n_atoms_single_core else 2
+            n_cores = min(n_cores, max_cores)
+
+        return max(1, min(n_cores, self.n_cores))
+
+    def submit(self, func, *args, n_cores=1, **kwargs):
+        """
+        Submit a function to be run once enough cores are available
+
+        Arguments:
+            func (callable): Top level function that can be pickled
+            *args: Arguments of the function
+
+        Keyword Arguments:
+            n_cores (int): Number of cores the function will use
+            **kwargs: Keyword arguments of the function
+
+        Returns:
+            (concurrent.futures.Future):
+        """
+        job = Job(func, args, kwargs,
+                  n_cores=max(1, min(int(n_cores), self.n_cores)))
+
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('Cannot submit to a scheduler that has been'
+                                   ' shut down')
+            self._start()
+            self._queue.append(job)
+            self._condition.notify()
+
+        return job.future
+
+    def submit_calculation(self, calc):
+        """
+        Submit a calculation to be run. Once the calculation has finished the
+        result of the future is the (updated) calculation
+
+        Arguments:
+            calc (autode.calculation.Calculation):
+
+        Returns:
+            (concurrent.futures.Future):
+        """
+        calc.n_cores = self.n_cores_for(calc)
+        logger.info(f'Submitting {calc.name} with {calc.n_cores} core(s)')
+
+        future = Future()
+
+        def update(job_future):
+            """Update the submitted calculation from the one that was run"""
+            exception = job_future.exception()
+            if exception is not None:
+                future.set_exception(exception)
+                return
+
+            calc.__dict__.update(job_future.result().__dict__)
+            future.set_result(calc)
+
+        self.submit(_run_calculation, calc,
+                    n_cores=calc.n_cores).add_done_callback(update)
+        return future
+
+    @property
+    def is_shutdown(self):
+        """Has this scheduler been shut down?"""
+        return self._shutdown
+
+    def resize(self, n_cores):
+        """
+        Change the total number of cores. Running jobs keep their cores, but
+        no more jobs are started until there are enough free cores in the
+        new total
+
+        Arguments:
+            n_cores (int):
+        """
+        n_cores = max(1, int(n_cores))
+        logger.info(f'Changing the scheduler from {self.n_cores} to '
+                    f'{n_cores} core(s)')
+
+        with self._condition:
+            self._n_free_cores += n_cores - self.n_cores
+            self.n_cores = n_cores
+
+            # Queued jobs can use no more than the new total
+            for job in self._queue:
+                job.n_cores = min(job.n_cores, n_cores)
+
+            self._condition.notify()
+
+        return None
+
+    def shutdown(self, wait=True):
+        """
+        Shut down the scheduler once all the submitted jobs have finished
+
+        Keyword Arguments:
+            wait (bool): Wait for all the jobs to finish
+        """
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify()
+
+        if self._thread is not None and wait:
+            self._thread.join()
+
+        return None
+
+    def _start(self):
+        """Start the worker processes and the dispatching thread, if they have
+        not already been started"""
+        if self._executor is not None:
+            return
+
+        # Workers are started when they are needed. Allow enough for every
+        # core, even if the number of cores is increased
+        self._executor = ProcessPoolExecutor(
+            max_workers=max(self.n_cores, os.cpu_count() or 1),
+            mp_context=get_mp_context())
+
+        self._thread = threading.Thread(target=self._dispatch, daemon=True)
+        self._thread.start()
+        return None
+
+    def _next_job(self):
+        """
+        Get the next job that can run with the currently free cores, with
+        smaller jobs filling in behind any that are waiting for more cores.
+        Must be called with the condition acquired
+
+        Returns:
+            (autode.scheduler.Job | None):
+        """
+        for job in self._queue:
+            if job.n_cores <= self._n_free_cores:
+                self._queue.remove(job)
+                return job
+
+        return None
+
+    def _dispatch(self):
+        """Submit jobs to the worker processes while there are free cores"""
+
+        while True:
+            with self._condition:
+                job = self._next_job()
+
+                while job is None and not (self._shutdown
+                                           and len(self._queue) == 0):
+                    self._condition.wait()
+                    job = self._next_job()
+
+                if job is None:
+                    break
+
+                self._n_free_cores -= job.n_cores
+
+            if not job.future.set_running_or_notify_cancel():
+                self._finished(job, worker_future=None)
+                continue
+
+            worker_future = self._executor.submit(_run_job, job.func,
+                                                  job.args, job.kwargs,
+                                                  job.n_cores, job.directory,
+                                                  job.config_state)
+            worker_future.add_done_callback(
+                lambda f, _job=job: self._finished(_job, f))
+
+        # Wait for the worker processes to exit, without holding the lock so
+        # running jobs can finish. Not waiting can leave a worker that never
+        # exits, if this scheduler is in a worker for nested parallelism
+        self._executor.shutdown(wait=True)
+        return None
+
+    def _finished(self, job, worker_future):
+        """Release the cores used by a job and set its result"""
+
+        with self._condition:
+            self._n_free_cores += job.n_cores
+            self._condition.notify()
+
+        if worker_future is None:
+            return None
+
+        exception = worker_future.exception()
+        if exception is not None:
+            job.future.set_exception(exception)
+        else:
+            job.future.set_result(worker_future.result())
+
+        return None
+
+    def __init__(self, n_cores=None):
+        """
+        Scheduler with a budget of cores. Jobs are started in the order they
+        are submitted, while there are enough free cores
+
+        Keyword Arguments:
+            n_cores (int | None): Total number of cores. If None then use
+                                  Config.n_cores
+        """
+        self.n_cores = int(n_cores if n_cores is not None else Config.n_cores)
+        self.pid = os.getpid()
+
+        self._n_free_cores = self.n_cores
+        self._queue = []
+        self._condition = threading.Condition()
+        self._shutdown = False
+
+        self._executor = None
+        self._thread = None
@@ -0,0 +1,291 @@
+"""
+Compact binary serialisation of species. A file contains a JSON header with
+the atoms, charge, multiplicity, solvent, energies and molecular graph of
+each species, followed by the raw coordinate arrays (and any Hessians and
+normal modes) aligned so they can be used directly from a memory mapped file
+without being parsed or copied::
+
+    magic (6 bytes) | version (uint16) | header length (uint32) | header
+    | padding | array | padding | array ...
+
+Many species can be saved to the same file e.g. a library of conformers
+"""
+import os
+import json
+import mmap
+import struct
+import numpy as np
+import networkx as nx
+from autode.atoms import Atoms
+from autode.exceptions import SerialisationFailed
+from autode.log import logger
+
+
+magic = b'ADESPC'
+version = 1
+
+# Arrays are aligned to this number of bytes in the file
+_alignment = 8
+
+# Optional arrays saved for a species, if they are set
+_optional_arrays = ('hessian', 'normal_modes')
+
+_prefix = struct.Struct('<6sHI')
+
+
+def _json_default(value):
+    """Convert numpy scalars in graph attributes to python types"""
+    if isinstance(value, np.generic):
+        return value.item()
+
+    raise TypeError(f'Cannot serialise {type(value)}')
+
+
+def _padding(n_bytes):
+    return (-n_bytes) % _alignment
+
+
+def _graph_to_dict(graph):
+    """Molecular graph as a dictionary of nodes and edges with attributes"""
+    if graph is None:
+        return None
+
+    return {'nodes': [[node, data] for node, data in graph.nodes(data=True)],
+            'edges': [[i, j, data] for i, j, data in graph.edges(data=True)]}
+
+
+def _graph_from_dict(graph_dict):
+    """Molecular graph from a dictionary of nodes and edges"""
+    if graph_dict is None:
+        return None
+
+    graph = nx.Graph()
+    graph.add_nodes_from(graph_dict['nodes'])
+    graph.add_edges_from(graph_dict['edges'])
+
+    return graph
+
+
+def _is_valid_entry(entry):
+    """Does a species entry in the header have all the required keys, with
+    valid array locations?"""
+    keys = ('name', 'charge', 'mult', 'solvent', 'symbols', 'energy',
+            'h_cont', 'g_cont', 'graph', 'arrays')
+
+    if not isinstance(entry, dict) or any(key not in entry for key in keys):
+        return False
+
+    if not isinstance(entry['arrays'], dict):
+        return False
+
+    for array in entry['arrays'].values():
+        if (not isinstance(array, dict)
+                or not isinstance(array.get('offset', None), int)
+                or array['offset'] < 0
+                or not isinstance(array.get('shape', None), list)
+                or not all(isinstance(n, int) and n >= 0
+                           for n in array['shape'])):
+            return False
+
+    return True
+
+
+def dumps(species_list):
+    """
+    Serialise a list of species to bytes
+
+    Arguments:
+        species_list (list(autode.species.Species)):
+
+    Returns:
+        (bytes):
+    """
+    entries, arrays = [], []
+    offset = 0
+
+    def add_array(name, array, entry):
+        nonlocal offset
+        array = np.ascontiguousarray(array, dtype=float)
+
+        entry['arrays'][name] = {'shape': list(array.shape), 'offset': offset}
+        arrays.append(array)
+        offset += array.nbytes + _padding(array.nbytes)
+
+    for species in species_list:
+        atoms = species.atoms if species.atoms is not None else []
+
+        entry = {'name': species.name,
+                 'charge': species.charge,
+                 'mult': species.mult,
+                 'solvent': (None if species.solvent is None
+                             else species.solvent.name),
+                 'symbols': [atom.label for atom in atoms],
+                 'energy': species.energy,
+                 'h_cont': species.h_cont,
+                 'g_cont': species.g_cont,
+                 'graph': _graph_to_dict(species.graph),
+                 'arrays': {}}
+
+        if species.atoms is not None:
+            add_array('coordinates', species.atoms.coordinates, entry)
+
+        for name in _optional_arrays:
+            if getattr(species, name, None) is not None:
+                add_array(name, getattr(species, name), entry)
+
+        entries.append(entry)
+
+    header = json.dumps({'species': entries},
+                        default=_json_default).encode()
+
+    n_bytes = _prefix.size + len(header)
+    data = [_prefix.pack(magic, version, len(header)), header,
+            bytes(_padding(n_bytes))]
+
+    for array in arrays:
+        data += [array.astype('<f8').tobytes(), bytes(_padding(array.nbytes))]
+
+    return b''.join(data)
+
+
+def loads(data):
+    """
+    Load a list of species from serialised data. If the data is a writable
+    buffer, e.g. a bytearray or a copy-on-write memory map, the coordinates,
+    Hessians and normal modes are arrays in that buffer rather than copies
+
+    Arguments:
+        data (bytes | bytearray | mmap.mmap):
+
+    Returns:
+        (list(autode.species.Species)):
+
+    Raises:
+        (autode.exceptions.SerialisationFailed):
+    """
+    from autode.species.species import Species
+
+    if len(data) < _prefix.size:
+        raise SerialisationFailed('Not enough data to be a serialised species')
+
+    file_magic, file_version, header_length = _prefix.unpack_from(data, 0)
+
+    if file_magic != magic:
+        raise SerialisationFailed('Not serialised species data')
+
+    if file_version > version:
+        raise SerialisationFailed(f'Cannot load version {file_version} data. '
+                                  f'Maximum supported is {version}')
+
+    start = _prefix.size
+    if start + header_length > len(data):
+        raise SerialisationFailed('Data was truncated in the header')
+
+    try:
+        header = json.loads(bytes(data[start:start + header_length]))
+
+    except ValueError:
+        raise SerialisationFailed('Corrupted header')
+
+    if (not isinstance(header, dict)
+            or not isinstance(header.get('species', None), list)
+            or not all(_is_valid_entry(entry) for entry in header['species'])):
+        raise SerialisationFailed('Header did not contain a valid list of '
+                                  'species')
+
+    start += header_length
+    start += _padding(start)
+
+    if isinstance(data, bytes):
+        data = bytearray(data)
+
+    species_list = []
+
+    for entry in header['species']:
+        arrays = {}
+        for name, array in entry['arrays'].items():
+            shape = tuple(array['shape'])
+            count = int(np.prod(shape))
+            offset = start + array['offset']
+
+            if offset + 8 * count > len(data):
+                raise SerialisationFailed(f'Data was truncated in the {name} '
+                                          f'of {entry["name"]}')
+
+            arrays[name] = np.frombuffer(data, dtype='<f8', count=count,
+                                         offset=offset).reshape(shape)
+
+        if ('coordinates' in arrays
+                and arrays['coordinates'].shape != (len(entry['symbols']), 3)):
+            raise SerialisationFailed(f'Coordinates of {entry["name"]} did '
+                                      f'not match the number of atoms')
+
+        try:
+            atoms = None
+            if 'coordinates' in arrays:
+                atoms = Atoms.from_array(entry['symbols'],
+                                         arrays['coordinates'])
+
+            species = Species(name=entry['name'], atoms=atoms,
+                              charge=entry['charge'], mult=entry['mult'],
+                              solvent_name=entry['solvent'])
+
+            species.graph = _graph_from_dict(entry['graph'])
+
+        except (AssertionError, KeyError, TypeError, ValueError):
+            raise SerialisationFailed(f'Could not create the species from '
+                                      f'{entry["name"]}')
+
+        species.energy = entry['energy']
+        species.h_cont = entry['h_cont']
+        species.g_cont = entry['g_cont']
+
+        for name in _optional_arrays:
+            if name in arrays:
+                setattr(species, name, arrays[name])
+
+        species_list.append(species)
+
+    return species_list
+
+
+def save_species(species_list, filename):
+    """
+    Save a list of species to a binary file
+
+    Arguments:
+        species_list (list(autode.species.Species)):
+        filename (str):
+    """
+    logger.info(f'Saving {len(species_list)} species to {filename}')
+
+    with open(filename, 'wb') as species_file:
+        species_file.write(dumps(species_list))
+
+    return None
+
+
+def load_species(filename):
+    """
+    Load a list of species from a binary file. The file is memory mapped
+    copy-on-write so the coordinate arrays are only read from disk when they
+    are used, and modifying them does not modify the file
+
+    Arguments:
+        filename (str):
+
+    Returns:
+        (list(autode.species.Species)):
+
+    Raises:
+        (autode.exceptions.SerialisationFailed):
+    """
+    logger.info(f'Loading species from {filename}')
+
+    if not os.path.exists(filename) or os.path.getsize(filename) == 0:
+        raise SerialisationFailed(f'{filename} did not exist or was empty')
+
+    with open(filename, 'rb') as species_file:
+        data = mmap.mmap(species_file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    return loads(data)
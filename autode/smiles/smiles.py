@@ -8,7 +8,6 @@ from autode.geom import are_coords_reasonable
 from autode.log import logger
 from autode.mol_graphs import make_graph
 from autode.smiles.smiles_parser import parse_smiles
-from copy import deepcopy
 
 
 def calc_multiplicity(molecule, n_radical_electrons):
@@ -127,7 +126,7 @@ def check_bonds(molecule, bonds):
         molecule (autode.molecule.Molecule):
         bonds (list):
     """
-    check_molecule = deepcopy(molecule)
+    check_molecule = molecule.copy()
     make_graph(check_molecule)
 
     if len(bonds) != check_molecule.graph.number_of_edges():
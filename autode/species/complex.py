@@ -4,12 +4,14 @@ from itertools import product as iterprod
 from scipy.spatial import distance_matrix
 from autode.log import logger
 from autode.geom import get_points_on_sphere
+from autode.geom import get_rot_mat_euler
 from autode.mol_graphs import union
 from autode.species.species import Species
 from autode.utils import requires_atoms
 from autode.config import Config
 from autode.methods import get_lmethod
 from autode.conformers.conformer import get_conformer
+from autode.conformers.conformers import run_conformer_calcs
 from autode.exceptions import MethodUnavailable
 
 
@@ -38,24 +40,22 @@ def get_complex_conformer_atoms(molecules, rotations, points):
     # ~ COM located at the origin
     for i, molecule in enumerate(molecules[1:]):
 
-        centroid = np.average(np.array([atom.coord for atom in atoms]), axis=0)
+        centroid = np.average(atoms.coordinates, axis=0)
 
         # Shift to the origin and rotate randomly, by the same amount
         theta, axis = np.random.uniform(-np.pi, np.pi), np.random.uniform(-1, 1, size=3)
-        for atom in atoms:
-            atom.translate(vec=-centroid)
-            atom.rotate(axis, theta)
+        atoms.translate(vec=-centroid)
+        atoms.rotate(axis, theta)
 
-        coords = np.array([atom.coord for atom in atoms])
+        coords = np.array(atoms.coordinates, copy=True)
 
         mol_centroid = np.average(molecule.get_coordinates(), axis=0)
         shifted_mol_atoms = deepcopy(molecule.atoms)
 
         # Shift the molecule to the origin then rotate randomly
         theta, axis = rotations[i][0], rotations[i][1:]
-        for atom in shifted_mol_atoms:
-            atom.translate(vec=-mol_centroid)
-            atom.rotate(axis, theta)
+        shifted_mol_atoms.translate(vec=-mol_centroid)
+        shifted_mol_atoms.rotate(axis, theta)
 
         # Shift until the current molecules don't overlap with the current
         #  atoms, i.e. aren't far enough apart
@@ -66,10 +66,8 @@ def get_complex_conformer_atoms(molecules, rotations, points):
         # minimum distance to the rest of the complex is 2.0 Å
         while not far_enough_apart:
 
-            for atom in shifted_mol_atoms:
-                atom.coord += points[i] * 0.1
-
-            mol_coords = np.array([atom.coord for atom in shifted_mol_atoms])
+            shifted_mol_atoms.translate(vec=points[i] * 0.1)
+            mol_coords = shifted_mol_atoms.coordinates
 
             if np.min(distance_matrix(coords, mol_coords)) > 2.0:
                 far_enough_apart = True
@@ -145,8 +143,9 @@ class Complex(Species):
 
         try:
             lmethod = get_lmethod()
+            run_conformer_calcs(self.conformers, method=lmethod)
+
             for conformer in self.conformers:
-                conformer.optimise(method=lmethod)
                 conformer.print_xyz_file()
 
         except MethodUnavailable:
@@ -168,8 +167,8 @@ class Complex(Species):
         """
         logger.info(f'Translating molecule {mol_index} by {vec} in {self.name}')
 
-        for atom_index in self.get_atom_indexes(mol_index):
-            self.atoms[atom_index].translate(vec)
+        coords = self.atoms.coordinates
+        coords[list(self.get_atom_indexes(mol_index))] += vec
 
         return None
 
@@ -190,10 +189,11 @@ class Complex(Species):
         """
         logger.info(f'Rotating molecule {mol_index} by {theta:.4f} radians in {self.name}')
 
-        for atom_index in self.get_atom_indexes(mol_index):
-            self.atoms[atom_index].translate(vec=-origin)
-            self.atoms[atom_index].rotate(axis, theta)
-            self.atoms[atom_index].translate(vec=origin)
+        rot_matrix = get_rot_mat_euler(axis=axis, theta=theta)
+        atom_idxs = list(self.get_atom_indexes(mol_index))
+
+        coords = self.atoms.coordinates
+        coords[atom_idxs] = np.matmul(coords[atom_idxs] - origin, rot_matrix.T) + origin
 
         return None
 
@@ -1,11 +1,10 @@
 import rdkit
-from multiprocessing import Pool
 from rdkit.Chem import AllChem
 from autode.log.methods import methods
 from autode.input_output import xyz_file_to_atoms
 from autode.conformers.conformer import get_conformer
-from autode.conformers.conf_gen import get_simanl_atoms
-from autode.conformers.conformers import conf_is_unique_rmsd
+from autode.conformers.conf_gen import get_simanl_atoms_list
+from autode.conformers.conformers import ConformerDeduplicator
 from autode.conformers.conformers import atoms_from_rdkit_mol
 from autode.atoms import metals
 from autode.config import Config
@@ -86,20 +85,19 @@ class Molecule(Species):
 
         else:
             logger.info('Using repulsion+relaxed (RR) to generate conformers')
-            with Pool(processes=Config.n_cores) as pool:
-                results = [pool.apply_async(get_simanl_atoms, (self, None, i))
-                           for i in range(n_confs)]
-                conf_atoms_list = [res.get(timeout=None) for res in results]
+            conf_atoms_list = get_simanl_atoms_list(self, n_confs=n_confs)
 
             methods.add('RR algorithm (???) implemented in autodE')
 
         # Add the unique conformers
+        deduplicator = ConformerDeduplicator()
+
         for i, atoms in enumerate(conf_atoms_list):
             conf = get_conformer(name=f'{self.name}_conf{i}', species=self)
             conf.set_atoms(atoms)
 
             # If the conformer is unique on an RMSD threshold
-            if conf_is_unique_rmsd(conf, self.conformers):
+            if deduplicator.add(conf):
                 self.conformers.append(conf)
 
         logger.info(f'Generated {len(self.conformers)} unique conformer(s)')
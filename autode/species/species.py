@@ -1,7 +1,9 @@
 import numpy as np
 from copy import deepcopy
 from autode.log.methods import methods
+from autode.atoms import Atoms
 from autode.conformers.conformers import get_unique_confs
+from autode.conformers.conformers import run_conformer_calcs
 from autode.solvent.solvents import ExplicitSolvent
 from autode.solvent.solvents import get_solvent
 from autode.calculation import Calculation
@@ -44,8 +46,31 @@ class Species:
 
         return formula_str
 
+    def _graphs(self):
+        """Molecular graphs of this species, its conformers and any species
+        it holds e.g. the reactant and product of a transition state"""
+        graphs = [self.graph]
+
+        for value in self.__dict__.values():
+            if isinstance(value, Species):
+                graphs.append(value.graph)
+
+            if isinstance(value, list):
+                graphs += [item.graph for item in value
+                           if isinstance(item, Species)]
+
+        return [graph for graph in graphs if graph is not None]
+
     def copy(self):
-        return deepcopy(self)
+        """
+        Copy of this species. Molecular graphs are never modified in place,
+        only replaced, so they are shared with the copy rather than copied
+
+        Returns:
+            (autode.species.Species):
+        """
+        memo = {id(graph): graph for graph in self._graphs()}
+        return deepcopy(self, memo)
 
     def _generate_conformers(self, *args, **kwargs):
         raise NotImplementedError('Could not generate conformers. '
@@ -130,19 +155,13 @@ class Species:
     @requires_atoms()
     def translate(self, vec):
         """Translate the molecule by vector (np.ndarray, length 3)"""
-        for atom in self.atoms:
-            atom.translate(vec)
-
-        return None
+        return self.atoms.translate(vec)
 
     @requires_atoms()
     def rotate(self, axis, theta, origin=None):
         """Rotate the molecule by around an axis (np.ndarray, length 3) an
         theta radians"""
-        for atom in self.atoms:
-            atom.rotate(axis, theta, origin=origin)
-
-        return None
+        return self.atoms.rotate(axis, theta, origin=origin)
 
     @requires_atoms()
     def print_xyz_file(self, title_line='', filename=None):
@@ -157,7 +176,23 @@ class Species:
     def get_coordinates(self):
         """Return a np.ndarray of size n_atoms x 3 containing the xyz
         coordinates of the molecule"""
-        return np.array([atom.coord for atom in self.atoms])
+        return np.array(self.atoms.coordinates, copy=True)
+
+    @requires_atoms()
+    def get_coordinates_view(self):
+        """
+        Read only view of the coordinate array of the atoms, without a copy,
+        so it changes when the atoms are moved. Only valid until atoms are
+        added or removed, or an atom is added to another list, after which
+        the atoms have a new array and the view no longer changes
+
+        Returns:
+            (np.ndarray): shape = (n_atoms, 3)
+        """
+        coords = self.atoms.coordinates.view()
+        coords.flags.writeable = False
+
+        return coords
 
     @requires_atoms()
     def optimise(self, method=None, reset_graph=False, calc=None, keywords=None):
@@ -280,8 +315,7 @@ class Species:
             method_string += f' then with {hmethod.name}'
         methods.add(f'{method_string}.')
 
-        for conformer in self.conformers:
-            conformer.optimise(lmethod)
+        run_conformer_calcs(self.conformers, method=lmethod)
 
         # Strip conformers that are similar based on an energy criteria or
         # don't have an energy
@@ -289,22 +323,32 @@ class Species:
 
         if hmethod is not None:
             # Re-evaluate the energy of all the conformers with the higher
-            # level of theory
-            for conformer in self.conformers:
+            # level of theory, either as a single point or a full optimisation
+            if Config.hmethod_sp_conformers:
+                assert hmethod.keywords.low_sp is not None
 
-                if Config.hmethod_sp_conformers:
-                    assert hmethod.keywords.low_sp is not None
-                    conformer.single_point(hmethod)
-
-                else:
-                    # Otherwise run a full optimisation
-                    conformer.optimise(hmethod)
+            run_conformer_calcs(self.conformers, method=hmethod,
+                                single_point=Config.hmethod_sp_conformers)
 
         self._set_lowest_energy_conformer()
 
         logger.info(f'Lowest energy conformer found. E = {self.energy}')
         return None
 
+    @property
+    def atoms(self):
+        """Atoms in this species, with their coordinates stored in a single
+        array. Either an autode.atoms.Atoms list or None"""
+        return self._atoms
+
+    @atoms.setter
+    def atoms(self, value):
+        if value is None or isinstance(value, Atoms):
+            self._atoms = value
+
+        else:
+            self._atoms = Atoms(value)
+
     def set_atoms(self, atoms):
         """Set the atoms of this species and from those the number of atoms"""
 
@@ -318,9 +362,7 @@ class Species:
         of each atom"""
 
         assert coords.shape == (self.n_atoms, 3)
-
-        for i, coord in enumerate(coords):
-            self.atoms[i].coord = coord
+        self.atoms.coordinates = coords
 
         return None
 
@@ -1,4 +1,3 @@
-from copy import deepcopy
 import numpy as np
 from autode.atoms import DummyAtom
 from autode.mol_graphs import connected_components
@@ -255,7 +254,7 @@ def get_cost_rotate_translate(x, reactant, subst_centres, attacking_mol_idx):
         (float):
     """
 
-    moved_reactant = deepcopy(reactant)
+    moved_reactant = reactant.copy()
     moved_reactant.rotate_mol(axis=x[:3], theta=x[3],
                               mol_index=attacking_mol_idx)
 
@@ -212,7 +212,7 @@ def imag_mode_has_correct_displacement(calc, bond_rearrangement, disp_mag=1.0,
     """
     logger.info('Checking displacement on imaginary mode forms the correct'
                 ' bonds')
-    ts_species = deepcopy(calc.molecule)
+    ts_species = calc.molecule.copy()
 
     try:
         # We need to used the optimised set of atoms...
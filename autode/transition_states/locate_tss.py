@@ -7,6 +7,7 @@ from autode.transition_states.truncation import get_truncated_complex
 from autode.transition_states.truncation import is_worth_truncating
 from autode.transition_states.ts_guess import get_template_ts_guess
 from autode.bond_rearrangement import get_bond_rearrangs
+from autode.bond_rearrangement import get_equivalent_bond_rearrangs
 from autode.config import Config
 from autode.log import logger
 from autode.methods import get_hmethod
@@ -48,10 +49,17 @@ def find_tss(reaction):
         return None
 
     tss = []
-    for bond_rearrangement in bond_rearrs:
+    for group in get_equivalent_bond_rearrangs(reactant, bond_rearrs):
+        bond_rearrangement = group[0]
         logger.info(f'Locating transition state using active bonds '
                     f'{bond_rearrangement.all}')
 
+        # Symmetry equivalent rearrangements have the same TS, so only find
+        # one for the first
+        if len(group) > 1:
+            logger.info(f'Using the same TS for the equivalent rearrangements '
+                        f'{[br.all for br in group[1:]]}')
+
         ts = get_ts(reaction, reactant, bond_rearrangement)
 
         if ts is not None:
@@ -1,9 +1,12 @@
 import os
+import json
+import tempfile
 import autode
 from datetime import date
 import networkx as nx
 from autode.config import Config
 from autode.log import logger
+from autode.mol_graphs import get_graph_hash
 from autode.mol_graphs import is_isomorphic
 from autode.exceptions import TemplateLoadingFailed
 from autode.solvent.solvents import get_solvent
@@ -18,6 +21,9 @@ to know the forming C–C bond distance in the previous TS, fix it and run
 a constrained optimisation which will hopefully be a good guess of the TS
 """
 
+# Indexes of the TS templates in each folder, keyed by the folder path
+_ts_template_indexes = {}
+
 
 def get_ts_template_folder_path(folder_path):
     """
@@ -66,24 +72,317 @@ def get_ts_templates(folder_path=None):
         logger.error('Folder does not exist')
         return []
 
-    templates = []
+    templates = get_ts_template_index(folder_path).get_templates()
 
-    # Attempt to form transition state templates for all the .txt files in the
-    # TS template folder
-    for filename in os.listdir(folder_path):
+    logger.info(f'Have {len(templates)} TS templates')
+    return templates
 
-        if not filename.endswith('.txt'):
-            continue
+
+def get_matching_ts_templates(reactant, truncated_graph, folder_path=None):
+    """
+    Get the transition state templates that match a truncated graph, from
+    those in the index with the same charge, multiplicity, solvent and graph
+    hash. See template_matches()
+
+    Arguments:
+        reactant (autode.complex.ReactantComplex):
+
+        truncated_graph (nx.Graph):
+
+    Keyword Arguments:
+        folder_path (str or None):
+
+    Returns:
+        (list(autode.transition_states.templates.TStemplate)):
+    """
+    folder_path = get_ts_template_folder_path(folder_path)
+
+    if not os.path.exists(folder_path):
+        logger.error(f'TS template folder {folder_path} does not exist')
+        return []
+
+    index = get_ts_template_index(folder_path)
+    key = get_template_key(reactant.charge, reactant.mult, reactant.solvent,
+                           truncated_graph)
+
+    return [template for template in index.get_templates(key)
+            if template_matches(reactant, truncated_graph, template)]
+
+
+def get_template_key(charge, mult, solvent, graph):
+    """
+    Key of a template in an index, which is the same for a truncated graph
+    that may match it
+
+    Arguments:
+        charge (int):
+        mult (int):
+        solvent (autode.solvent.solvents.Solvent or None):
+        graph (nx.Graph):
+
+    Returns:
+        (str):
+    """
+    solvent_name = None if solvent is None else solvent.name
+    return f'{charge}_{mult}_{solvent_name}_{get_graph_hash(graph)}'
+
+
+def get_reference_key():
+    """
+    Key of a fixed reference graph, which changes if the way keys are
+    generated does e.g. a different graph hash. A saved index with a
+    different reference key cannot be used
+
+    Returns:
+        (str):
+    """
+    graph = nx.Graph()
+    for i, label in enumerate(('C', 'C', 'H', 'O')):
+        graph.add_node(i, atom_label=label)
+
+    graph.add_edges_from([(0, 1), (1, 2)])
+    graph.add_edge(1, 3, active=True)
+
+    return get_template_key(charge=0, mult=1, solvent=None, graph=graph)
+
+
+def get_ts_template_index(folder_path):
+    """
+    Get the index of the templates in a folder, which is loaded once per
+    process and brought up to date if any files have been added or removed
+
+    Arguments:
+        folder_path (str):
+
+    Returns:
+        (autode.transition_states.templates.TStemplateIndex):
+    """
+    folder_path = os.path.abspath(folder_path)
+
+    if folder_path not in _ts_template_indexes:
+        _ts_template_indexes[folder_path] = TStemplateIndex(folder_path)
+
+    index = _ts_template_indexes[folder_path]
+    index.update()
+
+    return index
+
+
+class TStemplateIndex:
+    """
+    Index of the templates in a folder keyed by charge, multiplicity, solvent
+    and the hash of the template graph, so finding a template that matches a
+    truncated graph is a dictionary lookup. Saved as a .json file in the same
+    folder, with the size and modification time of each template so only new
+    or modified templates need to be parsed. The saved index also has a
+    format version and a reference key, and is rebuilt if either differs
+    """
+
+    filename = '.template_index.json'
+    version = 1
+
+    def _add_entry(self, name, key, stat):
+        """Add an entry for a template file with a key, or None if it could
+        not be loaded"""
+        self.entries[name] = {'key': key,
+                              'mtime': stat.st_mtime_ns,
+                              'size': stat.st_size}
+
+        if key is not None:
+            self.keys.setdefault(key, []).append(name)
+
+        return None
+
+    def _remove_entry(self, name):
+        """Remove the entry for a template file"""
+        entry = self.entries.pop(name)
+        self.templates.pop(name, None)
+
+        if entry['key'] is not None:
+            self.keys[entry['key']].remove(name)
+
+        return None
+
+    def _load_template(self, name):
+        """Load a template from a file in this folder, or None if it fails"""
+        if name not in self.templates:
+            try:
+                self.templates[name] = TStemplate(
+                    filename=os.path.join(self.folder_path, name))
+
+            except TemplateLoadingFailed:
+                logger.warning(f'Failed to load a template for {name}')
+                self.templates[name] = None
+
+        return self.templates[name]
+
+    def _folder_mtime(self):
+        return os.stat(self.folder_path).st_mtime_ns
+
+    def get_templates(self, key=None):
+        """
+        Get the templates with a key, or all of them if the key is None
+
+        Keyword Arguments:
+            key (str or None):
+
+        Returns:
+            (list(autode.transition_states.templates.TStemplate)):
+        """
+        if key is None:
+            names = [name for name, entry in self.entries.items()
+                     if entry['key'] is not None]
+        else:
+            names = self.keys.get(key, [])
+
+        templates = [self._load_template(name) for name in names]
+        return [template for template in templates if template is not None]
+
+    def add(self, filename, template):
+        """
+        Add a template that has just been saved and save the index
+
+        Arguments:
+            filename (str): Path to the saved template
+            template (autode.transition_states.templates.TStemplate):
+        """
+        name = os.path.basename(filename)
+        if name in self.entries:
+            self._remove_entry(name)
+
+        if template.graph_has_correct_structure():
+            key = get_template_key(template.charge, template.mult,
+                                   template.solvent, template.graph)
+            self.templates[name] = template
+
+        else:
+            key = None
+
+        self._add_entry(name, key, stat=os.stat(filename))
+        self.save()
+
+        return None
+
+    def update(self):
+        """
+        Add any templates in the folder that are not in the index, or have
+        been modified, and remove those that no longer exist. Only lists the
+        folder if it has changed since the last update
+        """
+        if not os.path.exists(self.folder_path):
+            return None
+
+        folder_mtime = self._folder_mtime()
+        if folder_mtime == self.folder_mtime:
+            return None
+
+        stats = {entry.name: entry.stat() for entry
+                 in os.scandir(self.folder_path)
+                 if entry.name.endswith('.txt') and entry.is_file()}
+
+        n_changed = 0
+
+        for name in list(self.entries):
+            entry = self.entries[name]
+
+            if (name not in stats
+                    or entry['mtime'] != stats[name].st_mtime_ns
+                    or entry['size'] != stats[name].st_size):
+                self._remove_entry(name)
+                n_changed += 1
+
+        for name, stat in stats.items():
+            if name in self.entries:
+                continue
+
+            template = self._load_template(name)
+            key = None if template is None else get_template_key(
+                template.charge, template.mult, template.solvent,
+                template.graph)
+
+            self._add_entry(name, key, stat=stat)
+            n_changed += 1
+
+        if n_changed > 0:
+            logger.info(f'Updated {n_changed} TS template(s) in the index')
+            self.save()
+
+        self.folder_mtime = self._folder_mtime()
+        return None
+
+    def save(self):
+        """Save the index to the template folder, if it can be written"""
+        file_path = os.path.join(self.folder_path, self.filename)
+        tmp_path = None
 
         try:
-            template = TStemplate(filename=os.path.join(folder_path, filename))
-            templates.append(template)
+            # Write to a file unique to this save then replace the whole
+            # index, so a partially written one is never read or replaced by
+            # another process
+            with tempfile.NamedTemporaryFile('w', dir=self.folder_path,
+                                             prefix=self.filename,
+                                             suffix='.tmp',
+                                             delete=False) as index_file:
+                tmp_path = index_file.name
+                json.dump({'version': self.version,
+                           'reference_key': get_reference_key(),
+                           'entries': self.entries}, index_file)
+
+            os.replace(tmp_path, file_path)
+
+        except OSError:
+            logger.warning(f'Could not save the TS template index in '
+                           f'{self.folder_path}')
+
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
-        except TemplateLoadingFailed:
-            logger.warning(f'Failed to load a template for {filename}')
+        return None
 
-    logger.info(f'Have {len(templates)} TS templates')
-    return templates
+    def load(self):
+        """Load a saved index from the template folder, if it exists and
+        was saved with the same format and keys"""
+        file_path = os.path.join(self.folder_path, self.filename)
+
+        if not os.path.exists(file_path):
+            return None
+
+        try:
+            with open(file_path, 'r') as index_file:
+                index = json.load(index_file)
+
+            if (index.get('version', None) != self.version
+                    or index.get('reference_key', None)
+                    != get_reference_key()):
+                logger.info('TS template index was saved with a different '
+                            'version. Rebuilding')
+                return None
+
+            for name, entry in index['entries'].items():
+                self.entries[name] = entry
+
+                if entry['key'] is not None:
+                    self.keys.setdefault(entry['key'], []).append(name)
+
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            logger.warning('Failed to load the TS template index. Rebuilding')
+            self.entries, self.keys = {}, {}
+
+        return None
+
+    def __init__(self, folder_path):
+        """
+        Arguments:
+            folder_path (str): Folder containing the TS templates
+        """
+        self.folder_path = folder_path
+        self.folder_mtime = None
+
+        self.entries = {}           # Template filename -> key, mtime, size
+        self.keys = {}              # Key -> list of template filenames
+        self.templates = {}         # Template filename -> loaded template
+
+        self.load()
 
 
 def template_matches(reactant, truncated_graph, ts_template):
@@ -357,6 +656,8 @@ class TStemplate:
             logger.info(f'Making directory {folder_path}')
             os.mkdir(folder_path)
 
+        index = get_ts_template_index(folder_path)
+
         # Iterate i until the templatei.obj file doesn't exist
         name, i = basename + '0', 0
         while True:
@@ -371,6 +672,7 @@ class TStemplate:
         with open(file_path, 'w') as template_file:
             self._save_to_file(template_file)
 
+        index.add(file_path, template=self)
         return None
 
     def load(self, filename):
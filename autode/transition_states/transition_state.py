@@ -1,5 +1,4 @@
 from copy import deepcopy
-from multiprocessing import Pool
 from autode.transition_states.base import get_displaced_atoms_along_mode
 from autode.transition_states.base import TSbase
 from autode.transition_states.templates import TStemplate
@@ -90,19 +89,16 @@ class TransitionState(TSbase):
     def _generate_conformers(self, n_confs=None):
         """Generate conformers at the TS """
         from autode.conformers.conformer import Conformer
-        from autode.conformers.conf_gen import get_simanl_atoms
-        from autode.conformers.conformers import conf_is_unique_rmsd
+        from autode.conformers.conf_gen import get_simanl_atoms_list
+        from autode.conformers.conformers import ConformerDeduplicator
 
         n_confs = Config.num_conformers if n_confs is None else n_confs
         self.conformers = []
 
         distance_consts = get_distance_constraints(self)
 
-        with Pool(processes=Config.n_cores) as pool:
-            results = [pool.apply_async(get_simanl_atoms, (self, distance_consts, i))
-                       for i in range(n_confs)]
-
-            conf_atoms_list = [res.get(timeout=None) for res in results]
+        conf_atoms_list = get_simanl_atoms_list(self, distance_consts, n_confs)
+        deduplicator = ConformerDeduplicator()
 
         for i, atoms in enumerate(conf_atoms_list):
             conf = Conformer(name=f'{self.name}_conf{i}', charge=self.charge,
@@ -110,9 +106,9 @@ class TransitionState(TSbase):
                              dist_consts=distance_consts)
 
             # If the conformer is unique on an RMSD threshold
-            if conf_is_unique_rmsd(conf, self.conformers):
+            if deduplicator.add(conf):
                 conf.solvent = self.solvent
-                conf.graph = deepcopy(self.graph)
+                conf.graph = self.graph
                 self.conformers.append(conf)
 
         logger.info(f'Generated {len(self.conformers)} conformer(s)')
@@ -227,7 +227,7 @@ def get_truncated_complex(r_complex, bond_rearrangement):
     """
 
     active_atoms = bond_rearrangement.active_atoms
-    t_complex = deepcopy(r_complex)
+    t_complex = r_complex.copy()
 
     logger.info(f'Truncating {r_complex.name} with {r_complex.n_atoms} atoms '
                 f'around core atoms: {active_atoms}')
@@ -1,6 +1,5 @@
 from autode.transition_states.base import TSbase
-from autode.transition_states.templates import get_ts_templates
-from autode.transition_states.templates import template_matches
+from autode.transition_states.templates import get_matching_ts_templates
 from autode.calculation import Calculation
 from autode.config import Config
 from autode.exceptions import AtomsNotFound
@@ -80,15 +79,7 @@ def has_matching_ts_templates(reactant, bond_rearr):
 
     mol_graph = get_truncated_active_mol_graph(graph=reactant.graph,
                                                active_bonds=bond_rearr.all)
-    ts_guess_templates = get_ts_templates()
-
-    for ts_template in ts_guess_templates:
-
-        if template_matches(reactant=reactant, ts_template=ts_template,
-                            truncated_graph=mol_graph):
-            return True
-
-    return False
+    return len(get_matching_ts_templates(reactant, mol_graph)) > 0
 
 
 def get_template_ts_guess(reactant, product, bond_rearr, name, method,
@@ -118,14 +109,7 @@ def get_template_ts_guess(reactant, product, bond_rearr, name, method,
     # This will add edges so don't modify in place
     mol_graph = get_truncated_active_mol_graph(graph=reactant.graph,
                                                active_bonds=bond_rearr.all)
-    ts_guess_templates = get_ts_templates()
-
-    for ts_template in ts_guess_templates:
-
-        if not template_matches(reactant=reactant,
-                                ts_template=ts_template,
-                                truncated_graph=mol_graph):
-            continue
+    for ts_template in get_matching_ts_templates(reactant, mol_graph):
 
         # Get the mapping from the matching template
         mapping = get_mapping_ts_template(larger_graph=mol_graph,
@@ -219,7 +219,7 @@ def requires_output():
             # Calculation must be the first argument
             assert hasattr(args[0], 'output')
 
-            if args[0].output.file_lines is None:
+            if args[0].output.data is None:
                 raise NoCalculationOutput
 
             return func(*args, **kwargs)
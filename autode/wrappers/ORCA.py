@@ -11,6 +11,13 @@ from autode.exceptions import NoCalculationOutput
 from autode.utils import work_in_tmp_dir
 from autode.log import logger
 
+# Section headers in an ORCA output file that are indexed together, in a single
+# pass over the file, the first time any of them is requested
+output_sections = ('Program Version', 'VIBRATIONAL FREQUENCIES',
+                   'NORMAL MODES', 'IR SPECTRUM', 'HIRSHFELD ANALYSIS',
+                   'CARTESIAN GRADIENT', 'The final MP2 gradient',
+                   'The optimization has not yet converged')
+
 vdw_gaussian_solvent_dict = {'water': 'Water', 'acetone': 'Acetone', 'acetonitrile': 'Acetonitrile', 'benzene': 'Benzene',
                              'carbon tetrachloride': 'CCl4', 'dichloromethane': 'CH2Cl2', 'chloroform': 'Chloroform', 'cyclohexane': 'Cyclohexane',
                              'n,n-dimethylformamide': 'DMF', 'dimethylsulfoxide': 'DMSO', 'ethanol': 'Ethanol', 'n-hexane': 'Hexane',
@@ -267,8 +274,10 @@ class ORCA(ElectronicStructureMethod):
     def get_version(self, calc):
         """Get the version of ORCA used to execute this calculation"""
 
-        for line in calc.output.file_lines:
-            if 'Program Version' in line and len(line.split()) >= 3:
+        for offset in calc.output.section_offsets('Program Version',
+                                                  *output_sections):
+            line = calc.output.line_at(offset)
+            if len(line.split()) >= 3:
                 return line.split()[2]
 
         logger.warning('Could not find the ORCA version number')
@@ -290,37 +299,35 @@ class ORCA(ElectronicStructureMethod):
         termination_strings = ['ORCA TERMINATED NORMALLY',
                                'The optimization did not converge']
 
-        for n_line, line in enumerate(reversed(calc.output.file_lines)):
+        # The above lines are pretty close to the end of the file – so skip
+        # parsing it all
+        for line in reversed(calc.output.tail(n_lines=32)):
 
             if any(substring in line for substring in termination_strings):
                 logger.info('orca terminated normally')
                 return True
 
-            if n_line > 30:
-                # The above lines are pretty close to the end of the file –
-                # so skip parsing it all
-                return False
-
         return False
 
     def get_energy(self, calc):
-        for line in reversed(calc.output.file_lines):
-            if 'FINAL SINGLE POINT ENERGY' in line:
-                return float(line.split()[4])
+        line = calc.output.last_line_containing('FINAL SINGLE POINT ENERGY')
+
+        if line is not None:
+            return float(line.split()[4])
 
         return None
 
     def get_enthalpy(self, calc):
         """Get the enthalpy (H) from an ORCA calculation output"""
 
-        for line in reversed(calc.output.file_lines):
-            if 'Total Enthalpy' in line:
+        line = calc.output.last_line_containing('Total Enthalpy')
 
-                try:
-                    return float(line.split()[-2])
+        if line is not None:
+            try:
+                return float(line.split()[-2])
 
-                except ValueError:
-                    break
+            except ValueError:
+                pass
 
         logger.error('Could not get the free energy from the calculation. '
                      'Was a frequency requested?')
@@ -339,15 +346,17 @@ class ORCA(ElectronicStructureMethod):
             # Calculate H - TS, the latter term from Jmol-1 -> Ha
             return h - s * calc.input.temp
 
-        for line in reversed(calc.output.file_lines):
-            if ('Final Gibbs free energy' in line
-                    or 'Final Gibbs free enthalpy' in line):
+        offsets = [calc.output.data.rfind(string.encode())
+                   for string in ('Final Gibbs free energy',
+                                  'Final Gibbs free enthalpy')]
 
-                try:
-                    return float(line.split()[-2])
+        if max(offsets) != -1:
+            line = calc.output.line_at(max(offsets))
+            try:
+                return float(line.split()[-2])
 
-                except ValueError:
-                    break
+            except ValueError:
+                pass
 
         logger.error('Could not get the free energy from the calculation. '
                      'Was a frequency requested?')
@@ -355,54 +364,60 @@ class ORCA(ElectronicStructureMethod):
 
     def optimisation_converged(self, calc):
 
-        for line in reversed(calc.output.file_lines):
-            if 'THE OPTIMIZATION HAS CONVERGED' in line:
-                return True
-
-        return False
+        return calc.output.contains('THE OPTIMIZATION HAS CONVERGED')
 
     def optimisation_nearly_converged(self, calc):
-        geom_conv_block = False
-
-        for line in reversed(calc.output.file_lines):
-            if geom_conv_block and 'Geometry convergence' in line:
-                geom_conv_block = False
-            if 'The optimization has not yet converged' in line:
-                geom_conv_block = True
-            if geom_conv_block and len(line.split()) == 5:
-                if line.split()[-1] == 'YES':
+        offsets = calc.output.section_offsets('The optimization has not yet '
+                                              'converged', *output_sections)
+
+        # Check the convergence block preceding each not converged line
+        for offset in reversed(offsets):
+            for line in calc.output.lines_before(offset):
+                if 'Geometry convergence' in line:
+                    break
+
+                if len(line.split()) == 5 and line.split()[-1] == 'YES':
                     return True
 
         return False
 
     def get_imaginary_freqs(self, calc):
         imag_freqs = []
+        offsets = calc.output.section_offsets('VIBRATIONAL FREQUENCIES',
+                                              *output_sections)
 
-        for i, line in enumerate(calc.output.file_lines):
-            if 'VIBRATIONAL FREQUENCIES' in line:
-                last_line = i + 3 * calc.molecule.n_atoms + 5
-
-                # Reset every time freqs are found, so the final is returned
-                freq_lines = calc.output.file_lines[i + 5:last_line]
-                freqs = [float(l.split()[1]) for l in freq_lines]
-                imag_freqs = [freq for freq in freqs if freq < 0]
+        # Only the final set of frequencies is returned
+        if len(offsets) > 0:
+            n_lines = 3 * calc.molecule.n_atoms + 5
+            freq_lines = calc.output.lines_from(offsets[-1], n_lines)[5:]
+            freqs = [float(l.split()[1]) for l in freq_lines]
+            imag_freqs = [freq for freq in freqs if freq < 0]
 
         logger.info(f'Found imaginary freqs {imag_freqs}')
         return imag_freqs
 
-    def get_normal_mode_displacements(self, calc, mode_number):
-        normal_mode_section, values_sec, = False, False
-        displacements, col = [], None
-
-        for j, line in enumerate(calc.output.file_lines):
-            if 'NORMAL MODES' in line:
-                normal_mode_section, values_sec, = True, False
-                displacements, col = [], None
+    def _normal_mode_blocks(self, calc):
+        """
+        Generate the blocks of the final normal mode section, each as the
+        mode numbers in the block and the 3 x n_atoms lines of displacements
+        below them
+        """
+        offsets = calc.output.section_offsets('NORMAL MODES', *output_sections)
+        if len(offsets) == 0:
+            return
 
+        # Lines in the final normal mode section, up to the IR spectrum
+        section_lines = []
+        for line in calc.output.lines_after(offsets[-1]):
             if 'IR SPECTRUM' in line:
-                normal_mode_section, values_sec = False, False
+                break
+
+            section_lines.append(line)
 
-            if normal_mode_section and len(line.split()) > 1:
+        values_sec, n_lines = False, 3 * calc.molecule.n_atoms
+
+        for j, line in enumerate(section_lines):
+            if len(line.split()) > 1:
                 if line.split()[0].startswith('0'):
                     values_sec = True
 
@@ -413,18 +428,51 @@ class ORCA(ElectronicStructureMethod):
                 continue
 
             mode_numbers = [int(val) for val in line.split()]
+            yield mode_numbers, section_lines[j+1:j+n_lines+1]
+
+    def get_normal_mode_displacements(self, calc, mode_number):
+        displacements = []
+
+        for mode_numbers, d_lines in self._normal_mode_blocks(calc):
             if mode_number not in mode_numbers:
                 continue
 
-            col = [i for i in range(len(mode_numbers)) if mode_number == mode_numbers[i]][0] + 1
-
-            d_lines = calc.output.file_lines[j+1:j+3 * calc.molecule.n_atoms+1]
+            col = mode_numbers.index(mode_number) + 1
             displacements = [float(d_line.split()[col]) for d_line in d_lines]
 
         displacements_xyz = [displacements[i:i + 3] for i in range(0, len(displacements), 3)]
 
         return np.array(displacements_xyz)
 
+    def get_normal_modes(self, calc):
+        """
+        Get all the normal modes from the final normal mode section. If the
+        section is incomplete None is returned, so the modes are parsed
+        individually
+
+        Returns:
+            (np.ndarray | None): shape = (n_modes, n_atoms, 3)
+        """
+        n_atoms = calc.molecule.n_atoms
+        modes = {}
+
+        try:
+            for mode_numbers, d_lines in self._normal_mode_blocks(calc):
+                values = np.array([d_line.split()[1:] for d_line in d_lines],
+                                  dtype=float)
+
+                for col, mode_number in enumerate(mode_numbers):
+                    modes[mode_number] = values[:, col].reshape(n_atoms, 3)
+
+        except (ValueError, IndexError):
+            logger.warning('Could not parse the full normal mode section')
+            return None
+
+        if len(modes) == 0 or set(modes) != set(range(len(modes))):
+            return None
+
+        return np.array([modes[i] for i in range(len(modes))])
+
     def get_final_atoms(self, calc):
 
         atoms = []
@@ -455,16 +503,15 @@ class ORCA(ElectronicStructureMethod):
            0 C   -0.006954    0.000000
            . .      .            .
         """
-        charges = []
+        offsets = calc.output.section_offsets('HIRSHFELD ANALYSIS',
+                                              *output_sections)
+        if len(offsets) == 0:
+            return []
 
-        for i, line in enumerate(calc.output.file_lines):
-            if 'HIRSHFELD ANALYSIS' in line:
-                charges = []
-                first, last = i+7, i+7+calc.molecule.n_atoms
-                for charge_line in calc.output.file_lines[first:last]:
-                    charges.append(float(charge_line.split()[-1]))
+        n_lines = 7 + calc.molecule.n_atoms
+        charge_lines = calc.output.lines_from(offsets[-1], n_lines)[7:]
 
-        return charges
+        return [float(line.split()[-1]) for line in charge_lines]
 
     def get_gradients(self, calc):
         """
@@ -478,26 +525,34 @@ class ORCA(ElectronicStructureMethod):
         """
         gradients = []
 
-        for i, line in enumerate(calc.output.file_lines):
-            if 'CARTESIAN GRADIENT' in line or 'The final MP2 gradient' in line:
-                gradients = []
-                if 'CARTESIAN GRADIENT' in line:
-                    first, last = i + 3, i + 3 + calc.molecule.n_atoms
-                if 'The final MP2 gradient' in line:
-                    first, last = i + 1, i + 1 + calc.molecule.n_atoms
-                if 'CARTESIAN GRADIENT (NUMERICAL)' in line:
-                    first, last = i + 2, i + 2 + calc.molecule.n_atoms
+        offsets = (calc.output.section_offsets('CARTESIAN GRADIENT',
+                                               *output_sections)
+                   + calc.output.section_offsets('The final MP2 gradient'))
+        if len(offsets) == 0:
+            return np.array(gradients)
+
+        # Only the final gradient is returned
+        offset = max(offsets)
+        line = calc.output.line_at(offset)
 
-                for grad_line in calc.output.file_lines[first:last]:
+        if 'CARTESIAN GRADIENT' in line:
+            first = 3
+        if 'The final MP2 gradient' in line:
+            first = 1
+        if 'CARTESIAN GRADIENT (NUMERICAL)' in line:
+            first = 2
 
-                    if len(grad_line.split()) <= 3:
-                        continue
+        n_lines = first + calc.molecule.n_atoms
+        for grad_line in calc.output.lines_from(offset, n_lines)[first:]:
+
+            if len(grad_line.split()) <= 3:
+                continue
 
-                    dadx, dady, dadz = grad_line.split()[-3:]
-                    vec = [float(dadx), float(dady), float(dadz)]
+            dadx, dady, dadz = grad_line.split()[-3:]
+            vec = [float(dadx), float(dady), float(dadz)]
 
-                    # Convert from Ha a0^-1 to Ha A-1
-                    gradients.append(np.array(vec) / Constants.a02ang)
+            # Convert from Ha a0^-1 to Ha A-1
+            gradients.append(np.array(vec) / Constants.a02ang)
 
         return np.array(gradients)
 
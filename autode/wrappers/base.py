@@ -185,6 +185,20 @@ class ElectronicStructureMethod(ABC):
         """
         pass
 
+    def get_normal_modes(self, calc):
+        """
+        Get the displacements along all the normal modes at once. Optionally
+        implemented in child classes, otherwise modes are parsed individually
+        with get_normal_mode_displacements
+
+        Arguments:
+            calc (autode.calculation.Calculation):
+
+        Returns:
+            (np.ndarray | None): shape = (n_modes, n_atoms, 3)
+        """
+        return None
+
     @abstractmethod
     @requires_output()
     def get_final_atoms(self, calc):
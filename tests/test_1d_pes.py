@@ -90,3 +90,65 @@ def test_1d_pes():
     pes.print_plot(method_name='orca', name='H+H2_H2+H')
     assert os.path.exists('H+H2_H2+H.png')
     os.remove('H+H2_H2+H.png')
+
+
+def test_1d_pes_chains():
+
+    from autode.pes.pes_1d import get_chains
+
+    assert get_chains(n_points=9, n_chains=1) == [list(range(9))]
+
+    # Chains overlap by a point with the next one
+    assert get_chains(n_points=9, n_chains=3) == [[0, 1, 2, 3],
+                                                  [3, 4, 5, 6],
+                                                  [6, 7, 8]]
+
+    # and the last can go back from the final point
+    chains = get_chains(n_points=9, n_chains=3, from_final=True)
+    assert chains[-1] == [8, 7, 6, 5]
+
+    # Every point is calculated by at least one chain
+    for n_points in range(1, 12):
+        for n_chains in range(1, 6):
+            chains = get_chains(n_points, n_chains, from_final=True)
+            assert set(i for chain in chains for i in chain) == set(range(n_points))
+
+    pes = PES1d(reactant=reac, product=prod, rs=np.linspace(1.0, 0.7, 5),
+                r_idxs=(1, 2))
+
+    # Product complex has the same atoms as the reactant, so can start a chain
+    # once it's aligned onto the reactant
+    final_species = pes._final_species()
+    assert final_species is not None and final_species is not prod
+    assert np.isclose(final_species.get_distance(1, 2),
+                      prod.get_distance(1, 2))
+    assert pes._seed_species(4, final_species=final_species).n_atoms == 3
+
+    # Chains starting part way along the surface start with the scanned
+    # distance set
+    seed = pes._seed_species(2)
+    assert np.isclose(seed.get_distance(1, 2), pes.rs[2][0])
+    assert seed.energy is None
+
+    # and with a product, from the geometry interpolated towards it
+    seed = pes._seed_species(2, final_species=final_species)
+    assert np.isclose(seed.get_distance(1, 2), pes.rs[2][0])
+    assert seed.energy is None
+
+
+def test_1d_pes_seed_fragment():
+
+    # Scanning the C-H distance in CH4 + H moves the whole CH4 fragment
+    ch4_h = Molecule(name='ch4_h', atoms=[Atom('C'),
+                                          Atom('H', x=1.09),
+                                          Atom('H', x=-0.36, y=1.03),
+                                          Atom('H', x=-0.36, y=-0.51, z=0.89),
+                                          Atom('H', x=-0.36, y=-0.51, z=-0.89),
+                                          Atom('H', x=3.0)])
+
+    pes = PES1d(reactant=ch4_h, product=ch4_h, rs=np.linspace(3.0, 1.5, 4),
+                r_idxs=(5, 0))
+
+    seed = pes._seed_species(2)
+    assert np.isclose(seed.get_distance(0, 5), pes.rs[2][0])
+    assert np.isclose(seed.get_distance(0, 1), ch4_h.get_distance(0, 1))
@@ -1,6 +1,8 @@
 from autode import atoms
-from autode.atoms import Atom
+from autode.atoms import Atom, Atoms
+from copy import deepcopy
 import numpy as np
+import pickle
 
 
 def test_atoms():
@@ -41,3 +43,43 @@ def test_atom():
 
     # Ensure that the atoms has a string representation
     assert len(str(h)) > 0
+
+
+def test_atoms_list():
+
+    h2 = Atoms([Atom('H'), Atom('H', z=1.0)])
+    assert h2.coordinates.shape == (2, 3)
+
+    # Coordinates of the atoms are views into the array
+    h2.translate(vec=np.array([1.0, 0.0, 0.0]))
+    assert np.allclose(h2[1].coord, np.array([1.0, 0.0, 1.0]))
+
+    h2[1].coord = np.array([0.0, 0.0, 2.0])
+    assert np.allclose(h2.coordinates[1], np.array([0.0, 0.0, 2.0]))
+
+    h2.rotate(axis=np.array([1.0, 0.0, 0.0]), theta=np.pi,
+              origin=h2[0].coord)
+    assert np.allclose(h2.coordinates, np.array([[1.0, 0.0, 0.0],
+                                                 [0.0, 0.0, -2.0]]))
+
+    # Adding and removing atoms rebuilds the array
+    h2.append(Atom('H', x=5.0))
+    removed_atom = h2.pop(0)
+    assert h2.coordinates.shape == (2, 3)
+    assert np.allclose(h2.coordinates[1], np.array([5.0, 0.0, 0.0]))
+
+    removed_atom.translate(vec=np.array([1.0, 0.0, 0.0]))
+    assert np.allclose(removed_atom.coord, np.array([2.0, 0.0, 0.0]))
+    assert np.allclose(h2.coordinates[0], np.array([0.0, 0.0, -2.0]))
+
+    # An atom in more than one list has a single coordinate
+    other = Atoms(h2[:1])
+    other.translate(vec=np.array([0.0, 1.0, 0.0]))
+    assert np.allclose(h2.coordinates[0], np.array([0.0, 1.0, -2.0]))
+
+    # Copies don't share coordinates
+    for copied in (deepcopy(h2), pickle.loads(pickle.dumps(h2))):
+        assert isinstance(copied, Atoms)
+        copied.translate(vec=np.array([1.0, 0.0, 0.0]))
+        assert np.allclose(h2.coordinates[0], np.array([0.0, 1.0, -2.0]))
+        assert np.allclose(copied[0].coord, np.array([1.0, 1.0, -2.0]))
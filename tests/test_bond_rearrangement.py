@@ -204,3 +204,52 @@ def test_2b2f():
     reac = Molecule(atoms=[Atom('H', 0, 0, 0), Atom('C', 0.6, 0, 0), Atom('N', 1.2, 0, 0), Atom('C', 10, 0, 0)])
     prod = Molecule(atoms=[Atom('H', 0, 0, 0), Atom('C', 10, 0, 0), Atom('N', 1.2, 0, 0), Atom('C', 0.6, 0, 0)])
     assert br.get_fbonds_bbonds_2b2f(reac, prod, [], [], [], [[[(0, 1)], [(0, 3)]], [[(1, 2)], [(2, 3)]]], [], []) == [br.BondRearrangement(forming_bonds=[(0, 3), (2, 3)], breaking_bonds=[(0, 1), (1, 2)])]
+
+
+def test_rearrangement_filter():
+    # H2 + H -> H + H2
+    reac = Molecule(atoms=[Atom('H', 0, 0, 0), Atom('H', 0.6, 0, 0), Atom('H', 10, 0, 0)])
+    prod = Molecule(atoms=[Atom('H', 0, 0, 0), Atom('H', 10, 0, 0), Atom('H', 10.6, 0, 0)])
+
+    rearrangement_filter = br.RearrangementFilter(reac, prod)
+
+    # H atoms bonded to another H can't form another bond without breaking
+    assert rearrangement_filter.saturated_atoms == {0, 1}
+    assert not rearrangement_filter.could_form_product([(0, 2)], [])
+    assert rearrangement_filter.could_form_product([(1, 2)], [(0, 1)])
+
+    # Breaking a bond changes the degree sequence, so can't form the product
+    assert not rearrangement_filter.could_form_product([], [(0, 1)])
+
+    # Forming bonds between atoms of the same element never includes the
+    # same atom twice
+    fbonds = br.get_fbonds(reac.graph, key='HH')
+    assert all(i != j for (i, j) in fbonds)
+    assert len(fbonds) == 2
+
+
+def test_equivalent_bond_rearrangs():
+    h = Molecule(name='h_dot', smiles='[H]')
+    methane = Molecule(name='methane', smiles='C')
+    reac = ReactantComplex(h, methane)
+
+    # H atom abstraction of any of the four H atoms in methane, along with a
+    # H atom addition to carbon forming CH5
+    abstractions = [BondRearrangement(forming_bonds=[(0, i)],
+                                      breaking_bonds=[(1, i)])
+                    for i in range(2, 6)]
+    substitution = BondRearrangement(forming_bonds=[(0, 1)],
+                                     breaking_bonds=[(1, 2)])
+
+    groups = br.get_equivalent_bond_rearrangs(reac, abstractions + [substitution])
+    assert len(groups) == 2
+    assert groups[0] == abstractions
+    assert groups[1] == [substitution]
+
+    active_graph = br.get_rearranged_active_graph(reac.graph, substitution)
+    assert active_graph.edges[0, 1]['active'] == 'forming'
+    assert active_graph.edges[1, 2]['active'] == 'breaking'
+
+    # and the reactant graph is not modified
+    assert not reac.graph.has_edge(0, 1)
+    assert not reac.graph.edges[1, 2]['active']
@@ -0,0 +1,81 @@
+from autode.calculation import Calculation
+from autode.calculation_cache import get_key
+from autode.wrappers.XTB import XTB
+from autode.species.molecule import Molecule
+from autode.config import Config
+from . import testutils
+import numpy as np
+import os
+here = os.path.dirname(os.path.abspath(__file__))
+
+method = XTB()
+method.available = True
+
+
+def test_cache_key():
+
+    h2 = Molecule(name='h2', smiles='[H][H]')
+    calc = Calculation(name='h2', molecule=h2, method=method,
+                       keywords=method.keywords.sp)
+
+    # Key should not depend on the name of the calculation
+    other_calc = Calculation(name='tmp', molecule=h2, method=method,
+                             keywords=method.keywords.sp)
+    assert get_key(calc) == get_key(other_calc)
+
+    # but does on the type of calculation
+    opt_calc = Calculation(name='h2', molecule=h2, method=method,
+                           keywords=method.keywords.opt)
+    assert get_key(calc) != get_key(opt_calc)
+
+    # and on constraints
+    const_calc = Calculation(name='h2', molecule=h2, method=method,
+                             keywords=method.keywords.sp,
+                             distance_constraints={(0, 1): 0.7})
+    assert get_key(calc) != get_key(const_calc)
+
+    # Very small changes in the coordinates are rounded off
+    h2.atoms[0].translate(vec=np.array([1E-8, 0.0, 0.0]))
+    shifted_calc = Calculation(name='h2', molecule=h2, method=method,
+                               keywords=method.keywords.sp)
+    assert get_key(calc) == get_key(shifted_calc)
+
+    h2.atoms[0].translate(vec=np.array([0.1, 0.0, 0.0]))
+    shifted_calc = Calculation(name='h2', molecule=h2, method=method,
+                               keywords=method.keywords.sp)
+    assert get_key(calc) != get_key(shifted_calc)
+
+
+@testutils.work_in_zipped_dir(os.path.join(here, 'data', 'xtb.zip'))
+def test_cached_calculation():
+
+    Config.calculation_cache_dir = os.path.join(os.getcwd(), 'cache')
+    keyword_prefixes = Config.keyword_prefixes
+    Config.keyword_prefixes = False
+
+    test_mol = Molecule(name='test_mol',
+                        smiles='O=C(C=C1)[C@@](C2NC3C=C2)([H])[C@@]3([H])C1=O')
+    calc = Calculation(name='opt', molecule=test_mol, method=method,
+                       keywords=method.keywords.opt)
+    calc.run()
+    assert calc.cached_results is None
+    assert os.path.exists('cache')
+
+    # Remove the output so the results can only come from the cache
+    os.remove('opt_xtb.out')
+
+    cached_calc = Calculation(name='other_opt', molecule=test_mol,
+                              method=method, keywords=method.keywords.opt)
+    cached_calc.run()
+
+    assert cached_calc.cached_results is not None
+    assert cached_calc.output.filename is None
+    assert not os.path.exists('other_opt_xtb.xyz')
+
+    assert cached_calc.terminated_normally()
+    assert cached_calc.get_energy() == -36.990267613593
+    assert len(cached_calc.get_final_atoms()) == 22
+    assert len(cached_calc.get_atomic_charges()) == 22
+
+    Config.calculation_cache_dir = None
+    Config.keyword_prefixes = keyword_prefixes
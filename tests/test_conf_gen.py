@@ -1,5 +1,6 @@
 from autode.atoms import Atom
 from autode.conformers import conf_gen
+from autode.conformers.rr_ff import RRForceField
 from autode.species.molecule import Molecule
 from autode.species.molecule import Reactant, Product
 from autode.species.complex import ReactantComplex, ProductComplex
@@ -244,3 +245,99 @@ def test_potential():
 
     expected_v = 0.7 * (bond_length - eq_bond_length)**2 + 0.3 / bond_length**8
     assert np.abs(v - expected_v) < 1E-6
+
+
+def test_rr_force_field():
+    from cconf_gen import v, dvdr
+
+    rand = np.random.RandomState(0)
+    n_atoms = 60
+    coords = rand.uniform(-6, 6, size=(n_atoms, 3))
+    bonds = [(i, i + 1) for i in range(n_atoms - 1)]
+    fixed_bonds = [(0, 2)]
+
+    d0 = np.zeros((n_atoms, n_atoms))
+    for i, j in bonds + fixed_bonds:
+        d0[i, j] = d0[j, i] = 1.5
+
+    bond_matrix = conf_gen.get_bond_matrix(n_atoms, bonds, fixed_bonds)
+    ff_args = dict(bonds=bonds, fixed_bonds=fixed_bonds, d0=d0, k=1.0, c=0.01)
+    v_args = (bond_matrix, 1.0, d0, 0.01)
+
+    # Without a cutoff the energy and gradient should be the same as the
+    # Cython implementation
+    for exponent in (2, 8):
+        ff = RRForceField(n_atoms, exponent=exponent, **ff_args)
+        energy, grad = ff.energy_and_gradient(coords.flatten())
+
+        assert np.isclose(energy, v(coords.flatten(), *v_args, exponent))
+        assert np.allclose(grad, dvdr(coords.flatten(), *v_args, exponent))
+
+    # and with a cutoff the repulsion beyond is negligible
+    ff = RRForceField(n_atoms, exponent=8, cutoff=4.0, **ff_args)
+    energy, grad = ff.energy_and_gradient(coords.flatten())
+
+    assert np.isclose(energy, v(coords.flatten(), *v_args, 8), atol=1E-4)
+    assert np.allclose(grad, dvdr(coords.flatten(), *v_args, 8), atol=1E-4)
+
+    # Minimising should lower the energy and give bond lengths close to d0
+    opt_coords = ff.minimise(coords, tol=1E-5)
+    assert ff.energy(opt_coords) < energy
+    assert np.isclose(np.linalg.norm(opt_coords[0] - opt_coords[1]), 1.5,
+                      atol=0.1)
+
+
+def test_rr_force_field_batch():
+
+    rand = np.random.RandomState(0)
+    n_atoms = 10
+    coords = rand.uniform(-3, 3, size=(4, n_atoms, 3))
+    bonds = [(i, i + 1) for i in range(n_atoms - 1)]
+
+    d0 = np.zeros((n_atoms, n_atoms))
+    for i, j in bonds:
+        d0[i, j] = d0[j, i] = 1.5
+
+    for cutoff in (None, 4.0):
+        ff = RRForceField(n_atoms, bonds=bonds, fixed_bonds=[(0, 2)], d0=d0,
+                          k=1.0, c=0.01, cutoff=cutoff)
+
+        # Energies and gradients of a batch are the same as evaluating each
+        # structure individually
+        energies, grads = ff.energies_and_gradients(coords)
+        for n in range(len(coords)):
+            energy, grad = ff.energy_and_gradient(coords[n].flatten())
+
+            assert np.isclose(energies[n], energy)
+            assert np.allclose(grads[n].flatten(), grad)
+
+    opt_coords = ff.minimise_batch(coords, tol=1E-5)
+    assert opt_coords.shape == coords.shape
+
+    opt_energies, opt_grads = ff.energies_and_gradients(opt_coords)
+    assert np.all(opt_energies < energies)
+
+    # Every structure is converged, not just the total energy
+    assert np.all(np.max(np.abs(opt_grads), axis=(1, 2)) < 1E-5)
+
+
+def test_conf_gen_batch(tmpdir):
+    os.chdir(tmpdir)
+
+    atoms_list = conf_gen.get_simanl_atoms_batch(butane, conf_ns=[0, 1, 2])
+    assert len(atoms_list) == 3
+
+    for n, atoms in enumerate(atoms_list):
+        assert len(atoms) == 14
+        assert are_coords_reasonable(np.array([atom.coord for atom in atoms]))
+        assert os.path.exists(f'butane_conf{n}_siman.xyz')
+
+    # Previously generated conformers are read from the .xyz files
+    atoms_list = conf_gen.get_simanl_atoms_batch(butane, conf_ns=[2, 3])
+    assert np.allclose(atoms_list[0][0].coord, atoms[0].coord, atol=1E-4)
+
+    atoms_list = conf_gen.get_simanl_atoms_list(butane, n_confs=5)
+    assert len(atoms_list) == 5
+    assert os.path.exists('butane_conf4_siman.xyz')
+
+    os.chdir(here)
@@ -10,8 +10,11 @@ from rdkit import Chem
 from rdkit.Chem import AllChem
 from autode.conformers.conformers import atoms_from_rdkit_mol
 from autode.conformers.conformers import conf_is_unique_rmsd
+from autode.conformers.conformers import ConformerDeduplicator
 from autode.conformers.conformers import get_unique_confs
+from autode.conformers.conformers import run_conformer_calcs
 from autode.constants import Constants
+from autode.geom import calc_heavy_atom_rmsd
 from . import testutils
 import numpy as np
 import pytest
@@ -53,6 +56,29 @@ def test_conf_class():
     assert h2_conf_broken.n_atoms == 0
 
 
+@testutils.work_in_zipped_dir(os.path.join(here, 'data', 'conformers.zip'))
+def test_parallel_conf_calcs():
+
+    n_cores = Config.n_cores
+    Config.n_cores = 2
+
+    confs = [Conformer(name=name, charge=0, mult=1,
+                       atoms=[Atom('H', 0.0, 0.0, 0.0),
+                              Atom('H', 0.0, 0.0, 0.7)])
+             for name in ('h2_conf', 'h2_conf_broken')]
+
+    run_conformer_calcs(confs, method=orca)
+
+    # Results should be set in the same order as the conformers
+    assert confs[0].energy == -1.160780546661
+    assert confs[0].n_atoms == 2
+
+    assert confs[1].atoms is None
+    assert confs[1].n_atoms == 0
+
+    Config.n_cores = n_cores
+
+
 def test_rdkit_atoms():
 
     mol = Chem.MolFromSmiles('C')
@@ -131,6 +157,42 @@ def test_rmsd_confs():
                                    rmsd_tol=0.1)
 
 
+def test_conformer_deduplicator():
+
+    rand = np.random.RandomState(0)
+    coords = rand.uniform(-3, 3, size=(12, 3))
+    labels = 8 * ['C'] + 4 * ['H']
+
+    def conformer(conf_coords):
+        return Conformer(atoms=[Atom(label, *coord) for label, coord
+                                in zip(labels, conf_coords)])
+
+    confs = [conformer(coords + rand.normal(scale=scale, size=(12, 3)))
+             for scale in np.linspace(0.05, 0.5, num=30)]
+
+    # Mirror image has non-zero RMSD, as reflection is not allowed
+    confs.append(conformer(coords * np.array([1, 1, -1])))
+
+    deduplicator = ConformerDeduplicator(rmsd_tol=0.3)
+    unique_confs = [conf for conf in confs if deduplicator.add(conf)]
+    assert deduplicator.n_unique == len(unique_confs) > 1
+
+    # Should be the same as comparing to every other conformer
+    unique_confs_rmsd = []
+    for conf in confs:
+        if conf_is_unique_rmsd(conf, unique_confs_rmsd, rmsd_tol=0.3):
+            unique_confs_rmsd.append(conf)
+
+    assert unique_confs == unique_confs_rmsd
+    assert calc_heavy_atom_rmsd(confs[0].atoms, confs[-1].atoms) > 0.3
+
+    # A rotated and translated structure is not unique
+    rot_mat = np.linalg.qr(rand.normal(size=(3, 3)))[0]
+    rot_mat *= np.sign(np.linalg.det(rot_mat))
+    rotated = conformer(np.matmul(confs[0].get_coordinates(), rot_mat) + 1.0)
+    assert not deduplicator.is_unique(rotated)
+
+
 @testutils.work_in_zipped_dir(os.path.join(here, 'data', 'sp_conformers.zip'))
 def test_sp_hmethod_ranking():
 
@@ -4,9 +4,11 @@ from autode.exceptions import NoMolecularGraph, NoMapping
 from autode.species.species import Species
 from autode.species.molecule import Molecule
 from autode.atoms import Atom
+from autode.bond_lengths import get_avg_bond_length
 from autode.conformers import Conformer
 from autode.input_output import xyz_file_to_atoms
 from . import testutils
+from concurrent.futures import ThreadPoolExecutor
 import networkx as nx
 import numpy as np
 import pytest
@@ -45,6 +47,32 @@ def test_edge_cases():
     assert h3.graph.number_of_nodes() == 3
 
 
+def test_bonded_pairs():
+
+    # Pairs should be ordered by atom type (H first) then distance
+    ch3 = Species(name='CH3', charge=0, mult=2,
+                  atoms=[Atom('C'), Atom('H', z=1.1), Atom('H', z=-1.0),
+                         Atom('H', x=5.0)])
+    assert mol_graphs.get_bonded_pairs(ch3) == [(1, 0), (2, 0), (0, 2), (0, 1)]
+
+    no_bonds = Species(name='H2', charge=0, mult=1,
+                       atoms=[Atom('H'), Atom('H', z=5.0)])
+    assert mol_graphs.get_bonded_pairs(no_bonds) == []
+
+    # A large random system should give the same bonds as a distance matrix
+    coords = np.random.uniform(0.0, 20.0, size=(500, 3))
+    water_box = Species(name='tmp', charge=0, mult=1,
+                        atoms=[Atom('O' if i % 3 == 0 else 'H', *coord)
+                               for i, coord in enumerate(coords)])
+
+    dists = np.linalg.norm(coords[:, None] - coords[None, :], axis=2)
+    max_lengths = np.array([[1.25 * get_avg_bond_length(a.label, b.label)
+                             for b in water_box.atoms]
+                            for a in water_box.atoms])
+    n_pairs = np.sum(dists <= max_lengths) - 500
+    assert len(mol_graphs.get_bonded_pairs(water_box)) == n_pairs
+
+
 def test_remove_bonds():
 
     b3h6 = Species(name='diborane', charge=0, mult=1,
@@ -157,6 +185,39 @@ def test_not_isomorphic2():
     assert mol_graphs.is_isomorphic(h2.graph, ch.graph) is False
 
 
+def test_stereocentres():
+
+    # Number of C, H and O atoms in the groups bonded to C1
+    butan2ol = Molecule(smiles='CC(O)CC')
+    invariants = mol_graphs.get_substituent_invariants(butan2ol.graph)
+    assert invariants[(1, 0)] == (1, 3, 0)
+    assert invariants[(1, 3)] == (2, 5, 0)
+
+    assert mol_graphs.is_chiral_atom(butan2ol, atom_index=1)
+    assert not mol_graphs.is_chiral_atom(butan2ol, atom_index=3)
+
+    mol_graphs.make_graph(butan2ol)
+    assert butan2ol.graph.nodes[1]['stereo']
+    assert sum(stereo for _, stereo in butan2ol.graph.nodes(data='stereo')) == 1
+
+    # Groups with the same composition are checked for an isomorphism
+    assert mol_graphs.is_chiral_atom(Molecule(smiles='CCCC(O)C(C)C'),
+                                     atom_index=3)
+    assert not mol_graphs.is_chiral_atom(Molecule(smiles='CCCC(O)CCC'),
+                                         atom_index=3)
+
+    # and bonds in rings do not split the graph
+    cyclohexanol = Molecule(smiles='OC1CCCCC1')
+    invariants = mol_graphs.get_substituent_invariants(cyclohexanol.graph)
+    assert invariants[(1, 2)] == invariants[(1, 6)] == (6, 12, 1)
+    assert not mol_graphs.is_chiral_atom(cyclohexanol, atom_index=1)
+
+    but2ene = Molecule(smiles='C/C=C/C')
+    assert mol_graphs.is_chiral_pi_bond(but2ene, bond=(1, 2))
+    assert not mol_graphs.is_chiral_pi_bond(Molecule(smiles='CC=C(C)C'),
+                                            bond=(1, 2))
+
+
 def test_find_cycles():
 
     assert mol_graphs.find_cycles(g) == [[1, 2, 0]]
@@ -249,6 +310,33 @@ def test_isomorphic_no_active():
                                     ignore_active_bonds=True)
 
 
+def test_graph_hash():
+
+    butane = Molecule(smiles='CCCC')
+    graph = butane.graph.copy()
+
+    # Isomorphic graphs with different node orders have the same hash
+    mapping = dict(zip(graph.nodes, np.random.permutation(graph.nodes)))
+    permuted_graph = nx.relabel_nodes(graph, mapping=mapping, copy=True)
+    assert (mol_graphs.get_graph_hash(graph)
+            == mol_graphs.get_graph_hash(permuted_graph))
+
+    # Isobutane has the same atoms and number of bonds but is not isomorphic
+    isobutane = Molecule(smiles='CC(C)C')
+    assert (mol_graphs.get_graph_hash(graph)
+            != mol_graphs.get_graph_hash(isobutane.graph))
+    assert not mol_graphs.is_isomorphic(graph, isobutane.graph)
+
+    # Modifying a graph invalidates the cached hash
+    graph_hash = mol_graphs.get_graph_hash(graph)
+    graph.edges[0, 1]['active'] = True
+    assert mol_graphs.get_graph_hash(graph) != graph_hash
+    assert not mol_graphs.is_isomorphic(graph, permuted_graph)
+
+    permuted_graph.edges[mapping[0], mapping[1]]['active'] = True
+    assert mol_graphs.is_isomorphic(graph, permuted_graph)
+
+
 def test_timeout():
 
     # Generate a large-ish graph
@@ -272,6 +360,22 @@ def test_timeout():
     assert not mol_graphs.is_isomorphic(graph, isomorphic_graph, timeout=1)
 
 
+def test_timeout_in_thread():
+
+    # Signal based timeouts can only be used in the main thread
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(mol_graphs.is_isomorphic, h2.graph,
+                                   h2.graph.copy(), timeout=1)
+                   for _ in range(4)]
+
+        assert all(future.result() for future in futures)
+
+    # An expired deadline raises an exception during matching
+    gm = mol_graphs.DeadlineGraphMatcher(h2.graph, h2.graph, timeout=-1)
+    with pytest.raises(TimeoutError):
+        gm.is_isomorphic()
+
+
 def test_species_conformers_isomorphic():
     h2_a = Molecule(name='H2', atoms=[Atom('H'), Atom('H', x=0.7)])
 
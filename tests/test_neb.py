@@ -1,4 +1,7 @@
 from autode.neb import neb
+from autode.neb.original import NEB, ImageExecutor, total_energy
+from autode.neb.original import Images, get_forces
+from autode.neb.ci import CINEB, FIRE
 from autode.species.molecule import Molecule, Species
 from autode.species.molecule import Reactant, Product
 from autode.atoms import Atom
@@ -6,6 +9,8 @@ from autode.pes.pes import BreakingBond, FormingBond
 from autode.input_output import xyz_file_to_atoms
 from autode.methods import XTB
 from . import testutils
+import numpy as np
+import pytest
 import shutil
 import os
 
@@ -57,6 +62,57 @@ def test_contains_peak():
     assert not neb.contains_peak(species_list)
 
 
+def test_intervals_to_refine():
+
+    species_list = []
+    for i, energy in enumerate([0.0, 0.001, 0.02, 0.021, 0.0]):
+        h = Species(name='h', charge=0, mult=2, atoms=[Atom('H', x=0.1 * i)])
+        h.energy = energy
+        species_list.append(h)
+
+    # Largest energy change is between the last two species, then the
+    # second and third, all the others are small
+    assert neb.get_intervals_to_refine(species_list, max_de=0.005) == [3, 1]
+
+    # A large change in geometry also needs refining
+    species_list[1].set_coordinates(np.array([[1.0, 0.0, 0.0]]))
+    assert 0 in neb.get_intervals_to_refine(species_list, max_de=0.005,
+                                            max_dx=0.5)
+
+    for species in species_list:
+        species.energy = 0.0
+        species.set_coordinates(np.zeros(shape=(1, 3)))
+
+    assert len(neb.get_intervals_to_refine(species_list)) == 0
+
+
+def test_seed_species():
+
+    # H2 + OH -> H + H2O, with the H2 bond breaking and the O-H forming
+    complex = Molecule(name='complex', atoms=[Atom('H', x=-0.7),
+                                              Atom('H'),
+                                              Atom('O', x=2.0),
+                                              Atom('H', x=2.0, y=1.0)])
+    complex.graph.remove_edges_from(list(complex.graph.edges))
+    complex.graph.add_edges_from([(0, 1), (2, 3)])
+
+    bbond = BreakingBond(atom_indexes=(1, 0), species=complex)
+    bbond.final_dist = 1.7
+    fbond = FormingBond(atom_indexes=(1, 2), species=complex)
+    fbond.final_dist = 1.0
+
+    seed = neb.get_seed_species(complex, bonds=[bbond, fbond], s=0.5)
+
+    assert np.isclose(seed.get_distance(0, 1), 1.2)
+    assert np.isclose(seed.get_distance(1, 2), 1.5)
+
+    # The OH moves as a fragment
+    assert np.isclose(seed.get_distance(2, 3), 1.0)
+
+    # and the species it was seeded from doesn't move
+    assert np.isclose(complex.get_distance(1, 2), 2.0)
+
+
 @testutils.work_in_zipped_dir(os.path.join(here, 'data', 'neb.zip'))
 def test_full_calc_with_xtb():
 
@@ -118,3 +174,173 @@ def test_get_ts_guess_neb():
 
     if os.path.exists('neb.xyz'):
         os.remove('neb.xyz')
+
+
+def harmonic_energy_gradient(image, method, n_cores):
+    """Energy and gradient of a harmonic potential centered at the origin"""
+    coords = image.species.get_coordinates()
+
+    if method == 'fail':
+        raise ValueError
+
+    image.energy = float(np.sum(coords**2)) + n_cores
+    image.grad = 2.0 * coords.flatten()
+    return image
+
+
+def exit_energy_gradient(image, method, n_cores):
+    """Stop the worker process, without raising an exception"""
+    os._exit(1)
+
+
+def test_image_executor_stopped_worker():
+
+    images = Images(num=3)
+    for image in images:
+        image.species = Species('tmp', [Atom('H')], 0, 2)
+
+    # A worker that stops raises an exception, and the executor can still
+    # be shut down
+    with pytest.raises(RuntimeError):
+        with ImageExecutor(images, method=None, n_cores=1,
+                           func=exit_energy_gradient) as executor:
+            executor.evaluate(images)
+
+
+def test_image_executor():
+
+    h2 = Species(name='h2', charge=0, mult=1, atoms=[Atom('H'), Atom('H', x=0.7)])
+    h2_final = Species(name='h2', charge=0, mult=1,
+                       atoms=[Atom('H'), Atom('H', x=2.7)])
+
+    h2_neb = NEB(initial_species=h2, final_species=h2_final, num=5)
+    h2_neb.interpolate_geometries()
+    os.remove('neb.xyz')
+
+    images = h2_neb.images
+    for idx in (0, -1):
+        harmonic_energy_gradient(images[idx], method=None, n_cores=1)
+
+    with ImageExecutor(images, method=None, n_cores=2,
+                       func=harmonic_energy_gradient) as executor:
+
+        coords = images.coords()
+        coords[-9:-6] += 1.0
+        total_energy(coords, images, executor)
+
+        for image in images[1:-1]:
+            coords = image.species.get_coordinates()
+
+            # Workers only have the coordinates sent to them, and use one
+            # of the two cores each
+            assert np.isclose(image.energy, np.sum(coords**2) + 1)
+            assert np.allclose(image.grad, 2.0 * coords.flatten())
+            assert image.iteration == 1
+
+    with ImageExecutor(images, method='fail', n_cores=1,
+                       func=harmonic_energy_gradient) as executor:
+
+        with pytest.raises(ValueError):
+            executor.evaluate(images)
+
+
+def curved_path_energy_gradient(image, method, n_cores):
+    """2D potential with minima at (±1, 0) and a saddle point at (0, -0.3)"""
+    x, y, _ = image.species.get_coordinates()[0]
+    u = y - 0.3 * (x**2 - 1)
+
+    image.energy = 0.05 * ((x**2 - 1)**2 + 2 * u**2)
+    image.grad = 0.05 * np.array([4 * x * (x**2 - 1) - 2.4 * x * u,
+                                  4 * u,
+                                  0.0])
+    return image
+
+
+def test_cineb():
+
+    cineb = CINEB(initial_species=Species('init', [Atom('H', x=-1)], 0, 2),
+                  final_species=Species('final', [Atom('H', x=1)], 0, 2),
+                  num=7)
+    cineb.interpolate_geometries()
+    os.remove('neb.xyz')
+
+    for idx in (0, -1):
+        curved_path_energy_gradient(cineb.images[idx], method=None, n_cores=1)
+        cineb.images[idx].grad = np.zeros(3)
+
+    with ImageExecutor(cineb.images, method=None, n_cores=2,
+                       func=curved_path_energy_gradient) as executor:
+        cineb.optimise(executor, max_n_iterations=50, force_tol=0.005)
+
+    # Climbing image should be close to the saddle point
+    saddle_species = next(cineb.get_species_saddle_point())
+    assert np.allclose(saddle_species.get_coordinates()[0],
+                       np.array([0.0, -0.3, 0.0]), atol=0.05)
+
+    # Springs are stiffer closer to the highest energy image
+    ks = cineb.spring_constants()
+    assert ks[0] < ks[2] and ks[-1] < ks[3]
+    assert np.isclose(max(ks), cineb.k_max, atol=1E-3)
+
+
+def test_fire():
+
+    fire = FIRE(max_step=0.1)
+    dt = fire.dt
+
+    # Steps are downhill but no larger than the maximum
+    step = fire.step(forces=np.array([1.0, 0.0]))
+    assert step[0] > 0 and np.isclose(step[1], 0.0)
+    assert np.max(np.abs(step)) <= 0.1
+
+    # Starting from rest has zero power, which isn't uphill
+    assert fire.dt == dt
+    assert fire.n_positive == 1
+
+    # nor are zero forces
+    fire.step(forces=np.zeros(2))
+    assert fire.dt == dt
+    assert fire.n_positive == 2
+
+    # and going uphill stops the velocity and reduces the time step
+    dt = fire.dt
+    fire.step(forces=np.array([-1.0, 0.0]))
+    assert fire.dt < dt
+
+
+def test_band_coordinates_forces():
+
+    images = Images(num=3)
+    for i, image in enumerate(images):
+        image.species = Species('tmp', [Atom('H', x=float(i))], 0, 2)
+        image.grad = np.array([1.0, 1.0, 0.0])
+
+    images[0].energy, images[1].energy, images[2].energy = 0.0, 1.0, 2.0
+
+    # Species coordinates are views into the band coordinates
+    coords = images.coordinates
+    assert coords.shape == (3, 3)
+
+    images[1].species.set_coordinates(np.array([[0.5, 0.0, 0.0]]))
+    assert np.allclose(coords[1], np.array([0.5, 0.0, 0.0]))
+
+    images.set_coords(np.arange(9, dtype=float))
+    assert np.allclose(images[2].species.get_coordinates(),
+                       np.array([[6.0, 7.0, 8.0]]))
+
+    images.set_coords(np.array([0.0, 0, 0, 0.5, 0, 0, 2.0, 0, 0]))
+    forces = get_forces(images.coordinates, images.energies(),
+                        images.grads(), k=0.1)
+    assert forces.shape == (3, 3)
+
+    # End points have no forces on them
+    assert np.allclose(forces[[0, 2]], 0.0)
+
+    # Tangent is along x, so the spring force is 0.1 * (1.5 - 0.5) along x
+    # and only the perpendicular gradient in y contributes
+    assert np.allclose(forces[1], np.array([0.1, -1.0, 0.0]))
+
+    # Climbing image has the parallel gradient inverted and no spring
+    forces = get_forces(images.coordinates, images.energies(),
+                        images.grads(), k=0.1, climbing_idx=1)
+    assert np.allclose(forces[1], np.array([1.0, -1.0, 0.0]))
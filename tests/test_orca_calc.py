@@ -246,6 +246,96 @@ def test_mp2_numerical_gradients():
 
 
 
+@testutils.work_in_zipped_dir(os.path.join(here, 'data', 'orca.zip'))
+def test_output_sections():
+
+    calc = Calculation(name='tmp',
+                       molecule=Molecule(atoms=xyz_file_to_atoms('tmp_orca.xyz')),
+                       method=method,
+                       keywords=method.keywords.grad)
+    calc.output.filename = 'tmp_orca.out'
+    calc.output.set_lines()
+
+    # Output is read as bytes, with no lines generated until they are
+    # requested
+    assert calc.output.exists()
+    assert calc.output._file_lines is None
+
+    offsets = calc.output.section_offsets('The final MP2 gradient')
+    assert len(offsets) == 1
+    assert 'The final MP2 gradient' in calc.output.line_at(offsets[0])
+    assert calc.output.section_offsets('not a section header') == []
+
+    gradients = calc.get_gradients()
+    assert calc.output._file_lines is None
+
+    # Parsed values are memoised, and modifying them does not change the
+    # memoised result
+    gradients += 1.0
+    assert np.linalg.norm(calc.get_gradients() - gradients + 1.0) < 1e-10
+
+    # Setting new output lines discards the parsed values
+    calc.output.file_lines = open('numerical_orca.out', 'r').readlines()
+    expected = np.array([0.012397372, 0.071726232, -0.070942743]) / Constants.a02ang
+    assert np.linalg.norm(expected - calc.get_gradients()[0]) < 1e-6
+
+    # and the lines and data are consistent
+    assert calc.output.tail(n_lines=1) == calc.output.file_lines[-1:]
+    assert calc.output.contains('CARTESIAN GRADIENT (NUMERICAL)')
+
+    # Outputs of the same file are independent of the file once set, so
+    # overwriting it doesn't affect them
+    other_calc = Calculation(name='tmp',
+                             molecule=Molecule(atoms=xyz_file_to_atoms('tmp_orca.xyz')),
+                             method=method,
+                             keywords=method.keywords.grad)
+    other_calc.output.filename = 'tmp_orca.out'
+    other_calc.output.set_lines()
+    file_lines = open('tmp_orca.out', 'r').readlines()
+
+    open('tmp_orca.out', 'w').close()
+    assert other_calc.output.contains('The final MP2 gradient')
+    assert len(other_calc.output.tail(n_lines=2)) == 2
+
+    # including the lines, which are generated from the data already read
+    assert other_calc.output.file_lines == file_lines
+
+
+@testutils.work_in_zipped_dir(os.path.join(here, 'data', 'orca.zip'))
+def test_normal_modes():
+
+    calc = Calculation(name='tmp',
+                       molecule=Molecule(smiles='C=C'),
+                       method=method,
+                       keywords=method.keywords.hess)
+    calc.output.filename = 'test_ts_reopt_optts_orca.out'
+    calc.output.set_lines()
+
+    # All the modes are parsed at once, and are the same as those parsed
+    # individually
+    modes = calc.get_normal_modes()
+    assert modes.shape == (18, 6, 3)
+
+    for mode_number in (0, 6, 17):
+        mode = method.get_normal_mode_displacements(calc, mode_number)
+        assert np.allclose(modes[mode_number], mode)
+        assert np.allclose(calc.get_normal_mode_displacements(mode_number),
+                           mode)
+
+    with pytest.raises(NoNormalModesFound):
+        calc.get_normal_mode_displacements(mode_number=18)
+
+    # Modifying the output file invalidates the parsed properties
+    assert len(calc.get_imaginary_freqs()) == 1
+    with open('test_ts_reopt_optts_orca.out', 'w') as out_file:
+        print('ORCA TERMINATED NORMALLY', file=out_file)
+
+    assert calc.output.has_changed()
+    assert calc.get_imaginary_freqs() == []
+    assert calc.get_normal_modes() is None
+    assert not calc.output.has_changed()
+
+
 def test_calc_entropy():
 
     f_entropy_g09 = 0.011799 / 298.15   # TS from g09
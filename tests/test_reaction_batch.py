@@ -0,0 +1,67 @@
+from autode.reactions.batch import ReactionBatch, get_species_key
+from autode.reactions.reaction import Reaction
+from autode.species.molecule import Molecule, Reactant, Product
+from autode.atoms import Atom
+import numpy as np
+import pytest
+
+
+def test_species_key():
+
+    # Canonical SMILES are the same for the same molecule
+    assert (get_species_key(Molecule(smiles='OC'))
+            == get_species_key(Molecule(smiles='CO')))
+
+    assert (get_species_key(Molecule(smiles='[O-]C', charge=-1))
+            != get_species_key(Molecule(smiles='OC')))
+
+    assert (get_species_key(Molecule(smiles='CO', solvent_name='water'))
+            != get_species_key(Molecule(smiles='CO')))
+
+    # Molecules without a SMILES string use the graph
+    h2 = Molecule(name='h2', atoms=[Atom('H'), Atom('H', x=0.7)])
+    h2_other = Molecule(name='other', atoms=[Atom('H', x=1.0),
+                                             Atom('H', x=1.7)])
+    assert get_species_key(h2) == get_species_key(h2_other)
+
+
+def test_batch_unique_species():
+
+    sn2_cl = Reaction(smiles='C[O-].CCl>>COC.[Cl-]')
+    sn2_br = Reaction(smiles='C[O-].CCBr>>CCOC.[Br-]')
+
+    batch = ReactionBatch(sn2_cl, sn2_br)
+
+    # Reactions are calculated in their own directories
+    assert sn2_cl.name != sn2_br.name
+
+    # Methoxide is shared between the two reactions
+    assert len(batch.unique_species) == 7
+
+    methoxide = batch.unique_species[(get_species_key(sn2_br.reacs[0]),
+                                      sn2_br.temp)]
+    assert methoxide is sn2_cl.reacs[0]
+    methoxide.energy = -1.0
+
+    # Copies of calculated species keep the name and type in the reaction
+    key = (get_species_key(sn2_br.reacs[0]), sn2_br.temp)
+    calculated_mol = batch._calculated(sn2_br.reacs[0], key)
+    assert calculated_mol.energy == -1.0
+    assert calculated_mol.name == sn2_br.reacs[0].name
+    assert isinstance(calculated_mol, Reactant)
+    assert calculated_mol is not methoxide
+
+    # and have the calculated atoms, which are not shared
+    methoxide.set_coordinates(methoxide.get_coordinates() + 1.0)
+    calculated_mol = batch._calculated(sn2_br.reacs[0], key)
+    assert np.allclose(calculated_mol.get_coordinates(),
+                       methoxide.get_coordinates())
+
+    calculated_mol.set_coordinates(np.zeros((calculated_mol.n_atoms, 3)))
+    assert not np.allclose(methoxide.get_coordinates(), 0.0)
+
+    key = (get_species_key(sn2_br.prods[1]), sn2_br.temp)
+    assert isinstance(batch._calculated(sn2_br.prods[1], key), Product)
+
+    with pytest.raises(AssertionError):
+        _ = ReactionBatch(Molecule(smiles='C'))
@@ -1,6 +1,7 @@
 import os
 from autode.reactions import reaction
 from autode.reactions import reaction_types
+from autode.reactions.checkpoint import ReactionCheckpoint
 from autode.transition_states.transition_state import TransitionState
 from autode.bond_rearrangement import BondRearrangement
 from autode.species import Reactant, Product
@@ -268,3 +269,62 @@ def test_free_energy_profile():
     Config.G09.path = None
     Config.lcode = None
     Config.XTB.path = None
+
+
+def test_reaction_checkpoint():
+
+    rxn = reaction.Reaction(smiles='CC(C)=O.[C-]#N>>CC([O-])(C#N)C')
+    completed = []
+
+    def stage(name):
+        return name, lambda: completed.append(name)
+
+    stages = [stage('conformers'), stage('complexes'), stage('output')]
+
+    checkpoint = ReactionCheckpoint(rxn, filename='tmp_checkpoint.pkl')
+    assert checkpoint.remaining_stages(rxn, stages) == stages
+
+    name, func = stages[0]
+    func()
+    rxn.reacs[0].energy = -1.0
+    checkpoint.save(name, rxn)
+
+    # Restarting skips the completed stage and restores the reaction
+    restarted_rxn = reaction.Reaction(smiles='CC(C)=O.[C-]#N>>CC([O-])(C#N)C')
+    checkpoint = ReactionCheckpoint(restarted_rxn, filename='tmp_checkpoint.pkl')
+    assert checkpoint.remaining_stages(restarted_rxn, stages) == stages[1:]
+    assert restarted_rxn.reacs[0].energy == -1.0
+
+    # Stages that were not completed in the same order are not skipped
+    checkpoint = ReactionCheckpoint(rxn, filename='tmp_checkpoint.pkl')
+    assert len(checkpoint.remaining_stages(rxn, stages[1:])) == 2
+
+    # A checkpoint for a different reaction is ignored
+    other_rxn = reaction.Reaction(smiles='CC(C)=O.[C-]#N>>CC([O-])(C#N)C',
+                                  name='other')
+    checkpoint = ReactionCheckpoint(other_rxn, filename='tmp_checkpoint.pkl')
+    assert checkpoint.remaining_stages(other_rxn, stages) == stages
+
+    # as is one calculated at a different temperature
+    restarted_rxn.temp = 350.0
+    checkpoint = ReactionCheckpoint(restarted_rxn, filename='tmp_checkpoint.pkl')
+    assert checkpoint.remaining_stages(restarted_rxn, stages) == stages
+    restarted_rxn.temp = 298.15
+
+    # or with different keywords
+    opt_keywords = Config.ORCA.keywords.opt
+    Config.ORCA.keywords.opt = ['Opt', 'PBE', 'def2-SVP']
+
+    checkpoint = ReactionCheckpoint(restarted_rxn, filename='tmp_checkpoint.pkl')
+    assert checkpoint.remaining_stages(restarted_rxn, stages) == stages
+    Config.ORCA.keywords.opt = opt_keywords
+
+    # but changing the number of cores doesn't change the results
+    n_cores = Config.n_cores
+    Config.n_cores = n_cores + 1
+
+    checkpoint = ReactionCheckpoint(restarted_rxn, filename='tmp_checkpoint.pkl')
+    assert checkpoint.remaining_stages(restarted_rxn, stages) == stages[1:]
+    Config.n_cores = n_cores
+
+    os.remove('tmp_checkpoint.pkl')
@@ -0,0 +1,107 @@
+from autode.scheduler import Scheduler, get_scheduler
+from autode.calculation import Calculation
+from autode.species.molecule import Molecule
+from autode.wrappers.XTB import XTB
+from autode.wrappers.ORCA import ORCA
+from autode.config import Config
+import threading
+import pytest
+import os
+
+
+def n_cores_and_cwd():
+    return Config.n_cores, os.getcwd()
+
+
+def raise_value_error():
+    raise ValueError
+
+
+def nested_n_cores():
+    return get_scheduler().submit(n_cores_and_cwd).result()[0], Config.n_cores
+
+
+def test_scheduler():
+
+    with Scheduler(n_cores=2) as scheduler:
+        futures = [scheduler.submit(n_cores_and_cwd, n_cores=n)
+                   for n in (1, 2, 8)]
+
+        # Jobs see the number of cores they have been allocated, which can
+        # be no more than the total
+        assert [future.result()[0] for future in futures] == [1, 2, 2]
+
+        # and run in the directory they were submitted from
+        assert all(future.result()[1] == os.getcwd() for future in futures)
+
+        with pytest.raises(ValueError):
+            scheduler.submit(raise_value_error).result()
+
+    with pytest.raises(RuntimeError):
+        scheduler.submit(n_cores_and_cwd)
+
+
+def test_global_scheduler():
+
+    n_cores = Config.n_cores
+    Config.n_cores = 2
+
+    scheduler = get_scheduler()
+    assert scheduler.n_cores == 2
+    assert get_scheduler() is scheduler
+
+    # Changing the total number of cores resizes the scheduler
+    Config.n_cores = 3
+    assert get_scheduler() is scheduler
+    assert scheduler.n_cores == 3
+    assert scheduler.submit(n_cores_and_cwd, n_cores=3).result()[0] == 3
+
+    Config.n_cores = n_cores
+
+
+def test_calculation_cores():
+
+    h2 = Molecule(name='h2', smiles='[H][H]')
+    scheduler = Scheduler(n_cores=4)
+
+    # Small low-level calculations are packed onto a single core
+    xtb = XTB()
+    calc = Calculation(name='h2', molecule=h2, method=xtb,
+                       keywords=xtb.keywords.sp, n_cores=8)
+    assert scheduler.n_cores_for(calc) == 1
+
+    # while others can use up to all the cores
+    orca = ORCA()
+    calc = Calculation(name='h2', molecule=h2, method=orca,
+                       keywords=orca.keywords.sp, n_cores=8)
+    assert scheduler.n_cores_for(calc) == 4
+
+    calc.n_cores = 2
+    assert scheduler.n_cores_for(calc) == 2
+
+
+def test_nested_scheduler():
+
+    with Scheduler(n_cores=4) as scheduler:
+        futures = [scheduler.submit(nested_n_cores, n_cores=2)
+                   for _ in range(2)]
+
+        # Jobs can submit their own jobs, within the cores they have
+        assert [future.result() for future in futures] == [(1, 2), (1, 2)]
+
+
+def test_nested_scheduler_shutdown():
+
+    scheduler = Scheduler(n_cores=4)
+    futures = [scheduler.submit(nested_n_cores, n_cores=2) for _ in range(8)]
+    assert all(future.result() == (1, 2) for future in futures)
+
+    # Shutting down waits for every worker to exit, which they can only do
+    # once the workers started by the nested schedulers have exited
+    processes = list(scheduler._executor._processes.values())
+
+    thread = threading.Thread(target=scheduler.shutdown, daemon=True)
+    thread.start()
+    thread.join(timeout=60)
+    assert not thread.is_alive()
+    assert not any(process.is_alive() for process in processes)
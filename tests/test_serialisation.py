@@ -0,0 +1,102 @@
+from autode.serialisation import dumps, loads
+from autode.serialisation import save_species, load_species
+from autode.serialisation import magic, version
+from autode.exceptions import SerialisationFailed
+from autode.species.molecule import Molecule
+from autode.atoms import Atom, Atoms
+import numpy as np
+import pytest
+import struct
+import json
+import os
+
+
+def test_serialise_species():
+
+    ethanol = Molecule(name='ethanol', smiles='CCO', solvent_name='water')
+    ethanol.energy = -154.1
+    ethanol.hessian = np.random.uniform(size=(27, 27))
+
+    h2 = Molecule(name='h2', atoms=[Atom('H'), Atom('H', x=0.7)])
+
+    save_species([ethanol, h2], 'species.ads')
+    loaded_ethanol, loaded_h2 = load_species('species.ads')
+    os.remove('species.ads')
+
+    assert loaded_ethanol.name == 'ethanol'
+    assert loaded_ethanol.solvent.name == 'water'
+    assert loaded_ethanol.energy == -154.1
+    assert loaded_ethanol.g_cont is None
+    assert np.allclose(loaded_ethanol.hessian, ethanol.hessian)
+    assert np.allclose(loaded_ethanol.atoms.coordinates,
+                       ethanol.atoms.coordinates)
+    assert [atom.label for atom in loaded_ethanol.atoms] == ['C', 'C', 'O'] + 6 * ['H']
+
+    assert (sorted(loaded_ethanol.graph.edges(data=True))
+            == sorted(ethanol.graph.edges(data=True)))
+    assert (dict(loaded_ethanol.graph.nodes(data=True))
+            == dict(ethanol.graph.nodes(data=True)))
+
+    assert loaded_h2.solvent is None
+    assert loaded_h2.n_atoms == 2
+    assert not hasattr(loaded_h2, 'hessian')
+    assert np.isclose(loaded_h2.get_distance(0, 1), 0.7)
+
+    # Atoms can be modified
+    loaded_h2.atoms[1].coord = np.array([1.0, 0.0, 0.0])
+    assert np.isclose(loaded_h2.get_distance(0, 1), 1.0)
+
+
+def test_serialise_species_no_copy():
+
+    h2 = Molecule(name='h2', atoms=[Atom('H'), Atom('H', x=0.7)])
+    data = bytearray(dumps([h2]))
+
+    loaded_h2 = loads(data)[0]
+    assert isinstance(loaded_h2.atoms, Atoms)
+
+    # Coordinates are a view into the data
+    assert np.shares_memory(loaded_h2.atoms.coordinates,
+                            np.frombuffer(data, dtype=np.uint8))
+
+
+def test_serialise_species_fail():
+
+    with pytest.raises(SerialisationFailed):
+        _ = loads(b'not a species')
+
+    with pytest.raises(SerialisationFailed):
+        _ = load_species('a_file_that_does_not_exist.ads')
+
+    # Data from a more recent version can't be loaded
+    data = bytearray(dumps([]))
+    data[6] = 255
+    with pytest.raises(SerialisationFailed):
+        _ = loads(data)
+
+    # Truncated data
+    h2 = Molecule(name='h2', atoms=[Atom('H'), Atom('H', x=0.7)])
+    data = dumps([h2])
+
+    for n_bytes in (8, len(data) - 20):
+        with pytest.raises(SerialisationFailed):
+            _ = loads(data[:-n_bytes])
+
+    # and headers without the required keys, or inconsistent arrays
+    def data_with_header(header):
+        header = json.dumps(header).encode()
+        return struct.pack('<6sHI', magic, version, len(header)) + header
+
+    entry = json.loads(data[12:12 + struct.unpack_from('<I', data, 8)[0]])['species'][0]
+    entry_no_arrays = {key: value for key, value in entry.items()
+                       if key != 'arrays'}
+    entry_wrong_shape = dict(entry, arrays={'coordinates': {'shape': [1, 3],
+                                                            'offset': 0}})
+
+    for header in ({}, [], {'species': 1}, {'species': [entry_no_arrays]},
+                   {'species': [entry_wrong_shape]}):
+        with pytest.raises(SerialisationFailed):
+            _ = loads(data_with_header(header) + bytes(64))
+
+    with pytest.raises(ValueError):
+        _ = Atoms.from_array(['H'], np.zeros(shape=(2, 3)))
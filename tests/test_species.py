@@ -92,6 +92,23 @@ def test_get_coordinates():
     assert type(coords) == np.ndarray
     assert coords.shape == (2, 3)
 
+    # Coordinates are a copy, so modifying them doesn't move the atoms
+    coords[0, 0] = 1.0
+    assert np.allclose(mol.get_coordinates()[:, 0], 0.0)
+
+    # while the view is a read only view of the atoms' coordinates
+    mol_copy = deepcopy(mol)
+    coords_view = mol_copy.get_coordinates_view()
+
+    with pytest.raises(ValueError):
+        coords_view[0, 0] = 1.0
+
+    coords = mol_copy.get_coordinates()
+    mol_copy.translate(vec=np.array([1.0, 0.0, 0.0]))
+    assert np.allclose(coords_view[:, 0], 1.0)
+    assert np.allclose(coords[:, 0], 0.0)
+    assert np.allclose(mol.get_coordinates()[:, 0], 0.0)
+
 
 def test_set_atoms():
     mol_copy = deepcopy(mol)
@@ -256,3 +273,20 @@ def test_is_linear():
 
     acetylene = Molecule(smiles='C#C')
     assert acetylene.is_linear()
+
+
+def test_species_copy_shares_graph():
+
+    methane = Molecule(smiles='C')
+    methane_copy = methane.copy()
+
+    # Molecular graphs are shared, as they are never modified in place
+    assert methane_copy.graph is methane.graph
+
+    # while the atoms are not
+    methane_copy.translate(vec=np.array([1.0, 0.0, 0.0]))
+    assert np.allclose(methane_copy.get_coordinates() - methane.get_coordinates(),
+                       np.array([1.0, 0.0, 0.0]))
+
+    methane_copy.energy = -1.0
+    assert methane.energy is None
@@ -1,4 +1,5 @@
 import os
+import json
 from . import testutils
 import pytest
 from autode.exceptions import TemplateLoadingFailed
@@ -7,6 +8,7 @@ from autode.bond_rearrangement import BondRearrangement
 from autode.species.complex import ReactantComplex, ProductComplex
 from autode.species.molecule import Reactant, Product
 from autode.atoms import Atom
+from autode.transition_states import templates as ts_templates
 from autode.transition_states.templates import get_ts_templates
 from autode.transition_states.templates import get_value_from_file
 from autode.transition_states.templates import get_values_dict_from_file
@@ -140,6 +142,80 @@ def test_ts_templates_find():
     assert len(templates) == 0
 
     os.remove('wrong_template.txt')
+    os.remove('.template_index.json')
+
+
+@testutils.work_in_zipped_dir(os.path.join(here, 'data', 'ts_guess.zip'))
+def test_ts_template_index():
+
+    ts_graph = reac_complex.graph.copy()
+    ts_graph.add_edge(0, 2, active=True)
+    ts_graph.remove_edge(1, 2)
+    ts_graph.add_edge(1, 2, active=True)
+
+    truncated_graph = get_truncated_active_mol_graph(ts_graph)
+    truncated_graph.edges[(0, 2)]['distance'] = 1.9
+    truncated_graph.edges[(1, 2)]['distance'] = 2.0
+
+    template = TStemplate(truncated_graph, species=reac_complex)
+    template.save(folder_path='lib')
+
+    assert os.path.exists(os.path.join('lib', '.template_index.json'))
+
+    matches = ts_templates.get_matching_ts_templates(reac_complex,
+                                                     truncated_graph,
+                                                     folder_path='lib')
+    assert len(matches) == 1
+
+    # Different charge, so the template does not match
+    reac_complex.charge = 0
+    assert len(ts_templates.get_matching_ts_templates(reac_complex,
+                                                      truncated_graph,
+                                                      folder_path='lib')) == 0
+    reac_complex.charge = -1
+
+    # Loading the index from the file in a new process doesn't require any
+    # templates to be parsed until they are needed
+    ts_templates._ts_template_indexes.clear()
+    index = ts_templates.get_ts_template_index('lib')
+    assert len(index.templates) == 0
+    assert len(index.get_templates()) == 1
+
+    # No temporary files are left behind by saving
+    assert os.listdir('lib').count('.template_index.json') == 1
+    assert not any(name.endswith('.tmp') for name in os.listdir('lib'))
+
+    # An index saved with different keys e.g. from a changed graph hash is
+    # rebuilt, so the template still matches
+    index_path = os.path.join('lib', '.template_index.json')
+    with open(index_path, 'r') as index_file:
+        saved_index = json.load(index_file)
+
+    assert saved_index['version'] == ts_templates.TStemplateIndex.version
+    saved_index['reference_key'] = 'a_different_key'
+    for entry in saved_index['entries'].values():
+        entry['key'] = 'a_different_key'
+
+    with open(index_path, 'w') as index_file:
+        json.dump(saved_index, index_file)
+
+    ts_templates._ts_template_indexes.clear()
+    assert len(ts_templates.get_matching_ts_templates(reac_complex,
+                                                      truncated_graph,
+                                                      folder_path='lib')) == 1
+
+    # as is one from before the index had a version
+    with open(index_path, 'w') as index_file:
+        json.dump(saved_index['entries'], index_file)
+
+    ts_templates._ts_template_indexes.clear()
+    assert len(ts_templates.get_matching_ts_templates(reac_complex,
+                                                      truncated_graph,
+                                                      folder_path='lib')) == 1
+
+    # Removing a template also removes it from the index
+    os.remove(os.path.join('lib', 'template0.txt'))
+    assert len(ts_templates.get_ts_templates(folder_path='lib')) == 0
 
 
 def test_inactive_graph():